@@ -1,4 +1,6 @@
 from .backfill_dag_components import BackfillDagModel, BackfillDagSnapshot  # noqa
+from .dag_materializer import DagMaterializer  # noqa
+from .dag_plan import DagPlan, DagPlanBuilder, TaskKind  # noqa
 from .dag_components import DagComponent, DagModel, DagSnapshot, LargeTest, MediumTests  # noqa
 from .dbt_af_builder import DbtAfGraph, DomainDagsRegistry  # noqa
 from .task_dependencies import DagDelayedDependencyRegistry, RegistryDomainDependencies  # noqa
@@ -13,6 +15,10 @@ __all__ = [
     'DagSnapshot',
     'LargeTest',
     'MediumTests',
+    'DagMaterializer',
+    'DagPlan',
+    'DagPlanBuilder',
+    'TaskKind',
     'DbtAfGraph',
     'DomainDagsRegistry',
     'DagDelayedDependencyRegistry',
@@ -1,21 +1,21 @@
 from typing import TYPE_CHECKING
 
 from dbt_af.builder.dag_components import DagModel
-from dbt_af.operators.run import DbtRun, DbtSnapshot
+from dbt_af.builder.dag_plan import TaskKind
 
 if TYPE_CHECKING:
     from dbt_af.builder.dbt_af_builder import DomainDag
-    from dbt_af.parser.dbt_node_model import DbtNode
+    from dbt_af.parser.dbt_compact_node import CompactDbtNode
 
 
 class BackfillDagModel(DagModel):
-    runner_class = DbtRun
+    runner_kind = TaskKind.DBT_RUN
     max_active_tis_per_dag = 1
     add_external_dependencies = False
     overlap = False
     is_dataset_enable = False
 
-    def __init__(self, dbt_node: 'DbtNode', domain_dag: 'DomainDag'):
+    def __init__(self, dbt_node: 'CompactDbtNode', domain_dag: 'DomainDag'):
         super().__init__(dbt_node, domain_dag)
         self.target_environment = (
             self.dbt_node.config.bf_cluster or domain_dag.config.dbt_default_targets.default_backfill_target
@@ -36,4 +36,4 @@ class BackfillDagModel(DagModel):
 
 
 class BackfillDagSnapshot(BackfillDagModel):
-    runner_class = DbtSnapshot
+    runner_kind = TaskKind.DBT_SNAPSHOT
@@ -0,0 +1,305 @@
+import datetime
+import enum
+from functools import partial
+from pathlib import Path
+from typing import Any, Iterable
+
+import pendulum
+from airflow.models.dag import DAG
+
+try:
+    import pydantic.v1 as pydantic
+except ModuleNotFoundError:
+    import pydantic
+
+from dbt_af.builder.dag_materializer import DBT_AF_OPERATORS, RUNNER_KINDS, DagMaterializer
+from dbt_af.builder.dag_plan import DagPlan, TaskKind, TaskSpec
+from dbt_af.common.scheduling import BaseScheduleTag, EScheduleTag
+from dbt_af.conf import Config
+from dbt_af.operators.sensors import AfExecutionDateFn
+
+GENERATED_MODULE_HEADER = '# Generated by dbt-af, do not edit.'
+
+
+def _schedule_tag_member(tag: BaseScheduleTag) -> str:
+    for member in EScheduleTag:
+        if member.value is type(tag):
+            return member._name_
+    raise TypeError(f'Unknown schedule tag: {tag}')
+
+
+class DagModuleGenerator:
+    """
+    Generates python module with a static airflow DAG: all task groups, tasks with their arguments and dependencies
+    are written out, so the module is parsed without manifest, node validation and building of dbt-af graph.
+    The DAG is the same as the one built by `DagMaterializer` from the same plan.
+
+    Output depends only on the plan: tasks are written in the order of their ids and dependencies are written as the
+    final set of edges of materialized DAG, so unchanged DAGs produce the same modules.
+
+    :param config: dbt-af config the plan is built with
+    :param config_ref: import path of this config in the form `module:attribute`; it's imported by generated modules
+    """
+
+    def __init__(self, config: Config, config_ref: str):
+        module_name, _, attribute = config_ref.partition(':')
+        if not module_name or not attribute:
+            raise ValueError(f'Config reference must be in the form `module:attribute`, got {config_ref!r}')
+
+        self.config = config
+        self.config_module = module_name
+        self.config_attribute = attribute
+        self._materializer = DagMaterializer(config, dag_callbacks={}, task_callbacks={})
+
+    def generate(self, plan: DagPlan) -> str:
+        return _DagModuleWriter(self, plan, self._materializer.materialize(plan)).write()
+
+
+class _DagModuleWriter:
+    def __init__(self, generator: DagModuleGenerator, plan: DagPlan, dag: DAG):
+        self.generator = generator
+        self.plan = plan
+        self.dag = dag
+
+        self._imports: dict[str, set[str]] = {}
+        self._modules: set[str] = set()
+        self._schedule_tags: dict[str, str] = {}
+
+    def _import(self, module: str, name: str) -> str:
+        self._imports.setdefault(module, set()).add(name)
+        return name
+
+    def _import_module(self, module: str) -> str:
+        self._modules.add(module)
+        return module
+
+    def _schedule_tag(self, tag: BaseScheduleTag) -> str:
+        variable = f'schedule_{tag.safe_name}'
+        if variable not in self._schedule_tags:
+            tag_class = f'{self._import("dbt_af.common.scheduling", "EScheduleTag")}.{_schedule_tag_member(tag)}'
+            if tag.timeshift is None or tag.timeshift == tag.default_timeshift:
+                self._schedule_tags[variable] = f'{tag_class}()'
+            else:
+                self._schedule_tags[variable] = f'{tag_class}(timeshift={self._literal(tag.timeshift)})'
+        return variable
+
+    def _literal(self, value: Any) -> str:
+        if isinstance(value, enum.Enum):
+            return f'{self._import(type(value).__module__, type(value).__qualname__)}.{value.name}'
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return repr(value)
+        if isinstance(value, BaseScheduleTag):
+            return self._schedule_tag(value)
+        if isinstance(value, pendulum.DateTime):
+            return (
+                f'{self._import_module("pendulum")}.datetime({value.year}, {value.month}, {value.day}, {value.hour}, '
+                f'{value.minute}, {value.second}, {value.microsecond}, tz={value.timezone_name!r})'
+            )
+        if isinstance(value, (datetime.datetime, datetime.timedelta)):
+            self._import_module('datetime')
+            return repr(value)
+        if isinstance(value, pydantic.BaseModel):
+            # values are already validated, so models are restored without validation
+            fields = ', '.join(f'{name}={self._literal(field)}' for name, field in value.__dict__.items())
+            return f'{self._import(type(value).__module__, type(value).__qualname__)}.construct({fields})'
+        if isinstance(value, dict):
+            return '{' + ', '.join(f'{self._literal(key)}: {self._literal(item)}' for key, item in value.items()) + '}'
+        if isinstance(value, list):
+            return '[' + ', '.join(self._literal(item) for item in value) + ']'
+        if isinstance(value, tuple):
+            return '(' + ''.join(f'{self._literal(item)}, ' for item in value) + ')'
+        raise TypeError(f'Value {value!r} of {self.plan.dag_id} could not be written to DAG module')
+
+    def _call(self, callee: str, args: Iterable[str]) -> str:
+        args = list(args)
+        if not args:
+            return f'{callee}()'
+        return f'{callee}(\n' + ''.join(f'    {arg},\n' for arg in args) + ')'
+
+    def _kwargs(self, params: dict[str, Any]) -> list[str]:
+        return [f'{name}={self._literal(value)}' for name, value in params.items()]
+
+    def _execution_date_fn(self, params: dict[str, Any]) -> str:
+        execution_date_fns = AfExecutionDateFn(
+            upstream_schedule_tag=params['upstream_schedule_tag'],
+            downstream_schedule_tag=params['downstream_schedule_tag'],
+            wait_policy=params['wait_policy'],
+        ).get_execution_dates()
+        fn = execution_date_fns[params['execution_date_fn_index']]
+        if fn is None:
+            return 'None'
+        if not isinstance(fn, partial):
+            raise TypeError(f'Execution date function {fn!r} of {self.plan.dag_id} could not be written to DAG module')
+
+        args = [self._import(fn.func.__module__, fn.func.__qualname__), *self._kwargs(fn.keywords)]
+        return f'{self._import("functools", "partial")}({", ".join(args)})'
+
+    def _task(self, task_spec: TaskSpec) -> str:
+        params = task_spec.params
+        task_group = f'groups[{task_spec.group_id!r}]' if task_spec.group_id is not None else 'None'
+        args = [f'task_id={task_spec.task_id!r}', f'task_group={task_group}']
+
+        if task_spec.kind in DBT_AF_OPERATORS:
+            operator = self._import(*DBT_AF_OPERATORS[task_spec.kind])
+            args += ['dag=dag', 'dbt_af_config=dbt_af_config', *self._kwargs(params)]
+            if task_spec.kind in RUNNER_KINDS:
+                args.append('**task_callbacks')
+            return self._call(operator, args)
+
+        if task_spec.kind == TaskKind.EMPTY:
+            return self._call(self._import('airflow.operators.empty', 'EmptyOperator'), [*args, 'dag=dag'])
+        if task_spec.kind == TaskKind.DBT_BRANCH:
+            decision_path_function = self._import('dbt_af.operators.branch', 'create_decision_path_function')
+            callable_args = [params['enable_from_dttm'], params['disable_from_dttm'], params['node_name']]
+            args.append(f'python_callable={decision_path_function}({", ".join(map(self._literal, callable_args))})')
+            return self._call(self._import('dbt_af.operators.branch', 'DbtBranchOperator'), [*args, 'dag=dag'])
+        if task_spec.kind == TaskKind.EXTERNAL_SENSOR:
+            args += [
+                'dbt_af_config=dbt_af_config',
+                f'external_dag_id={params["external_dag_id"]!r}',
+                f'external_task_id={params["external_task_id"]!r}',
+                f'execution_date_fn={self._execution_date_fn(params)}',
+                f'dep_schedule={self._literal(params["upstream_schedule_tag"])}',
+                'dag=dag',
+            ]
+            return self._call(self._import('dbt_af.operators.sensors', 'DbtExternalSensor'), args)
+        if task_spec.kind == TaskKind.SOURCE_FRESHNESS_SENSOR:
+            env_task = self.dag.get_task(params['env_task_id'])
+            args += [
+                'dag=dag',
+                f'env={self._literal(env_task.env if hasattr(env_task, "env") else {})}',
+                f'source_name={params["source_name"]!r}',
+                f'source_identifier={params["source_identifier"]!r}',
+                'dbt_af_config=dbt_af_config',
+            ]
+            return self._call(self._import('dbt_af.operators.sensors', 'DbtSourceFreshnessSensor'), args)
+        if task_spec.kind == TaskKind.MAINTENANCE:
+            factory = self._import('dbt_af.operators.macros', 'DbtMaintenanceOperatorFactory')
+            args = [
+                f'task_group={task_group}',
+                'af_dag=dag',
+                'dbt_af_config=dbt_af_config',
+                *self._kwargs(params),
+            ]
+            return self._call(f'{factory}.create', args)
+        if task_spec.kind == TaskKind.BACKFILL_BRANCH:
+            operator = self._import('airflow.operators.python', 'BranchPythonOperator')
+            decide_backfill_path = self._import('dbt_af.operators.branch', 'decide_backfill_path')
+            return self._call(operator, [args[0], f'python_callable={decide_backfill_path}', 'dag=dag'])
+
+        raise TypeError(f'Unknown task kind: {task_spec.kind}')
+
+    def _dag(self) -> str:
+        dag_spec = self.plan.dag
+        params = []
+        if dag_spec.params:
+            param = self._import('airflow.models.param', 'Param')
+            params.append(
+                'params={'
+                + ', '.join(f'{name!r}: {param}(**{self._literal(spec)})' for name, spec in dag_spec.params.items())
+                + '}'
+            )
+        return self._call(
+            self._import('airflow.models.dag', 'DAG'),
+            [
+                repr(dag_spec.dag_id),
+                f'start_date={self._literal(dag_spec.start_date)}',
+                f'description={dag_spec.description!r}',
+                f'schedule={dag_spec.schedule!r}',
+                f'catchup={dag_spec.catchup!r}',
+                f'default_args={self._import("dbt_af.common.constants", "DEFAULT_DAG_ARGS")}',
+                f'max_active_runs={dag_spec.max_active_runs!r}',
+                'render_template_as_native_obj=False',
+                f'tags={list(dag_spec.tags)!r}',
+                *params,
+                '**dag_callbacks',
+            ],
+        )
+
+    def _edges(self) -> list[str]:
+        lines = []
+        for task_id in sorted(self.dag.task_dict):
+            for downstream_task_id in sorted(self.dag.task_dict[task_id].downstream_task_ids):
+                lines.append(f'tasks[{task_id!r}] >> tasks[{downstream_task_id!r}]')
+
+        # group edges don't add new task edges at this point, but they are kept in the DAG for its graph view
+        group_ids = {group.group_id for group in self.plan.groups}
+        group_edges = {
+            (edge.upstream, edge.downstream)
+            for edge in self.plan.edges
+            if edge.upstream in group_ids or edge.downstream in group_ids
+        }
+        # start task of backfill DAG is attached to groups without upstreams by the materializer
+        group_edges.update(
+            (self.plan.start_task_id, group_id)
+            for group_id in self.plan.start_downstreams
+            if group_id in group_ids and self.plan.start_task_id in self.dag.task_group_dict[group_id].upstream_task_ids
+        )
+        for upstream, downstream in sorted(group_edges):
+            upstream_ref = f'groups[{upstream!r}]' if upstream in group_ids else f'tasks[{upstream!r}]'
+            downstream_ref = f'groups[{downstream!r}]' if downstream in group_ids else f'tasks[{downstream!r}]'
+            lines.append(f'{upstream_ref} >> {downstream_ref}')
+
+        # group edges restore task edges removed by the reduction, it gives the same result on the same task graph
+        if self.generator.config.model_dependencies.reduce_transitive_edges:
+            lines.append(f'{self._import("dbt_af.builder.edges_reduction", "reduce_transitive_edges")}(dag)')
+
+        return lines
+
+    def write(self) -> str:
+        body = [f'dag = {self._dag()}', '']
+
+        groups = ''.join(
+            f'    {group_id!r}: TaskGroup({group_id!r}, dag=dag),\n'
+            for group_id in sorted(group.group_id for group in self.plan.groups)
+        )
+        if groups:
+            self._import('airflow.utils.task_group', 'TaskGroup')
+        body += ['groups = {\n' + groups + '}', '', 'tasks = {}']
+        for task_spec in sorted(self.plan.tasks, key=lambda spec: spec.node_id):
+            body.append(f'tasks[{task_spec.node_id!r}] = {self._task(task_spec)}')
+        body += ['', *self._edges()]
+
+        schedule_tags = [f'{variable} = {tag}' for variable, tag in sorted(self._schedule_tags.items())]
+        collect_af_custom_callbacks = self._import('dbt_af.common.af_callbacks', 'collect_af_custom_callbacks')
+        header = [
+            GENERATED_MODULE_HEADER,
+            f'# DAG plan digest: {self.plan.digest}',
+            *(f'import {module}' for module in sorted(self._modules)),
+            *(f'from {module} import {", ".join(sorted(names))}' for module, names in sorted(self._imports.items())),
+            f'from {self.generator.config_module} import {self.generator.config_attribute} as dbt_af_config',
+            '',
+            f'dag_callbacks, task_callbacks = {collect_af_custom_callbacks}(dbt_af_config)',
+            *schedule_tags,
+            '',
+        ]
+        return '\n'.join(header + body) + '\n'
+
+
+def write_dag_modules(modules: dict[str, str], output_dir: str | Path) -> list[Path]:
+    """
+    Writes generated DAG modules to `{dag_id}.py` files in `output_dir` and removes previously generated modules of
+    DAGs that don't exist anymore. Files with unchanged content are not touched, so airflow doesn't reparse them.
+    Returns paths of written and removed files.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    changed = []
+    for dag_id, source in sorted(modules.items()):
+        path = output_dir / f'{dag_id}.py'
+        if path.exists() and path.read_text() == source:
+            continue
+        path.write_text(source)
+        changed.append(path)
+
+    for path in sorted(output_dir.glob('*.py')):
+        if path.stem in modules:
+            continue
+        with open(path) as fin:
+            if fin.readline().rstrip('\n') != GENERATED_MODULE_HEADER:
+                continue
+        path.unlink()
+        changed.append(path)
+
+    return changed
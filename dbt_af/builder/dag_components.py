@@ -1,27 +1,29 @@
 from collections import defaultdict
-from typing import Generator, Optional
-
-from airflow.operators.empty import EmptyOperator
-from airflow.utils.task_group import TaskGroup
+from typing import Generator, Iterable, Optional
 
+from dbt_af.builder.dag_plan import ComponentPlan, DagPlanBuilder, GroupSpec, TaskKind, TaskSpec
 from dbt_af.builder.domain_dag import DomainDag
-from dbt_af.builder.task_dependencies import DagDelayedDependencyRegistry
+from dbt_af.builder.task_dependencies import DagDelayedDependencyRegistry, RegistryDomainDependencies
 from dbt_af.common.scheduling import EScheduleTag
-from dbt_af.operators.branch import DbtBranchOperator, create_decision_path_function
-from dbt_af.operators.kubernetes_pod import DbtKubernetesPodOperator
-from dbt_af.operators.run import DbtRun, DbtSeed, DbtSnapshot, DbtTest
-from dbt_af.operators.sensors import AfExecutionDateFn, DbtExternalSensor, DbtSourceFreshnessSensor
-from dbt_af.operators.supplemental import TableauExtractsRefreshOperator
-from dbt_af.operators.venv import DbtPythonVenvOperator
-from dbt_af.parser.dbt_node_model import DbtNode, DbtNodeConfig
+from dbt_af.operators.sensors import AfExecutionDateFn
+from dbt_af.parser.dbt_compact_node import CompactDbtNode, CompactDbtNodeConfig
+from dbt_af.parser.dbt_node_model import WaitPolicy
 from dbt_af.parser.dbt_profiles import KubernetesTarget, VenvTarget
 from dbt_af.parser.dbt_source_model import DbtSource
 
 
+def _sorted_components(components: Iterable['DagComponent']) -> list['DagComponent']:
+    """
+    Components are kept in sets, so they are sorted before planning: order of tasks and edges in DAG must not depend on
+    hash randomization, otherwise airflow sees a changed DAG on each parse.
+    """
+    return sorted(components, key=lambda component: (component.domain_dag.dag_name, component.name))
+
+
 class DagComponent:
     add_external_dependencies = True
 
-    def __init__(self, name: str, domain_dag: DomainDag, node_config: DbtNodeConfig):
+    def __init__(self, name: str, domain_dag: DomainDag, node_config: CompactDbtNodeConfig):
         self.name = name
         self.domain_dag = domain_dag
         self.node_config = node_config
@@ -30,27 +32,16 @@ class DagComponent:
         self._depends_on: set[DagComponent] = set()
         self._depends_on_sources: set[DbtSource] = set()
         self._domains_dependencies: dict[DomainDag, set[DagComponent]] = defaultdict(set)
-        self.delayed_deps_registry = DagDelayedDependencyRegistry()
         self._small_tests: set[str] = set()
 
-        # airflow components
-        self.af_component: Optional[DbtRun | DbtKubernetesPodOperator | TaskGroup] = None
-        self.model_task: Optional[DbtRun | DbtKubernetesPodOperator] = None
-        self.task_group: Optional[TaskGroup] = None
-        self.af_sensor_endpoint: Optional[EmptyOperator | DbtRun | DbtKubernetesPodOperator] = None
-        self._af_callbacks: dict[str, list[Optional[callable]]] = {}
-
     @property
     def depends_on(self) -> list['DagComponent']:
-        return list(self._depends_on)
+        return _sorted_components(self._depends_on)
 
     @property
     def safe_name(self) -> str:
         return self.name.replace('.', '__')
 
-    def add_af_callbacks(self, callbacks: dict[str, list[Optional[callable]]]):
-        self._af_callbacks.update(callbacks)
-
     def add_dependency(self, dep: 'DagComponent'):
         if self.node_config.dependencies[dep.name].skip:
             return
@@ -65,48 +56,58 @@ class DagComponent:
     def add_small_test(self, resource_name: str):
         self._small_tests.add(resource_name)
 
-    def _create_opt_brancher(self, delayed_deps: DagDelayedDependencyRegistry) -> Optional[DbtBranchOperator]:
+    def _plan_opt_brancher(
+        self,
+        plan: DagPlanBuilder,
+        component_plan: ComponentPlan,
+        delayed_deps: DagDelayedDependencyRegistry,
+    ) -> Optional[TaskSpec]:
         """
-        Create a brancher task to decide if the model should be run or not based on the enable_from_dttm and
+        Plan a brancher task to decide if the model should be run or not based on the enable_from_dttm and
         disable_from_dttm parameters
         """
         if not self.node_config.enable_from_dttm and not self.node_config.disable_from_dttm:
             return None
 
-        brancher = DbtBranchOperator(
-            task_id=self.safe_name,
-            task_group=self.task_group,
-            python_callable=create_decision_path_function(self.node_config, self.safe_name),
-            dag=self.domain_dag.af_dag,
+        brancher = plan.add_task(
+            f'{self.safe_name}_branch',
+            TaskKind.DBT_BRANCH,
+            group=self._task_group(component_plan),
+            enable_from_dttm=self.node_config.enable_from_dttm,
+            disable_from_dttm=self.node_config.disable_from_dttm,
+            node_name=self.safe_name,
         )
-        delayed_deps(brancher) >> delayed_deps(self.model_task)
+        delayed_deps(brancher) >> delayed_deps(component_plan.main_task)
 
         return brancher
 
     def _ext_dep_waits_generator(
         self,
+        plan: DagPlanBuilder,
         dep: 'DagComponent',
-        task_group: TaskGroup,
-    ) -> Generator[DbtExternalSensor, None, None]:
+        task_group: Optional[GroupSpec],
+    ) -> Generator[TaskSpec, None, None]:
+        wait_policy = self.node_config.dependencies[dep.name].wait_policy
         execution_date_fns = AfExecutionDateFn(
             upstream_schedule_tag=dep.domain_dag.schedule,
             downstream_schedule_tag=self.domain_dag.schedule,
-            wait_policy=self.node_config.dependencies[dep.name].wait_policy,
+            wait_policy=wait_policy,
         ).get_execution_dates()
 
-        for i, execution_date_fn in enumerate(execution_date_fns):
+        for i in range(len(execution_date_fns)):
             # airflow task_id for statsd must be less than 250 chars.
             # it's not necessary to have a long name for the only one external dependency wait
             _suffix = f'__{i}' if len(execution_date_fns) > 1 else ''
-            wait = DbtExternalSensor(
-                dbt_af_config=self.domain_dag.config,
-                task_id=f'wait__{dep.safe_name}{_suffix}',
-                task_group=task_group,
-                external_dag_id=dep.domain_dag.af_dag.dag_id,
-                external_task_id=dep.af_sensor_endpoint.task_id,
-                execution_date_fn=execution_date_fn,
-                dep_schedule=dep.domain_dag.schedule,
-                dag=self.domain_dag.af_dag,
+            wait = plan.add_task(
+                f'wait__{dep.safe_name}{_suffix}',
+                TaskKind.EXTERNAL_SENSOR,
+                group=task_group,
+                external_dag_id=dep.domain_dag.dag_name,
+                external_task_id=dep.sensor_endpoint_task_id,
+                upstream_schedule_tag=dep.domain_dag.schedule,
+                downstream_schedule_tag=self.domain_dag.schedule,
+                wait_policy=wait_policy,
+                execution_date_fn_index=i,
             )
             yield wait
 
@@ -118,58 +119,65 @@ class DagComponent:
             and self.domain_dag.schedule != EScheduleTag.manual()
         )
 
-    def _init_dependencies_per_domain_af(self, delayed_deps: DagDelayedDependencyRegistry):
-        for dep_domain_dag, deps in self._domains_dependencies.items():
-            for dep in deps:
-                if not self._is_external_dep_valid(dep):
+    def _plan_dependencies_per_domain(
+        self,
+        plan: DagPlanBuilder,
+        component_plan: ComponentPlan,
+        delayed_deps: DagDelayedDependencyRegistry,
+    ):
+        awaited_deps = set(self._get_awaited_ext_deps(plan))
+        for dep_domain_dag in sorted(self._domains_dependencies, key=lambda domain_dag: domain_dag.dag_name):
+            for dep in _sorted_components(self._domains_dependencies[dep_domain_dag]):
+                if dep not in awaited_deps:
                     continue
 
-                deps_registry = self.domain_dag.registered_domains_dependencies[dep_domain_dag]
+                deps_registry = plan.domains_dependencies.setdefault(dep_domain_dag, RegistryDomainDependencies())
                 if not deps_registry.is_registered(dep):
                     if not deps_registry.task_group:
-                        deps_registry.task_group = TaskGroup(
-                            group_id=f'{dep_domain_dag.dag_name}__dependencies__group',
-                            dag=self.domain_dag.af_dag,
-                        )
-                    for wait in self._ext_dep_waits_generator(dep, deps_registry.task_group):
+                        deps_registry.task_group = plan.add_group(f'{dep_domain_dag.dag_name}__dependencies__group')
+                    for wait in self._ext_dep_waits_generator(plan, dep, deps_registry.task_group):
                         deps_registry.add_dependency(dep, wait)
 
                 for wait_task in deps_registry.get_dependency_wait_task(dep):
-                    delayed_deps(wait_task) >> delayed_deps(self.model_task)
+                    delayed_deps(wait_task) >> delayed_deps(component_plan.main_task)
 
-    def _init_dependencies_per_task_af(
+    def _plan_dependencies_per_task(
         self,
+        plan: DagPlanBuilder,
+        component_plan: ComponentPlan,
         delayed_deps: DagDelayedDependencyRegistry,
-        brancher: Optional[DbtBranchOperator],
+        brancher: Optional[TaskSpec],
     ):
-        for dep in self._depends_on:
-            if not self._is_external_dep_valid(dep):
-                continue
-
-            for wait in self._ext_dep_waits_generator(dep, self.af_component):
+        for dep in self._get_awaited_ext_deps(plan):
+            for wait in self._ext_dep_waits_generator(plan, dep, component_plan.component):
                 delayed_deps(brancher) >> delayed_deps(wait)
-                delayed_deps(wait) >> delayed_deps(self.model_task)
+                delayed_deps(wait) >> delayed_deps(component_plan.main_task)
 
-    def _init_dependencies_af(self, delayed_deps: DagDelayedDependencyRegistry):
+    def _plan_dependencies(
+        self,
+        plan: DagPlanBuilder,
+        component_plan: ComponentPlan,
+        delayed_deps: DagDelayedDependencyRegistry,
+    ):
         """
-        Create dependencies between the model and its upstreams. If the model has external dependencies, create
+        Plan dependencies between the model and its upstreams. If the model has external dependencies, plan
         external sensor tasks to wait for the upstreams to finish
         """
-        brancher = self._create_opt_brancher(delayed_deps=delayed_deps)
-
-        for dep in self._depends_on:
-            if dep.af_component is None:
-                dep.init_af()
+        brancher = self._plan_opt_brancher(plan, component_plan, delayed_deps)
 
+        for dep in self.depends_on:
+            # external upstreams are referenced only by ids, so their dags are not required to be planned
             if dep.domain_dag == self.domain_dag:
-                delayed_deps(dep.model_task) >> delayed_deps(self.model_task)
-                delayed_deps(dep.af_component) >> delayed_deps(self.af_component)
-                delayed_deps(dep.model_task) >> delayed_deps(brancher)
+                dep_plan = plan.components.get(dep) or dep.plan_tasks(plan)
+
+                delayed_deps(dep_plan.main_task) >> delayed_deps(component_plan.main_task)
+                delayed_deps(dep_plan.component) >> delayed_deps(component_plan.component)
+                delayed_deps(dep_plan.main_task) >> delayed_deps(brancher)
 
         if self.domain_dag.config.model_dependencies.wait_policy.per_domain:
-            self._init_dependencies_per_domain_af(delayed_deps)
+            self._plan_dependencies_per_domain(plan, component_plan, delayed_deps)
         elif self.domain_dag.config.model_dependencies.wait_policy.per_task:
-            self._init_dependencies_per_task_af(delayed_deps, brancher)
+            self._plan_dependencies_per_task(plan, component_plan, delayed_deps, brancher)
         else:
             raise ValueError(
                 f'Unknown wait policy (or all policies are turned off): '
@@ -177,29 +185,96 @@ class DagComponent:
             )
 
     def _get_ext_deps(self) -> list['DagComponent']:
-        return [dep for dep in self._depends_on if self._is_external_dep_valid(dep)]
+        return [dep for dep in self.depends_on if self._is_external_dep_valid(dep)]
+
+    def get_dag_ancestors(self) -> set['DagComponent']:
+        """
+        All upstream components of the same DAG, direct and transitive.
+        """
+        ancestors = set()
+        stack = [self]
+        while stack:
+            for dep in stack.pop()._depends_on:
+                # names of domains are compared first, it's much cheaper than comparing domain dags
+                if (
+                    dep.domain_dag.domain_name == self.domain_dag.domain_name
+                    and dep.domain_dag == self.domain_dag
+                    and dep not in ancestors
+                ):
+                    ancestors.add(dep)
+                    stack.append(dep)
+        return ancestors
+
+    def _get_awaited_ext_deps(self, plan: DagPlanBuilder) -> list['DagComponent']:
+        """
+        External dependencies that need sensors. A dependency isn't awaited if it's an upstream of another external
+        dependency from the same DAG with the same wait policy: the latter succeeds only after the former in each
+        DAG run.
+        """
+        ext_deps = self._get_ext_deps()
+        deps_by_dag_and_policy: dict[tuple[DomainDag, WaitPolicy], list[DagComponent]] = defaultdict(list)
+        for dep in ext_deps:
+            wait_policy = self.node_config.dependencies[dep.name].wait_policy
+            deps_by_dag_and_policy[dep.domain_dag, wait_policy].append(dep)
+
+        implied_deps = set()
+        for deps in deps_by_dag_and_policy.values():
+            if len(deps) > 1:
+                for dep in deps:
+                    if dep not in plan.dag_ancestors:
+                        plan.dag_ancestors[dep] = dep.get_dag_ancestors()
+                    implied_deps.update(plan.dag_ancestors[dep].intersection(deps))
+
+        return [dep for dep in ext_deps if dep not in implied_deps]
 
     def _get_source_deps_with_freshness_check(self) -> list[DbtSource]:
-        return [dep for dep in self._depends_on_sources if dep.need_to_check_freshness()]
+        return [
+            dep
+            for dep in sorted(self._depends_on_sources, key=lambda source: source.unique_id)
+            if dep.need_to_check_freshness()
+        ]
+
+    @property
+    def task_group_id(self) -> str:
+        return f'{self.safe_name}__group'
 
-    def _create_task_group(self) -> Optional[TaskGroup]:
+    def need_task_group(self) -> bool:
         """
-        Create a task group for the model if it has external dependencies or small tests. If waits for all external
+        The model needs a task group if it has external dependencies or small tests. If waits for all external
         dependencies are built per domain, a task group is not needed
         """
-        if (
-            not self._small_tests
-            and (not self._get_ext_deps() or self.domain_dag.config.model_dependencies.wait_policy.per_domain)
-            and not self._get_source_deps_with_freshness_check()
-            and not self.node_config.enable_from_dttm
-            and not self.node_config.disable_from_dttm
-            and not self.node_config.tableau_refresh_tasks
-        ):
+        return bool(
+            self._small_tests
+            or (self._get_ext_deps() and not self.domain_dag.config.model_dependencies.wait_policy.per_domain)
+            or self._get_source_deps_with_freshness_check()
+            or self.node_config.enable_from_dttm
+            or self.node_config.disable_from_dttm
+            or self.node_config.tableau_refresh_tasks
+        )
+
+    def _plan_task_group(self, plan: DagPlanBuilder) -> Optional[GroupSpec]:
+        if not self.need_task_group():
             return None
 
-        return TaskGroup(f'{self.safe_name}__group', dag=self.domain_dag.af_dag)
+        return plan.add_group(self.task_group_id)
 
-    def init_af(self):
+    @staticmethod
+    def _task_group(component_plan: ComponentPlan) -> Optional[GroupSpec]:
+        return component_plan.component if isinstance(component_plan.component, GroupSpec) else None
+
+    @property
+    def sensor_endpoint_task_id(self) -> str:
+        """
+        Task id of `af_sensor_endpoint` that external sensors wait for. It's known without creating airflow components,
+        so downstream dags could be built without materializing the upstream one.
+        """
+        raise NotImplementedError
+
+    def plan_tasks(self, plan: DagPlanBuilder) -> ComponentPlan:
+        """
+        Add airflow tasks of the component and its dependencies to the DAG plan; upstream components of the same DAG
+        are planned first.
+        """
         raise NotImplementedError
 
     def __hash__(self) -> int:
@@ -218,202 +293,216 @@ class DagComponent:
 
 
 class DagModel(DagComponent):
-    runner_class = DbtRun
+    runner_kind = TaskKind.DBT_RUN
     add_external_dependencies = True
     overlap = True
     is_dataset_enable = True
 
-    def __init__(self, dbt_node: DbtNode, domain_dag: DomainDag):
+    def __init__(self, dbt_node: CompactDbtNode, domain_dag: DomainDag):
         super().__init__(dbt_node.resource_name, domain_dag, node_config=dbt_node.config)
 
         self.dbt_node = dbt_node
         self.target_environment = self.dbt_node.target_environment(domain_dag.config.dbt_default_targets)
         self.max_active_tis_per_dag = self.dbt_node.get_airflow_parallelism()
 
-    def _create_dbt_runner_task(self) -> DbtRun:
-        return self.runner_class(
-            task_id=self.safe_name,
+    def _plan_dbt_runner_task(self, plan: DagPlanBuilder, task_group: Optional[GroupSpec]) -> TaskSpec:
+        return plan.add_task(
+            self.safe_name,
+            self.runner_kind,
+            group=task_group,
             model_name=self.name,
             is_dataset_enable=self.is_dataset_enable,
-            dag=self.domain_dag.af_dag,
-            task_group=self.task_group,
             schedule_tag=self.domain_dag.schedule,
             overlap=self.overlap,
             max_active_tis_per_dag=self.max_active_tis_per_dag,
             model_type=self.dbt_node.model_type,
             target_environment=self.target_environment,
-            dbt_af_config=self.domain_dag.config,
             env=self.dbt_node.config.env,
-            **self._af_callbacks,
         )
 
-    def _create_k8s_runner_task(self) -> DbtKubernetesPodOperator:
+    def _plan_k8s_runner_task(self, plan: DagPlanBuilder, task_group: Optional[GroupSpec]) -> TaskSpec:
         """
-        Create a k8s operator to run the dbt model not in DWH but in a k8s pod
+        Plan a k8s operator to run the dbt model not in DWH but in a k8s pod
         It's used only in rare cases when model requires a lot of resources and/or data processing on the same node
         """
-        return DbtKubernetesPodOperator(
-            task_id=self.safe_name,
+        return plan.add_task(
+            self.safe_name,
+            TaskKind.DBT_KUBERNETES_POD,
+            group=task_group,
             dbt_model_name=self.name,
             dbt_model_path=self.dbt_node.path,
-            task_group=self.task_group,
-            dag=self.domain_dag.af_dag,
             target_details=self.dbt_node.target_details,
-            dbt_af_config=self.domain_dag.config,
             env=self.dbt_node.config.env,
         )
 
-    def _create_venv_runner_task(self) -> DbtPythonVenvOperator:
-        return DbtPythonVenvOperator(
-            task_id=self.safe_name,
-            task_group=self.task_group,
-            dag=self.domain_dag.af_dag,
+    def _plan_venv_runner_task(self, plan: DagPlanBuilder, task_group: Optional[GroupSpec]) -> TaskSpec:
+        return plan.add_task(
+            self.safe_name,
+            TaskKind.DBT_PYTHON_VENV,
+            group=task_group,
+            dbt_model_name=self.name,
             dbt_model_path=self.dbt_node.path,
             target_details=self.dbt_node.target_details,
-            dbt_af_config=self.domain_dag.config,
             env=self.dbt_node.config.env,
         )
 
-    def _create_runner_task(self) -> DbtRun | DbtKubernetesPodOperator | DbtPythonVenvOperator:
+    def _plan_runner_task(self, plan: DagPlanBuilder, task_group: Optional[GroupSpec]) -> TaskSpec:
         if isinstance(self.dbt_node.target_details, KubernetesTarget):
-            return self._create_k8s_runner_task()
+            return self._plan_k8s_runner_task(plan, task_group)
         if isinstance(self.dbt_node.target_details, VenvTarget):
-            return self._create_venv_runner_task()
-        return self._create_dbt_runner_task()
+            return self._plan_venv_runner_task(plan, task_group)
+        return self._plan_dbt_runner_task(plan, task_group)
 
-    def _init_small_tests_af(self, delayed_deps: DagDelayedDependencyRegistry) -> Optional[EmptyOperator]:
+    def _plan_small_tests(
+        self,
+        plan: DagPlanBuilder,
+        component_plan: ComponentPlan,
+        delayed_deps: DagDelayedDependencyRegistry,
+    ) -> Optional[TaskSpec]:
         """
-        Create small tests for the model if it has any. If there are any tests, they will be run after the model and
-        after all tests are finished, the empty endpoint task will be created
+        Plan small tests for the model if it has any. If there are any tests, they will be run after the model and
+        after all tests are finished, the empty endpoint task will be run
         """
         if not self._small_tests:
             return None
 
-        endpoint_task = EmptyOperator(
-            task_id=f'{self.safe_name}__end',
-            task_group=self.task_group,
-            dag=self.domain_dag.af_dag,
-        )
-        for test in self._small_tests:
-            test_task = DbtTest(
-                task_id=test.replace('.', '__'),
+        task_group = self._task_group(component_plan)
+        endpoint_task = plan.add_task(f'{self.safe_name}__end', TaskKind.EMPTY, group=task_group)
+        for test in sorted(self._small_tests):
+            test_task = plan.add_task(
+                test.replace('.', '__'),
+                TaskKind.DBT_TEST,
+                group=task_group,
                 model_name=test,
-                dag=self.domain_dag.af_dag,
-                task_group=self.task_group,
                 schedule_tag=self.domain_dag.schedule,
-                dbt_af_config=self.domain_dag.config,
             )
-            delayed_deps(self.model_task) >> delayed_deps(test_task)
+            delayed_deps(component_plan.main_task) >> delayed_deps(test_task)
             delayed_deps(test_task) >> delayed_deps(endpoint_task)
 
         return endpoint_task
 
-    def _init_source_dependencies_af(self, delayed_deps: DagDelayedDependencyRegistry):
-        for source_dep in self._depends_on_sources:
-            if source_dep.need_to_check_freshness():
-                source_wait = DbtSourceFreshnessSensor(
-                    task_id=f'wait_freshness__{source_dep.name}__for__{self.safe_name}',
-                    task_group=self.af_component,
-                    dag=self.domain_dag.af_dag,
-                    env=self.model_task.env if hasattr(self.model_task, 'env') else {},
-                    source_name=source_dep.source_name,
-                    source_identifier=source_dep.identifier,
-                    dbt_af_config=self.domain_dag.config,
-                )
+    @property
+    def sensor_endpoint_task_id(self) -> str:
+        task_id = f'{self.safe_name}__end' if self._small_tests else self.safe_name
+        if self.need_task_group():
+            return f'{self.task_group_id}.{task_id}'
+        return task_id
+
+    def _plan_source_dependencies(
+        self,
+        plan: DagPlanBuilder,
+        component_plan: ComponentPlan,
+        delayed_deps: DagDelayedDependencyRegistry,
+    ):
+        for source_dep in self._get_source_deps_with_freshness_check():
+            source_wait = plan.add_task(
+                f'wait_freshness__{source_dep.name}__for__{self.safe_name}',
+                TaskKind.SOURCE_FRESHNESS_SENSOR,
+                group=self._task_group(component_plan),
+                # sensor uses the same environment as the model task
+                env_task_id=component_plan.main_task.node_id,
+                source_name=source_dep.source_name,
+                source_identifier=source_dep.identifier,
+            )
 
-                delayed_deps(source_wait) >> delayed_deps(self.model_task)
+            delayed_deps(source_wait) >> delayed_deps(component_plan.main_task)
 
-    def _init_supplemental_dependencies_af(self, delayed_deps: DagDelayedDependencyRegistry):
+    def _plan_supplemental_dependencies(
+        self,
+        plan: DagPlanBuilder,
+        component_plan: ComponentPlan,
+        delayed_deps: DagDelayedDependencyRegistry,
+    ):
         if self.dbt_node.config.tableau_refresh_tasks:
-            tableau_refresh_task = TableauExtractsRefreshOperator(
-                task_id=f'tableau_refresh__{self.safe_name}',
-                task_group=self.task_group,
-                dag=self.domain_dag.af_dag,
+            tableau_refresh_task = plan.add_task(
+                f'tableau_refresh__{self.safe_name}',
+                TaskKind.TABLEAU_REFRESH,
+                group=self._task_group(component_plan),
                 tableau_refresh_tasks=self.dbt_node.config.tableau_refresh_tasks,
-                dbt_af_config=self.domain_dag.config,
             )
-            delayed_deps(self.model_task) >> delayed_deps(tableau_refresh_task)
+            delayed_deps(component_plan.main_task) >> delayed_deps(tableau_refresh_task)
 
-    def init_af(self):
+    def plan_tasks(self, plan: DagPlanBuilder) -> ComponentPlan:
         """
-        Initialize all Airflow components for the dbt-model and it's dependencies
+        Plan all Airflow components for the dbt-model and it's dependencies
         """
-        if self.domain_dag.af_dag is None:
-            raise ValueError(f'{self!r}: dag not set')
+        with DagDelayedDependencyRegistry(plan) as delayed_deps:
+            task_group = self._plan_task_group(plan)
+            model_task = self._plan_runner_task(plan, task_group)
+            component_plan = plan.components[self] = ComponentPlan(task_group or model_task, main_task=model_task)
 
-        with self.delayed_deps_registry as delayed_deps:
-            self.task_group = self._create_task_group()
-            self.model_task = self._create_runner_task()
-            endpoint_task = self._init_small_tests_af(delayed_deps)
+            endpoint_task = self._plan_small_tests(plan, component_plan, delayed_deps)
+            component_plan.sensor_endpoint = endpoint_task or model_task
 
-            self.af_component = self.task_group or self.model_task
-            self.af_sensor_endpoint = endpoint_task or self.model_task
+            self._plan_dependencies(plan, component_plan, delayed_deps)
+            self._plan_source_dependencies(plan, component_plan, delayed_deps)
+            self._plan_supplemental_dependencies(plan, component_plan, delayed_deps)
 
-            self._init_dependencies_af(delayed_deps)
-            self._init_source_dependencies_af(delayed_deps)
-            self._init_supplemental_dependencies_af(delayed_deps)
+        return component_plan
 
 
 class DagSnapshot(DagModel):
-    runner_class = DbtSnapshot
+    runner_kind = TaskKind.DBT_SNAPSHOT
 
 
 class DagSeed(DagModel):
-    runner_class = DbtSeed
+    runner_kind = TaskKind.DBT_SEED
 
 
 class MediumTests(DagComponent):
-    def __init__(self, domain_dag: DomainDag, node_config: DbtNodeConfig):
+    def __init__(self, domain_dag: DomainDag, node_config: CompactDbtNodeConfig):
         name = f'medium_tests__{domain_dag.dag_name}'
         super().__init__(name, domain_dag, node_config=node_config)
         self._tests: set[str] = set()
 
     @staticmethod
-    def get_medium_test_name(node: DbtNode, parent_model: DagModel) -> str:
+    def get_medium_test_name(node: CompactDbtNode, parent_model: DagModel) -> str:
         return f'{parent_model.safe_name}__{node.resource_name}'
 
     def add_test(self, node_id: str):
         self._tests.add(node_id)
 
-    def init_af(self):
-        with self.delayed_deps_registry as delayed_deps:
-            self.af_component = TaskGroup(self.safe_name, dag=self.domain_dag.af_dag)
+    def plan_tasks(self, plan: DagPlanBuilder) -> ComponentPlan:
+        with DagDelayedDependencyRegistry(plan) as delayed_deps:
+            task_group = plan.add_group(self.safe_name)
+            component_plan = plan.components[self] = ComponentPlan(task_group)
 
-            for test in self._tests:
-                DbtTest(
-                    task_id=test.replace('.', '__'),
+            for test in sorted(self._tests):
+                plan.add_task(
+                    test.replace('.', '__'),
+                    TaskKind.DBT_TEST,
+                    group=task_group,
                     model_name=test,
-                    task_group=self.af_component,
-                    dag=self.domain_dag.af_dag,
                     schedule_tag=self.domain_dag.schedule,
-                    dbt_af_config=self.domain_dag.config,
                 )
 
             for dep in self.depends_on:
-                if dep.af_component is None:
-                    dep.init_af()
+                dep_plan = plan.components.get(dep) or dep.plan_tasks(plan)
+
+                delayed_deps(dep_plan.component) >> delayed_deps(task_group)
 
-                delayed_deps(dep.af_component) >> delayed_deps(self.af_component)
+        return component_plan
 
 
 class LargeTest(DagComponent):
     add_external_dependencies = True
 
-    def __init__(self, name: str, domain_dag: DomainDag, node_config: DbtNodeConfig):
+    def __init__(self, name: str, domain_dag: DomainDag, node_config: CompactDbtNodeConfig):
         super().__init__(name, domain_dag, node_config=node_config)
 
-    def init_af(self):
-        with self.delayed_deps_registry as delayed_deps:
-            self.task_group = self._create_task_group()
+    def plan_tasks(self, plan: DagPlanBuilder) -> ComponentPlan:
+        with DagDelayedDependencyRegistry(plan) as delayed_deps:
+            task_group = self._plan_task_group(plan)
 
-            self.model_task = DbtTest(
-                task_id=self.safe_name,
+            test_task = plan.add_task(
+                self.safe_name,
+                TaskKind.DBT_TEST,
+                group=task_group,
                 model_name=self.name,
-                dag=self.domain_dag.af_dag,
-                task_group=self.task_group,
                 schedule_tag=self.domain_dag.schedule,
-                dbt_af_config=self.domain_dag.config,
             )
-            self.af_component = self.task_group or self.model_task
+            component_plan = plan.components[self] = ComponentPlan(task_group or test_task, main_task=test_task)
+
+            self._plan_dependencies(plan, component_plan, delayed_deps)
 
-            self._init_dependencies_af(delayed_deps)
+        return component_plan
@@ -0,0 +1,217 @@
+import importlib
+from functools import cache
+from typing import Optional
+
+from airflow.models.baseoperator import BaseOperator
+from airflow.models.dag import DAG
+from airflow.models.param import Param
+from airflow.operators.empty import EmptyOperator
+from airflow.operators.python import BranchPythonOperator
+from airflow.utils.task_group import TaskGroup
+
+from dbt_af.builder.dag_plan import DagPlan, TaskKind, TaskSpec
+from dbt_af.builder.edges_reduction import reduce_transitive_edges
+from dbt_af.common.constants import DEFAULT_DAG_ARGS
+from dbt_af.common.scheduling import BaseScheduleTag
+from dbt_af.conf import Config
+from dbt_af.operators.branch import DbtBranchOperator, create_decision_path_function, decide_backfill_path
+from dbt_af.operators.macros import DbtMaintenanceOperatorFactory
+from dbt_af.operators.sensors import AfExecutionDateFn, DbtExternalSensor, DbtSourceFreshnessSensor
+
+# operators that take planned params as they are, by module and class name;
+# they are imported on first use, so kubernetes client and other heavy dependencies aren't loaded if they aren't needed
+DBT_AF_OPERATORS = {
+    TaskKind.DBT_RUN: ('dbt_af.operators.run', 'DbtRun'),
+    TaskKind.DBT_SNAPSHOT: ('dbt_af.operators.run', 'DbtSnapshot'),
+    TaskKind.DBT_SEED: ('dbt_af.operators.run', 'DbtSeed'),
+    TaskKind.DBT_TEST: ('dbt_af.operators.run', 'DbtTest'),
+    TaskKind.DBT_KUBERNETES_POD: ('dbt_af.operators.kubernetes_pod', 'DbtKubernetesPodOperator'),
+    TaskKind.DBT_PYTHON_VENV: ('dbt_af.operators.venv', 'DbtPythonVenvOperator'),
+    TaskKind.TABLEAU_REFRESH: ('dbt_af.operators.supplemental', 'TableauExtractsRefreshOperator'),
+}
+RUNNER_KINDS = (TaskKind.DBT_RUN, TaskKind.DBT_SNAPSHOT, TaskKind.DBT_SEED)
+# operators of these kinds are stamped from the first operator with the same params but the model name in the DAG
+STAMPED_KINDS = (*RUNNER_KINDS, TaskKind.DBT_TEST)
+
+
+@cache
+def load_operator(kind: TaskKind) -> type[BaseOperator]:
+    module_name, class_name = DBT_AF_OPERATORS[kind]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _prototype_key(task_spec: TaskSpec) -> Optional[tuple]:
+    if task_spec.kind not in STAMPED_KINDS or not task_spec.params.get('model_name'):
+        return None
+
+    params = []
+    for name, value in sorted(task_spec.params.items()):
+        if name == 'model_name':
+            continue
+        if isinstance(value, dict):
+            value = tuple(sorted(value.items()))
+        elif isinstance(value, BaseScheduleTag):
+            # schedule tags are equal if they have the same base name regardless of their timeshifts
+            value = value.name
+        params.append((name, value))
+    return task_spec.kind, tuple(params)
+
+
+class DagMaterializer:
+    """
+    Turns DAG plans into airflow DAGs. Everything that is not stored in plans (dbt-af config, callbacks and python
+    callables of operators) is added here.
+
+    Operators of dbt models and tests that differ only by the model are stamped from the first of them in the DAG
+    (see `DbtBaseActionOperator.stamp`), unless `use_prototypes` is disabled.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        dag_callbacks: dict[str, list[Optional[callable]]],
+        task_callbacks: dict[str, list[Optional[callable]]],
+        use_prototypes: bool = True,
+    ):
+        self.config = config
+        self.dag_callbacks = dag_callbacks
+        self.task_callbacks = task_callbacks
+        self.use_prototypes = use_prototypes
+
+    def materialize(self, plan: DagPlan) -> DAG:
+        dag = DAG(
+            plan.dag.dag_id,
+            start_date=plan.dag.start_date,
+            description=plan.dag.description,
+            schedule=plan.dag.schedule,
+            catchup=plan.dag.catchup,
+            default_args=DEFAULT_DAG_ARGS,
+            max_active_runs=plan.dag.max_active_runs,
+            render_template_as_native_obj=False,
+            tags=list(plan.dag.tags),
+            params={name: Param(**spec) for name, spec in plan.dag.params.items()} or None,
+            **self.dag_callbacks,
+        )
+
+        groups = {group.group_id: TaskGroup(group.group_id, dag=dag) for group in plan.groups}
+        nodes: dict[str, BaseOperator | TaskGroup] = dict(groups)
+        prototypes: dict[tuple, BaseOperator] = {}
+        for task_spec in plan.tasks:
+            task_group = groups.get(task_spec.group_id)
+            prototype_key = _prototype_key(task_spec) if self.use_prototypes else None
+            if prototype_key in prototypes:
+                task = prototypes[prototype_key].stamp(task_spec.task_id, task_spec.params['model_name'], task_group)
+            else:
+                task = self._create_task(task_spec, task_group, dag, nodes)
+                if prototype_key is not None:
+                    prototypes[prototype_key] = task
+            if task.task_id != task_spec.node_id:
+                raise ValueError(f'Task {task.task_id} is planned as {task_spec.node_id} in {dag.dag_id}')
+            nodes[task_spec.node_id] = task
+
+        self._set_edges(plan, nodes)
+
+        if plan.start_task_id is not None:
+            start_task = nodes[plan.start_task_id]
+            for node_id in plan.start_downstreams:
+                if len(nodes[node_id].upstream_task_ids) == 0:
+                    start_task >> nodes[node_id]
+
+        if self.config.model_dependencies.reduce_transitive_edges:
+            reduce_transitive_edges(dag)
+
+        return dag
+
+    @classmethod
+    def _set_edges(cls, plan: DagPlan, nodes: dict[str, BaseOperator | TaskGroup]):
+        """
+        Sets planned edges in their order. It's the same as `set_downstream`, but task edges are added to relatives
+        of tasks directly, without checks of `set_downstream` that hash the DAG for every edge of every task. All tasks
+        are created by the materializer in the same DAG, so there's nothing to check.
+        """
+        for edge in plan.edges:
+            cls._set_edge(nodes[edge.upstream], nodes[edge.downstream])
+
+    @classmethod
+    def _set_edge(cls, upstream: BaseOperator | TaskGroup, downstream: BaseOperator | TaskGroup):
+        if isinstance(upstream, TaskGroup):
+            # as `TaskGroup.set_downstream` does, leaves are taken at the moment, so the order of edges matters
+            upstream.update_relative(downstream, upstream=False)
+            for task in upstream.get_leaves():
+                cls._set_edge(task, downstream)
+        elif isinstance(downstream, TaskGroup):
+            downstream.update_relative(upstream, upstream=True)
+            for task in downstream.roots:
+                cls._set_edge(upstream, task)
+        else:
+            upstream.downstream_task_ids.add(downstream.task_id)
+            downstream.upstream_task_ids.add(upstream.task_id)
+
+    def _create_task(
+        self,
+        task_spec: TaskSpec,
+        task_group: Optional[TaskGroup],
+        dag: DAG,
+        nodes: dict[str, BaseOperator | TaskGroup],
+    ) -> BaseOperator:
+        params = task_spec.params
+        if task_spec.kind in DBT_AF_OPERATORS:
+            callbacks = self.task_callbacks if task_spec.kind in RUNNER_KINDS else {}
+            return load_operator(task_spec.kind)(
+                task_id=task_spec.task_id,
+                task_group=task_group,
+                dag=dag,
+                dbt_af_config=self.config,
+                **params,
+                **callbacks,
+            )
+
+        if task_spec.kind == TaskKind.EMPTY:
+            return EmptyOperator(task_id=task_spec.task_id, task_group=task_group, dag=dag)
+        if task_spec.kind == TaskKind.DBT_BRANCH:
+            return DbtBranchOperator(
+                task_id=task_spec.task_id,
+                task_group=task_group,
+                python_callable=create_decision_path_function(
+                    params['enable_from_dttm'], params['disable_from_dttm'], params['node_name']
+                ),
+                dag=dag,
+            )
+        if task_spec.kind == TaskKind.EXTERNAL_SENSOR:
+            execution_date_fns = AfExecutionDateFn(
+                upstream_schedule_tag=params['upstream_schedule_tag'],
+                downstream_schedule_tag=params['downstream_schedule_tag'],
+                wait_policy=params['wait_policy'],
+            ).get_execution_dates()
+            return DbtExternalSensor(
+                dbt_af_config=self.config,
+                task_id=task_spec.task_id,
+                task_group=task_group,
+                external_dag_id=params['external_dag_id'],
+                external_task_id=params['external_task_id'],
+                execution_date_fn=execution_date_fns[params['execution_date_fn_index']],
+                dep_schedule=params['upstream_schedule_tag'],
+                dag=dag,
+            )
+        if task_spec.kind == TaskKind.SOURCE_FRESHNESS_SENSOR:
+            env_task = nodes[params['env_task_id']]
+            return DbtSourceFreshnessSensor(
+                task_id=task_spec.task_id,
+                task_group=task_group,
+                dag=dag,
+                env=env_task.env if hasattr(env_task, 'env') else {},
+                source_name=params['source_name'],
+                source_identifier=params['source_identifier'],
+                dbt_af_config=self.config,
+            )
+        if task_spec.kind == TaskKind.MAINTENANCE:
+            return DbtMaintenanceOperatorFactory.create(
+                task_group=task_group,
+                af_dag=dag,
+                dbt_af_config=self.config,
+                **params,
+            )
+        if task_spec.kind == TaskKind.BACKFILL_BRANCH:
+            return BranchPythonOperator(task_id=task_spec.task_id, python_callable=decide_backfill_path, dag=dag)
+
+        raise TypeError(f'Unknown task kind: {task_spec.kind}')
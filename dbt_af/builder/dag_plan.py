@@ -0,0 +1,213 @@
+import datetime as dt
+import enum
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any, Optional
+
+import attrs
+
+try:
+    import pydantic.v1 as pydantic
+except ModuleNotFoundError:
+    import pydantic
+
+from dbt_af.common.scheduling import BaseScheduleTag
+
+if TYPE_CHECKING:
+    from dbt_af.builder.dag_components import DagComponent
+    from dbt_af.builder.domain_dag import DomainDag
+    from dbt_af.builder.task_dependencies import RegistryDomainDependencies
+
+
+class TaskKind(enum.Enum):
+    EMPTY = 'empty'
+    DBT_RUN = 'dbt_run'
+    DBT_SNAPSHOT = 'dbt_snapshot'
+    DBT_SEED = 'dbt_seed'
+    DBT_TEST = 'dbt_test'
+    DBT_KUBERNETES_POD = 'dbt_kubernetes_pod'
+    DBT_PYTHON_VENV = 'dbt_python_venv'
+    DBT_BRANCH = 'dbt_branch'
+    EXTERNAL_SENSOR = 'external_sensor'
+    SOURCE_FRESHNESS_SENSOR = 'source_freshness_sensor'
+    TABLEAU_REFRESH = 'tableau_refresh'
+    MAINTENANCE = 'maintenance'
+    BACKFILL_BRANCH = 'backfill_branch'
+
+
+@attrs.define(frozen=True)
+class GroupSpec:
+    group_id: str
+
+    @property
+    def node_id(self) -> str:
+        return self.group_id
+
+
+@attrs.define(frozen=True)
+class TaskSpec:
+    """
+    Airflow task to be created by the materializer: `kind` selects operator, `params` are its arguments that don't
+    depend on dbt-af config and airflow objects.
+    """
+
+    task_id: str
+    kind: TaskKind
+    group_id: Optional[str] = None
+    params: dict[str, Any] = attrs.field(factory=dict, hash=False)
+
+    @property
+    def node_id(self) -> str:
+        """
+        Task id in airflow DAG (prefixed with id of the task group).
+        """
+        return f'{self.group_id}.{self.task_id}' if self.group_id else self.task_id
+
+
+@attrs.define(frozen=True)
+class EdgeSpec:
+    upstream: str
+    downstream: str
+
+
+@attrs.define(frozen=True)
+class DagSpec:
+    """
+    Arguments of airflow DAG; `params` are arguments of airflow params of the DAG by their names.
+    """
+
+    dag_id: str
+    start_date: dt.datetime
+    schedule: Optional[str]
+    catchup: bool
+    tags: tuple[str, ...]
+    description: str
+    max_active_runs: int
+    params: dict[str, dict[str, Any]] = attrs.field(factory=dict, hash=False)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, BaseScheduleTag):
+        return value.name
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, pydantic.BaseModel):
+        return value.dict()
+    if isinstance(value, (GroupSpec, TaskSpec, EdgeSpec, DagSpec)):
+        return attrs.asdict(value, recurse=False)
+    return str(value)
+
+
+@attrs.define(frozen=True)
+class DagPlan:
+    """
+    Pure-data description of airflow DAG: all task groups and tasks in creation order and edges between them in
+    resolution order. Edges refer to tasks and groups by their ids in the DAG. Tasks from `start_downstreams` are
+    attached to `start_task_id` if they have no upstream tasks after all edges are set (backfill DAGs).
+    Plans don't contain airflow objects, so they are cheap to build, pickle and compare by `digest`.
+    """
+
+    dag: DagSpec
+    groups: tuple[GroupSpec, ...]
+    tasks: tuple[TaskSpec, ...]
+    edges: tuple[EdgeSpec, ...]
+    start_task_id: Optional[str] = None
+    start_downstreams: tuple[str, ...] = ()
+
+    @property
+    def dag_id(self) -> str:
+        return self.dag.dag_id
+
+    @property
+    def digest(self) -> str:
+        return hashlib.blake2b(
+            json.dumps(
+                [self.dag, self.groups, self.tasks, self.edges, self.start_task_id, self.start_downstreams],
+                sort_keys=True,
+                default=_plain,
+            ).encode(),
+            digest_size=16,
+        ).hexdigest()
+
+
+@attrs.define
+class ComponentPlan:
+    """
+    Planned parts of a dag component: the task or group that represents the component in its DAG, the main task of
+    the component and the task that external sensors wait for.
+    """
+
+    component: TaskSpec | GroupSpec
+    main_task: Optional[TaskSpec] = None
+    sensor_endpoint: Optional[TaskSpec] = None
+
+
+class DagPlanBuilder:
+    """
+    Collects plan of one DAG while its dag components are planned.
+
+    :param dag_ancestors: cache of `DagComponent.get_dag_ancestors` of external dependencies; it could be shared by
+        plans of all DAGs of one graph, since many DAGs depend on the same upstream components
+    """
+
+    def __init__(self, dag: DagSpec, dag_ancestors: Optional[dict['DagComponent', set['DagComponent']]] = None):
+        self.dag = dag
+        self.components: dict['DagComponent', ComponentPlan] = {}
+        self.domains_dependencies: dict['DomainDag', 'RegistryDomainDependencies'] = {}
+        self.dag_ancestors = dag_ancestors if dag_ancestors is not None else {}
+
+        self._groups: dict[str, GroupSpec] = {}
+        self._tasks: dict[str, TaskSpec] = {}
+        # edges are de-duplicated, a component often depends on the same task through several of its tasks
+        self._edges: dict[EdgeSpec, None] = {}
+        self._start_task_id: Optional[str] = None
+        self._start_downstreams: list[str] = []
+
+    def add_group(self, group_id: str) -> GroupSpec:
+        group = GroupSpec(group_id)
+        self._check_node_id(group.node_id)
+        self._groups[group.node_id] = group
+        return group
+
+    def add_task(self, task_id: str, kind: TaskKind, group: Optional[GroupSpec] = None, **params) -> TaskSpec:
+        task = TaskSpec(task_id, kind, group_id=group and group.group_id, params=params)
+        self._check_node_id(task.node_id)
+        self._tasks[task.node_id] = task
+        return task
+
+    def _check_node_id(self, node_id: str):
+        if node_id in self._groups or node_id in self._tasks:
+            raise ValueError(f'{node_id} has already been added to the plan of {self.dag.dag_id}')
+
+    def add_edge(self, upstream: TaskSpec | GroupSpec, downstream: TaskSpec | GroupSpec):
+        # the first edge is kept: repeated edges don't change the DAG, even for task groups, whose roots and leaves
+        # only shrink when more edges are set
+        self._edges.setdefault(EdgeSpec(upstream.node_id, downstream.node_id))
+
+    def set_start_task(self, task: TaskSpec):
+        self._start_task_id = task.node_id
+
+    def add_start_downstream(self, task: TaskSpec | GroupSpec):
+        self._start_downstreams.append(task.node_id)
+
+    def build(self) -> DagPlan:
+        """
+        Builds the plan and releases collected components, tasks and edges: builders of all DAGs are kept until all
+        components are planned, so they shouldn't hold the same data as plans.
+        """
+        plan = DagPlan(
+            dag=self.dag,
+            groups=tuple(self._groups.values()),
+            tasks=tuple(self._tasks.values()),
+            edges=tuple(self._edges),
+            start_task_id=self._start_task_id,
+            start_downstreams=tuple(self._start_downstreams),
+        )
+
+        self.components.clear()
+        self.domains_dependencies.clear()
+        self._groups.clear()
+        self._tasks.clear()
+        self._edges.clear()
+        self._start_downstreams.clear()
+        return plan
@@ -1,22 +1,28 @@
 from collections import defaultdict
-from typing import Optional
+from itertools import chain
+from typing import Callable, Iterable, Optional
 
+import attrs
 import pendulum
 
 from dbt_af.builder.backfill_dag_components import BackfillDagModel, BackfillDagSnapshot
 from dbt_af.builder.dag_components import DagComponent, DagModel, DagSeed, DagSnapshot, LargeTest, MediumTests
+from dbt_af.builder.dag_plan import DagPlan, DagPlanBuilder, DagSpec
 from dbt_af.builder.domain_dag import BackfillDomainDag, DomainDag, DomainDagFactory, DomainDagType
+from dbt_af.builder.graph_index import DbtNodesIndex
 from dbt_af.builder.maintenance_dag_components import MaintenanceDagComponent
 from dbt_af.common.constants import DOMAIN_DAG_START_DATE_FMT
 from dbt_af.conf import Config
-from dbt_af.parser.dbt_node_model import DbtModelMaintenanceType, DbtNode
+from dbt_af.parser.dbt_compact_node import CompactDbtNode
+from dbt_af.parser.dbt_node_model import DbtModelMaintenanceType
+from dbt_af.parser.dbt_nodes_parser import parse_dbt_nodes, select_domains_nodes_info
 from dbt_af.parser.dbt_profiles import Profiles
 from dbt_af.parser.dbt_source_model import DbtSource
 
 
 class DagComponentFactory:
     @staticmethod
-    def create(dbt_node: DbtNode, domain_dag: DomainDag, backfill: bool = False) -> DagComponent:
+    def create(dbt_node: CompactDbtNode, domain_dag: DomainDag, backfill: bool = False) -> DagComponent:
         if dbt_node.is_model():
             return DagModel(dbt_node, domain_dag) if not backfill else BackfillDagModel(dbt_node, domain_dag)
         if dbt_node.is_snapshot():
@@ -39,7 +45,7 @@ class DomainDagsRegistry:
     def clear(self):
         self._domain_dags = {}
 
-    def _get_domain_dag_hash(self, dbt_node: DbtNode) -> str:
+    def _get_domain_dag_hash(self, dbt_node: CompactDbtNode) -> str:
         if dbt_node.is_large_test():
             return f'{dbt_node.domain}__large_tests'
         if self.dags_type == DomainDagType.BACKFILL:
@@ -51,7 +57,7 @@ class DomainDagsRegistry:
 
         raise TypeError(f'Unknown dag type: {self.dags_type}')
 
-    def get(self, dbt_node: DbtNode) -> DomainDag:
+    def get(self, dbt_node: CompactDbtNode) -> DomainDag:
         domain_dag_name = self._get_domain_dag_hash(dbt_node)
 
         if domain_dag_name not in self._domain_dags:
@@ -65,11 +71,78 @@ class DomainDagsRegistry:
         return self._domain_dags[domain_dag_name]
 
 
+def split_domains(domains_weights: dict[str, int], n_partitions: int) -> list[list[str]]:
+    """
+    Splits domains into at most `n_partitions` groups with roughly equal total weight (e.g. number of nodes), so DAGs
+    of each group could be compiled in a separate DAG file and airflow parses them in parallel.
+    The heaviest domains are assigned first to the lightest group; the result doesn't depend on the order of domains.
+    """
+    if n_partitions < 1:
+        raise ValueError(f'Number of partitions must be positive, got {n_partitions}')
+
+    partitions: list[list[str]] = [[] for _ in range(min(n_partitions, len(domains_weights)))]
+    loads = [0] * len(partitions)
+    for domain in sorted(domains_weights, key=lambda domain: (-domains_weights[domain], domain)):
+        lightest = min(range(len(partitions)), key=lambda i: (loads[i], i))
+        partitions[lightest].append(domain)
+        loads[lightest] += domains_weights[domain]
+
+    return [sorted(partition) for partition in partitions]
+
+
+def select_domains_nodes(nodes: list[CompactDbtNode], domains: Iterable[str]) -> list[CompactDbtNode]:
+    """
+    Selects nodes required to build dag components of the given domains:
+        - all nodes of the domains and tests of their models;
+        - direct upstreams of these nodes with their own upstreams and small tests, so dag ids and sensor endpoints
+          of external dependencies are the same as in the full graph;
+        - all upstreams of direct upstreams within their domains, so external waits implied by other ones are pruned
+          the same way as in the full graph.
+    Other upstreams of upstreams are only needed to know their domain dags, so their own dependencies are dropped.
+    Order of nodes is preserved.
+    """
+    domains = set(domains)
+    nodes_by_id = {node.unique_id: node for node in nodes}
+
+    def _in_domains(unique_id: str) -> bool:
+        return unique_id in nodes_by_id and nodes_by_id[unique_id].domain in domains
+
+    domain_ids = {
+        node.unique_id
+        for node in nodes
+        if node.domain in domains or (node.is_test() and any(map(_in_domains, node.depends_on)))
+    }
+    upstream_ids = {upstream for unique_id in domain_ids for upstream in nodes_by_id[unique_id].depends_on}
+    upstream_ids -= domain_ids
+    pending = list(upstream_ids)
+    while pending:
+        node = nodes_by_id[pending.pop()]
+        for upstream in node.depends_on:
+            if upstream in upstream_ids or upstream in domain_ids or upstream not in nodes_by_id:
+                continue
+            if nodes_by_id[upstream].domain == node.domain:
+                upstream_ids.add(upstream)
+                pending.append(upstream)
+    upstream_tests_ids = {
+        node.unique_id
+        for node in nodes
+        if node.is_small_test() and any(upstream in upstream_ids for upstream in node.depends_on)
+    }
+    full_ids = domain_ids | upstream_ids | upstream_tests_ids
+    stub_ids = {upstream for unique_id in full_ids for upstream in nodes_by_id[unique_id].depends_on} - full_ids
+
+    return [
+        node if node.unique_id in full_ids else attrs.evolve(node, depends_on=(), depends_on_sources=())
+        for node in nodes
+        if node.unique_id in full_ids or node.unique_id in stub_ids
+    ]
+
+
 class DbtAfGraph:
-    def __init__(self, nodes: list[DbtNode], sources: list[DbtSource], config: Config):
+    def __init__(self, nodes: list[CompactDbtNode], sources: list[DbtSource], config: Config):
         self.config = config
 
-        self.dbt_nodes: list[DbtNode] = nodes
+        self.dbt_nodes: list[CompactDbtNode] = nodes
         self.dbt_sources: list[DbtSource] = sources
 
         # dbt-af components
@@ -88,6 +161,7 @@ class DbtAfGraph:
         )
 
         self.nodes: list[DagComponent] = []
+        self._nodes_index: Optional[DbtNodesIndex] = None
 
     @classmethod
     def from_manifest(
@@ -97,25 +171,63 @@ class DbtAfGraph:
         project_profile_name: str,
         config: Config,
         etl_service_name: Optional[str] = None,
+        domains: Optional[Iterable[str]] = None,
     ) -> 'DbtAfGraph':
+        """
+        Builds dbt-af graph from manifest. If `domains` are given, then only dag components of these domains are built,
+        other nodes are used only to resolve external dependencies.
+        """
         project_profile = Profiles(**profiles)[project_profile_name]
 
-        nodes = []
-        for node_info in manifest['nodes'].values():
-            node = DbtNode(**node_info)
-            node.set_target_details(project_profile, config.dbt_default_targets)
-            if node.resource_type in ('test', 'model', 'snapshot', 'seed'):
-                # TODO: add sensors for models in different etl services
-                if etl_service_name and not node.is_at_etl_service(etl_service_name):
-                    continue
-                nodes.append(node)
+        manifest_nodes = manifest['nodes']
+        if domains is not None:
+            # only a slice of manifest around the domains is validated
+            domains = set(domains)
+            manifest_nodes = select_domains_nodes_info(manifest_nodes, domains)
+
+        nodes = parse_dbt_nodes(
+            manifest_nodes,
+            project_profile,
+            config.dbt_default_targets,
+            etl_service_name=etl_service_name,
+            parallel_parsing=config.parallel_parsing,
+        )
 
         sources = [DbtSource(**source_info) for source_info in manifest['sources'].values()]
 
+        if domains is None:
+            return cls.from_nodes(nodes, sources, config)
+
+        return cls.from_nodes(select_domains_nodes(nodes, domains), sources, config).select_domains(domains)
+
+    @classmethod
+    def from_nodes(cls, nodes: list[CompactDbtNode], sources: list[DbtSource], config: Config) -> 'DbtAfGraph':
+        """
+        Builds dbt-af graph from already parsed nodes, e.g. to build graphs of several etl services from one manifest.
+        """
         graph = cls(nodes, sources, config)
         graph._build_dags()
         return graph
 
+    def select_domains(self, domains: Iterable[str]) -> 'DbtAfGraph':
+        """
+        Returns graph with dag components of the given domains only. Components are shared with this graph and still
+        refer to components of other domains as their external dependencies.
+        """
+        domains = set(domains)
+        return self._select_components(lambda component: component.domain_dag.domain_name in domains)
+
+    def select_dag(self, dag_name: str) -> 'DbtAfGraph':
+        """
+        Returns graph with dag components of one domain dag only, see `select_domains`.
+        """
+        return self._select_components(lambda component: component.domain_dag.dag_name == dag_name)
+
+    def _select_components(self, predicate: Callable[[DagComponent], bool]) -> 'DbtAfGraph':
+        graph = DbtAfGraph(self.dbt_nodes, self.dbt_sources, self.config)
+        graph.nodes = [node for node in self.nodes if predicate(node)]
+        return graph
+
     def clear_registries(self):
         self._domain_dags_registry.clear()
         self._domain_bf_dags_registry.clear()
@@ -124,41 +236,50 @@ class DbtAfGraph:
         self._dag_components_registry = {}
         self._medium_tests = {}
 
+    @property
+    def nodes_index(self) -> DbtNodesIndex:
+        if self._nodes_index is None:
+            self._nodes_index = DbtNodesIndex(self.dbt_nodes)
+        return self._nodes_index
+
+    def __getstate__(self) -> dict:
+        # index is cheap to rebuild, so it's not stored in graph cache
+        return {**self.__dict__, '_nodes_index': None}
+
     def _build_dags(self):
-        dag_components = self._build_dag_components(self.dbt_nodes)
+        dag_components = self._build_dag_components(self.nodes_index)
         self.clear_registries()
-        backfill_dag_components = self._build_backfill_dag_components(self.dbt_nodes)
+        if self.config.backfill.mode == 'project':
+            # models are backfilled by the system DAG of the project, see `dbt_af.dags.dbt_backfill_dag`
+            self.nodes = dag_components
+            return
+
+        backfill_dag_components = self._build_backfill_dag_components(self.nodes_index)
 
         self.nodes = dag_components + backfill_dag_components
 
-    def _find_parent_node_for_test(self, node: DbtNode) -> DagModel | BackfillDomainDag:
-        original_file_path = node.original_file_path_without_extension
-        for upstream in node.depends_on:
-            if self._models[upstream].dbt_node.original_file_path_without_extension == original_file_path:
-                return self._models[upstream]
+    def _find_parent_node_for_test(self, node: CompactDbtNode) -> DagModel | BackfillDomainDag:
+        parent_id = self.nodes_index.find_parent_model_id(node)
+        if parent_id is None:
+            raise ValueError(f'Could not find parent node for medium test {node.unique_id}')
 
-        raise ValueError(f'Could not find parent node for medium test {node.unique_id}')
+        return self._models[parent_id]
 
-    def _collect_all_models(self, nodes, backfill: bool = False) -> None:
+    def _collect_all_models(self, index: DbtNodesIndex, backfill: bool = False) -> None:
         domain_dags_registry = self._domain_bf_dags_registry if backfill else self._domain_dags_registry
-        for node in nodes:
-            domain_dag = domain_dags_registry.get(node)
-            try:
-                self._dag_components_registry[node.unique_id] = DagComponentFactory.create(
-                    dbt_node=node,
-                    domain_dag=domain_dag,
-                    backfill=backfill,
-                )
-            except ValueError:
-                # node is not an independent dag component or should not be in dag
-                continue
+        # only models and large tests are independent dag components; large tests are not run in backfill dags
+        component_nodes = index.models if backfill else index.models + index.large_tests
+        for node in component_nodes:
+            self._dag_components_registry[node.unique_id] = DagComponentFactory.create(
+                dbt_node=node,
+                domain_dag=domain_dags_registry.get(node),
+                backfill=backfill,
+            )
 
-        self._models = {
-            node.unique_id: self._dag_components_registry[node.unique_id] for node in nodes if not node.is_test()
-        }
+        self._models = {node.unique_id: self._dag_components_registry[node.unique_id] for node in index.models}
         if not backfill:
             self._large_tests = {
-                node.unique_id: self._dag_components_registry[node.unique_id] for node in nodes if node.is_large_test()
+                node.unique_id: self._dag_components_registry[node.unique_id] for node in index.large_tests
             }
 
     def _collect_maintenance_components(self) -> None:
@@ -174,30 +295,31 @@ class DbtAfGraph:
                         )
                     self._maintenance_components[domain_dag][maintenance_type].add_model(model.dbt_node)
 
-    def _resolve_dependencies(self, nodes: list[DbtNode], backfill: bool = False) -> None:
+    def _resolve_dependencies(self, index: DbtNodesIndex, backfill: bool = False) -> None:
         sources: dict[str, DbtSource] = {source.unique_id: source for source in self.dbt_sources}
 
         # set dependencies for models and snapshots
-        for node in nodes:
+        for node in index.models:
             if node.is_model() or node.is_snapshot():
                 for upstream in node.depends_on:
                     self._models[node.unique_id].add_dependency(self._models[upstream])
                 for upstream in node.depends_on_sources:
                     self._models[node.unique_id].add_source_dependency(sources[upstream])
 
-            elif node.is_small_test():
-                for upstream in node.depends_on:
-                    self._models[upstream].add_small_test(node.resource_name)
+        for node in index.small_tests:
+            for upstream in node.depends_on:
+                self._models[upstream].add_small_test(node.resource_name)
 
-            elif node.is_medium_test():
-                parent_node = self._find_parent_node_for_test(node)
-                parent_domain_dag = parent_node.domain_dag
-                if parent_domain_dag not in self._medium_tests:
-                    self._medium_tests[parent_domain_dag] = MediumTests(parent_domain_dag, parent_node.dbt_node.config)
-                self._medium_tests[parent_domain_dag].add_test(MediumTests.get_medium_test_name(node, parent_node))
+        for node in index.medium_tests:
+            parent_node = self._find_parent_node_for_test(node)
+            parent_domain_dag = parent_node.domain_dag
+            if parent_domain_dag not in self._medium_tests:
+                self._medium_tests[parent_domain_dag] = MediumTests(parent_domain_dag, parent_node.dbt_node.config)
+            self._medium_tests[parent_domain_dag].add_test(MediumTests.get_medium_test_name(node, parent_node))
 
-            elif node.is_large_test() and not backfill:
-                # set dependencies for large tests only for regular scheduled dags
+        if not backfill:
+            # set dependencies for large tests only for regular scheduled dags
+            for node in index.large_tests:
                 for upstream in node.depends_on:
                     self._large_tests[node.unique_id].add_dependency(self._models[upstream])
 
@@ -209,11 +331,11 @@ class DbtAfGraph:
             if model.domain_dag in self._medium_tests:
                 self._medium_tests[model.domain_dag].add_dependency(model)
 
-    def _build_dag_components(self, nodes: list[DbtNode]) -> list[DagComponent]:
-        self._collect_all_models(nodes)
+    def _build_dag_components(self, index: DbtNodesIndex) -> list[DagComponent]:
+        self._collect_all_models(index)
         self._collect_maintenance_components()
 
-        self._resolve_dependencies(nodes)
+        self._resolve_dependencies(index)
 
         self._bind_medium_tests()
 
@@ -221,23 +343,75 @@ class DbtAfGraph:
             list(self._models.values())
             + list(self._medium_tests.values())
             + list(self._large_tests.values())
-            + list(*[maintenance.values() for maintenance in self._maintenance_components.values()])
+            + list(chain.from_iterable(maintenance.values() for maintenance in self._maintenance_components.values()))
         )
 
-    def _build_backfill_dag_components(self, nodes: list[DbtNode]) -> list[DagComponent]:
-        self._collect_all_models(nodes, backfill=True)
+    def _build_backfill_dag_components(self, index: DbtNodesIndex) -> list[DagComponent]:
+        self._collect_all_models(index, backfill=True)
 
-        self._resolve_dependencies(nodes, backfill=True)
+        self._resolve_dependencies(index, backfill=True)
 
         self._bind_medium_tests()
 
         return list(self._models.values()) + list(self._medium_tests.values())
 
 
-def get_domain_dag_start_date(graph: DbtAfGraph, domain_dag: DomainDag) -> pendulum.datetime:
-    min_date_from_nodes = min(
-        node.node_config.domain_start_date for node in graph.nodes if node.domain_dag == domain_dag
-    )
+def _domain_dag_start_date(graph: DbtAfGraph, min_date_from_nodes: str) -> pendulum.datetime:
     if min_date_from_nodes:
         return pendulum.from_format(min_date_from_nodes, DOMAIN_DAG_START_DATE_FMT)
     return graph.config.dag_start_date
+
+
+def get_domain_dags_start_dates(graph: DbtAfGraph) -> dict[DomainDag, pendulum.datetime]:
+    """
+    Start dates of all domain dags of the graph, computed in one pass over dag components.
+    """
+    min_dates_from_nodes: dict[DomainDag, str] = {}
+    for node in graph.nodes:
+        domain_start_date = node.node_config.domain_start_date
+        if node.domain_dag not in min_dates_from_nodes or domain_start_date < min_dates_from_nodes[node.domain_dag]:
+            min_dates_from_nodes[node.domain_dag] = domain_start_date
+
+    return {
+        domain_dag: _domain_dag_start_date(graph, min_date_from_nodes)
+        for domain_dag, min_date_from_nodes in min_dates_from_nodes.items()
+    }
+
+
+def plan_dags(graph: DbtAfGraph) -> dict[str, DagPlan]:
+    """
+    Builds plans of all domain dags of the graph. No airflow objects are created here, plans are turned into airflow
+    DAGs by `DagMaterializer`.
+    """
+    config = graph.config
+    plans: dict[str, DagPlanBuilder] = {}
+    dag_ancestors: dict[DagComponent, set[DagComponent]] = {}
+    for domain_dag, start_date in get_domain_dags_start_dates(graph).items():
+        plan = DagPlanBuilder(
+            DagSpec(
+                dag_id=domain_dag.dag_name,
+                start_date=start_date,
+                schedule=domain_dag.af_schedule,
+                catchup=domain_dag.catchup if not config.dry_run else False,
+                tags=tuple(['dbt'] + domain_dag.tags),
+                description=config.af_dag_description,
+                max_active_runs=config.max_active_dag_runs,
+                params=domain_dag.params,
+            ),
+            dag_ancestors=dag_ancestors,
+        )
+        if isinstance(domain_dag, BackfillDomainDag):
+            domain_dag.plan_endpoints(plan)
+        plans[domain_dag.dag_name] = plan
+
+    for node in graph.nodes:
+        plan = plans[node.domain_dag.dag_name]
+        if node not in plan.components:
+            node.plan_tasks(plan)
+
+    for node in graph.nodes:
+        if isinstance(node.domain_dag, BackfillDomainDag) and not node.domain_dag.on_demand:
+            plan = plans[node.domain_dag.dag_name]
+            plan.add_start_downstream(plan.components[node].component)
+
+    return {dag_name: plan.build() for dag_name, plan in plans.items()}
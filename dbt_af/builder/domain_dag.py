@@ -1,11 +1,7 @@
-from collections import defaultdict
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
-from airflow.operators.empty import EmptyOperator
-from airflow.operators.python import BranchPythonOperator
-
-from dbt_af.builder.task_dependencies import RegistryDomainDependencies
+from dbt_af.builder.dag_plan import DagPlanBuilder, TaskKind
 from dbt_af.common import constants
 from dbt_af.common.scheduling import BaseScheduleTag, EScheduleTag
 from dbt_af.conf import Config
@@ -34,12 +30,6 @@ class DomainDag:
         self.additional_tags: list[str] = additional_tags or []
         self.catchup = catchup
 
-        self.registered_domains_dependencies: dict[DomainDag, RegistryDomainDependencies] = defaultdict(
-            RegistryDomainDependencies
-        )
-
-        self.af_dag = None
-
     @property
     def _base_tags(self) -> Optional[list[str]]:
         return None
@@ -56,6 +46,17 @@ class DomainDag:
     def schedule(self, value: BaseScheduleTag):
         self._schedule = value
 
+    @property
+    def af_schedule(self) -> Optional[str]:
+        return self.schedule.af_repr()
+
+    @property
+    def params(self) -> dict[str, dict[str, Any]]:
+        """
+        Arguments of airflow params of the DAG by their names.
+        """
+        return {}
+
     @property
     def tags(self) -> list[str]:
         pure_domain_name = self.domain_name.split('__')[0]
@@ -86,8 +87,12 @@ class BackfillDomainDag(DomainDag):
         catchup: bool = True,
     ):
         super().__init__(domain_name, self.schedule, config, additional_tags, catchup)
+        if self.on_demand:
+            self.catchup = False
 
-        self.start_endpoint: Optional[EmptyOperator] = None
+    @property
+    def on_demand(self) -> bool:
+        return self.config.backfill.mode == 'on_demand'
 
     @property
     def _base_tags(self) -> Optional[list[str]]:
@@ -101,22 +106,66 @@ class BackfillDomainDag(DomainDag):
     def schedule(self) -> BaseScheduleTag:
         return EScheduleTag.daily()
 
-    def wrap_dag_with_endpoints(self):
+    @property
+    def af_schedule(self) -> Optional[str]:
+        # tasks are still planned as daily ones, only DAG runs are not scheduled
+        return None if self.on_demand else super().af_schedule
+
+    @property
+    def params(self) -> dict[str, dict[str, Any]]:
+        if not self.on_demand:
+            return {}
+
+        return {
+            'start_dttm': {
+                'default': None,
+                'type': ['null', 'string'],
+                'format': 'date-time',
+                'title': 'Interval start datetime',
+                'description_md': (
+                    'Set together with end_dttm; if both are not set, the whole day of the logical date of DAG run '
+                    'is backfilled'
+                ),
+            },
+            'end_dttm': {
+                'default': None,
+                'type': ['null', 'string'],
+                'format': 'date-time',
+                'title': 'Interval end datetime',
+                'description_md': (
+                    'Set together with start_dttm; if both are not set, the whole day of the logical date of DAG run '
+                    'is backfilled'
+                ),
+            },
+            constants.BACKFILL_MODELS_PARAM: {
+                'default': [],
+                'type': 'array',
+                'items': {'type': 'string'},
+                'title': 'Models to backfill',
+                'description_md': (
+                    'Names of models to backfill; all models of the DAG are backfilled if it is empty. '
+                    'Tasks of other models succeed without running dbt, tests are run for all models.'
+                ),
+            },
+        }
+
+    def plan_endpoints(self, plan: DagPlanBuilder):
         """
         Each backfill dag should have start with branch operator and end with empty operator.
         For the first scheduled run branch operator will return 'do_nothing' task and all dbt tasks will be skipped.
         If airflow dag is triggered again after scheduled run, it will trigger all downstream dbt tasks.
+        On-demand backfill dags are run only when they are triggered, so they don't need any endpoints.
         """
-        self.start_endpoint = EmptyOperator(task_id='start_work', dag=self.af_dag)
-        do_nothing = EmptyOperator(task_id='do_nothing', dag=self.af_dag)
+        if self.on_demand:
+            return
 
-        def decide_which_path(**kwargs):
-            if kwargs['task_instance'].try_number > 1:
-                return 'start_work'
-            return 'do_nothing'
+        start_endpoint = plan.add_task('start_work', TaskKind.EMPTY)
+        do_nothing = plan.add_task('do_nothing', TaskKind.EMPTY)
+        brancher = plan.add_task('branch', TaskKind.BACKFILL_BRANCH)
 
-        brancher = BranchPythonOperator(task_id='branch', python_callable=decide_which_path, dag=self.af_dag)
-        brancher >> [self.start_endpoint, do_nothing]
+        plan.add_edge(brancher, start_endpoint)
+        plan.add_edge(brancher, do_nothing)
+        plan.set_start_task(start_endpoint)
 
 
 class MaintenanceDomainDag(DomainDag):
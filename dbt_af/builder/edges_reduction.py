@@ -0,0 +1,55 @@
+from airflow.models.dag import DAG
+from airflow.operators.python import BranchPythonOperator
+from airflow.utils.trigger_rule import TriggerRule
+
+
+def _topological_order(dag: DAG) -> list[str]:
+    in_degree = {task_id: len(task.upstream_task_ids) for task_id, task in dag.task_dict.items()}
+    order = [task_id for task_id, degree in in_degree.items() if degree == 0]
+    for task_id in order:
+        for downstream_id in dag.task_dict[task_id].downstream_task_ids:
+            in_degree[downstream_id] -= 1
+            if in_degree[downstream_id] == 0:
+                order.append(downstream_id)
+
+    if len(order) != len(in_degree):
+        raise ValueError(f'DAG {dag.dag_id} has cycles')
+    return order
+
+
+def count_edges(dag: DAG) -> int:
+    return sum(len(task.downstream_task_ids) for task in dag.tasks)
+
+
+def reduce_transitive_edges(dag: DAG) -> tuple[int, int]:
+    """
+    Removes task edges that are implied by other paths in the DAG (transitive reduction), e.g. `a >> c` is removed if
+    there are `a >> b` and `b >> c`. Task groups and their dependencies are left as they are.
+
+    Tasks run only after all their upstreams succeed, so an implied upstream succeeds before the task anyway and
+    execution stays the same. Paths through tasks with other trigger rules don't imply anything, and edges from branch
+    operators are never removed, because branches decide on their direct downstreams.
+
+    :return: number of task edges before and after the reduction
+    """
+    n_edges = count_edges(dag)
+    order = _topological_order(dag)
+    position = {task_id: i for i, task_id in enumerate(order)}
+    waits_for_all = {task_id: task.trigger_rule == TriggerRule.ALL_SUCCESS for task_id, task in dag.task_dict.items()}
+
+    # bitsets of tasks that can't start before the task succeeds, by their positions in topological order
+    implied_downstreams: dict[str, int] = {}
+    for task_id in reversed(order):
+        task = dag.task_dict[task_id]
+        is_branch = isinstance(task, BranchPythonOperator)
+        reachable = 0
+        for downstream_id in sorted(task.downstream_task_ids, key=position.__getitem__):
+            is_implied = reachable >> position[downstream_id] & 1
+            if is_implied and not is_branch and waits_for_all[downstream_id]:
+                task.downstream_task_ids.discard(downstream_id)
+                dag.task_dict[downstream_id].upstream_task_ids.discard(task_id)
+            elif waits_for_all[downstream_id]:
+                reachable |= 1 << position[downstream_id] | implied_downstreams[downstream_id]
+        implied_downstreams[task_id] = reachable
+
+    return n_edges, count_edges(dag)
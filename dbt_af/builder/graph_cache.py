@@ -0,0 +1,212 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+import attrs
+
+import dbt_af
+from dbt_af.builder.dbt_af_builder import DbtAfGraph
+from dbt_af.builder.incremental import ManifestFingerprints
+from dbt_af.conf import Config, GraphCacheConfig
+
+# bump it on every change of dbt-af graph internals that are not covered by dbt-af version
+GRAPH_CACHE_FORMAT_VERSION = 7
+GRAPH_CACHE_FILE_SUFFIX = '.graph'
+
+_CONFIG_PERSISTENT_ID = 'dbt_af_config'
+_HASH_CHUNK_SIZE = 2**20
+_COMPILATION_CONFIG_FIELDS = ('graph_cache', 'parallel_parsing')
+
+
+def _update_digest_with_file(digest: 'hashlib._Hash', path: Path) -> None:
+    with open(path, 'rb') as fin:
+        while chunk := fin.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+
+
+def _config_json_default(value: Any) -> str:
+    if callable(value):
+        return f'{getattr(value, "__module__", "")}.{getattr(value, "__qualname__", repr(value))}'
+    return str(value)
+
+
+def config_fingerprint(config: Config) -> str:
+    """
+    Stable text representation of dbt-af config; callables are represented by their qualified names.
+    Compilation settings don't affect the graph, so they are not included.
+    """
+    config_dict = attrs.asdict(config, filter=lambda attribute, _: attribute.name not in _COMPILATION_CONFIG_FIELDS)
+    return json.dumps(config_dict, sort_keys=True, default=_config_json_default)
+
+
+def graph_cache_base_key(
+    profiles_path: str | Path,
+    dbt_project_path: str | Path,
+    config: Config,
+    etl_service_name: Optional[str] = None,
+) -> str:
+    """
+    Part of the cache key that doesn't depend on manifest. Graphs with the same base key differ only by manifest, so
+    one of them could be incrementally rebuilt into another.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f'{dbt_af.__version__}:{GRAPH_CACHE_FORMAT_VERSION}:{sys.version_info[:2]}'.encode())
+    for path in (profiles_path, dbt_project_path):
+        _update_digest_with_file(digest, Path(path))
+    digest.update(config_fingerprint(config).encode())
+    digest.update(str(etl_service_name).encode())
+
+    return digest.hexdigest()
+
+
+def graph_cache_key(
+    manifest_path: str | Path,
+    profiles_path: str | Path,
+    dbt_project_path: str | Path,
+    config: Config,
+    etl_service_name: Optional[str] = None,
+) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    _update_digest_with_file(digest, Path(manifest_path))
+    base_key = graph_cache_base_key(profiles_path, dbt_project_path, config, etl_service_name)
+
+    return f'{base_key}-{digest.hexdigest()}'
+
+
+class GraphCacheEntry(NamedTuple):
+    graph: DbtAfGraph
+    fingerprints: Optional[ManifestFingerprints] = None
+
+
+class _GraphPickler(pickle.Pickler):
+    """
+    Config is referenced by the graph and all domain dags, but it could contain unpicklable callbacks, so it's stored
+    out of band and substituted with the current config on load.
+    """
+
+    def __init__(self, file, config: Config):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._config = config
+
+    def persistent_id(self, obj):
+        if obj is self._config:
+            return _CONFIG_PERSISTENT_ID
+        return None
+
+
+class _GraphUnpickler(pickle.Unpickler):
+    def __init__(self, file, config: Config):
+        super().__init__(file)
+        self._config = config
+
+    def persistent_load(self, pid):
+        if pid == _CONFIG_PERSISTENT_ID:
+            return self._config
+        raise pickle.UnpicklingError(f'Unknown persistent id: {pid}')
+
+
+class DbtAfGraphCache:
+    """
+    On-disk cache of built dbt-af graphs.
+    Entries are written to a temporary file and atomically moved to the final place, so concurrent readers always see
+    either complete entry or no entry at all. Any broken entry is treated as a cache miss.
+    """
+
+    def __init__(self, cache_config: GraphCacheConfig):
+        self.cache_config = cache_config
+
+    @property
+    def cache_dir(self) -> Path:
+        return self.cache_config.cache_dir
+
+    def entry_path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}{GRAPH_CACHE_FILE_SUFFIX}'
+
+    def load_entry(self, key: str, config: Config) -> Optional[GraphCacheEntry]:
+        path = self.entry_path(key)
+        try:
+            with open(path, 'rb') as fin:
+                entry = _GraphUnpickler(fin, config).load()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f'Failed to load dbt-af graph from cache {path}: {e}')
+            return None
+
+        if not isinstance(entry, GraphCacheEntry) or not isinstance(entry.graph, DbtAfGraph):
+            logging.warning(f'Unexpected object in dbt-af graph cache {path}: {type(entry)}')
+            return None
+
+        try:
+            # mark entry as recently used
+            os.utime(path)
+        except OSError:
+            pass
+
+        return entry
+
+    def load(self, key: str, config: Config) -> Optional[DbtAfGraph]:
+        entry = self.load_entry(key, config)
+        return entry.graph if entry is not None else None
+
+    def latest_key(self, base_key: str) -> Optional[str]:
+        """
+        Returns key of the most recently used entry with the given base key (see `graph_cache_base_key`).
+        """
+        entries = []
+        for path in self.cache_dir.glob(f'{base_key}-*{GRAPH_CACHE_FILE_SUFFIX}'):
+            try:
+                entries.append((path.stat().st_mtime, path.name.removesuffix(GRAPH_CACHE_FILE_SUFFIX)))
+            except FileNotFoundError:
+                # removed by concurrent process
+                continue
+
+        return max(entries)[1] if entries else None
+
+    def save(self, key: str, graph: DbtAfGraph, fingerprints: Optional[ManifestFingerprints] = None) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f'.{key}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fout:
+                _GraphPickler(fout, graph.config).dump(GraphCacheEntry(graph, fingerprints))
+            os.replace(tmp_path, self.entry_path(key))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries until both limits on number of entries and total size are satisfied.
+        """
+        entries = []
+        for path in self.cache_dir.glob(f'*{GRAPH_CACHE_FILE_SUFFIX}'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # removed by concurrent process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort(reverse=True)
+        max_size = self.cache_config.max_size_mb * 2**20
+        total_size = 0
+        for n_entry, (_, size, path) in enumerate(entries):
+            total_size += size
+            if n_entry < self.cache_config.max_entries and (n_entry == 0 or total_size <= max_size):
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,54 @@
+from collections import defaultdict
+from typing import Optional
+
+from dbt_af.parser.dbt_compact_node import CompactDbtNode
+
+
+class DbtNodesIndex:
+    """
+    Index of dbt nodes built once per graph, so the builder doesn't scan all nodes or recompute derived values of
+    nodes in its hot paths. All lists keep the order of nodes in the manifest.
+    """
+
+    def __init__(self, nodes: list[CompactDbtNode]):
+        self.nodes_by_id: dict[str, CompactDbtNode] = {}
+        self.dependents: dict[str, list[CompactDbtNode]] = defaultdict(list)
+
+        # models, snapshots and seeds
+        self.models: list[CompactDbtNode] = []
+        self.small_tests: list[CompactDbtNode] = []
+        self.medium_tests: list[CompactDbtNode] = []
+        self.large_tests: list[CompactDbtNode] = []
+
+        self._file_paths_without_extension: dict[str, str] = {}
+
+        for node in nodes:
+            self.nodes_by_id[node.unique_id] = node
+            for upstream in node.depends_on + node.depends_on_sources:
+                self.dependents[upstream].append(node)
+
+            if not node.is_test():
+                self.models.append(node)
+            elif node.is_small_test():
+                self.small_tests.append(node)
+            elif node.is_medium_test():
+                self.medium_tests.append(node)
+            elif node.is_large_test():
+                self.large_tests.append(node)
+
+    def _file_path_without_extension(self, unique_id: str) -> Optional[str]:
+        if unique_id not in self._file_paths_without_extension:
+            node = self.nodes_by_id.get(unique_id)
+            self._file_paths_without_extension[unique_id] = node and node.original_file_path_without_extension
+        return self._file_paths_without_extension[unique_id]
+
+    def find_parent_model_id(self, test: CompactDbtNode) -> Optional[str]:
+        """
+        Returns id of the first upstream model that is defined in the same file as the test.
+        """
+        file_path = self._file_path_without_extension(test.unique_id)
+        for upstream in test.depends_on:
+            if self._file_path_without_extension(upstream) == file_path:
+                return upstream
+
+        return None
@@ -0,0 +1,159 @@
+import hashlib
+import json
+from collections import defaultdict
+from typing import Any, Optional
+
+import attrs
+
+from dbt_af.builder.dag_components import DagComponent
+from dbt_af.builder.dbt_af_builder import DbtAfGraph, select_domains_nodes
+from dbt_af.builder.graph_index import DbtNodesIndex
+from dbt_af.conf import Config
+from dbt_af.parser.dbt_compact_node import CompactDbtNode
+from dbt_af.parser.dbt_nodes_parser import parse_dbt_nodes
+from dbt_af.parser.dbt_profiles import Profiles
+from dbt_af.parser.dbt_source_model import DbtSource
+
+
+class IncrementalRebuildError(Exception):
+    """
+    Raised when previous graph could not be reused, so the graph must be built from scratch.
+    """
+
+
+def _record_fingerprint(record: dict[str, Any]) -> str:
+    return hashlib.blake2b(json.dumps(record, sort_keys=True, default=str).encode(), digest_size=16).hexdigest()
+
+
+@attrs.define(frozen=True)
+class ManifestFingerprints:
+    """
+    Fingerprints of all manifest nodes and sources. Node fingerprint covers its checksum, config and `depends_on`,
+    so any change of model code, its config or dependencies changes the fingerprint.
+    """
+
+    nodes: dict[str, str]
+    sources: dict[str, str]
+
+    @classmethod
+    def from_manifest(cls, manifest: dict) -> 'ManifestFingerprints':
+        return cls(
+            nodes={unique_id: _record_fingerprint(record) for unique_id, record in manifest['nodes'].items()},
+            sources={unique_id: _record_fingerprint(record) for unique_id, record in manifest['sources'].items()},
+        )
+
+
+def _changed_ids(previous: dict[str, str], current: dict[str, str]) -> set[str]:
+    changed = {unique_id for unique_id, fingerprint in current.items() if previous.get(unique_id) != fingerprint}
+    removed = previous.keys() - current.keys()
+    return changed | removed
+
+
+def find_affected_domains(
+    previous_nodes: list[CompactDbtNode],
+    nodes: list[CompactDbtNode],
+    changed_nodes: set[str],
+    changed_sources: set[str],
+) -> set[str]:
+    """
+    Finds domains whose dag components must be rebuilt:
+        - domains of changed, added and removed nodes (both previous and current versions);
+        - domains of upstream models for changed tests, because tests are attached to their models' components;
+        - domains of direct dependents of changed nodes and sources, because they wait for them with sensors.
+    Components of other domains only refer to rebuilt ones and could be relinked.
+    """
+    affected_domains = set()
+    for versions in (previous_nodes, nodes):
+        index = DbtNodesIndex(versions)
+        nodes_by_id, dependents = index.nodes_by_id, index.dependents
+
+        for unique_id in changed_nodes | changed_sources:
+            if node := nodes_by_id.get(unique_id):
+                affected_domains.add(node.domain)
+                if node.is_test():
+                    affected_domains.update(
+                        nodes_by_id[upstream].domain for upstream in node.depends_on if upstream in nodes_by_id
+                    )
+            affected_domains.update(dependent.domain for dependent in dependents.get(unique_id, ()))
+
+    return affected_domains
+
+
+def _relink(components: list[DagComponent]) -> None:
+    """
+    Replaces references to components from previous and partial builds with components of the final graph.
+    Components are compared by name and domain dag, so the final graph has exactly one object for each of them.
+    """
+    current_components = {component: component for component in components}
+    try:
+        for component in components:
+            component._depends_on = {current_components[dep] for dep in component._depends_on}
+
+            domains_dependencies = defaultdict(set)
+            for deps in component._domains_dependencies.values():
+                for dep in deps:
+                    dep = current_components[dep]
+                    domains_dependencies[dep.domain_dag].add(dep)
+            component._domains_dependencies = domains_dependencies
+    except KeyError as e:
+        raise IncrementalRebuildError(f'Dependency {e} is not found in rebuilt graph') from e
+
+
+def _component_domain(component: DagComponent) -> str:
+    return component.domain_dag.domain_name
+
+
+def rebuild_graph(
+    previous_graph: DbtAfGraph,
+    previous_fingerprints: ManifestFingerprints,
+    fingerprints: ManifestFingerprints,
+    manifest: dict,
+    profiles: dict,
+    project_profile_name: str,
+    config: Config,
+    etl_service_name: Optional[str] = None,
+) -> DbtAfGraph:
+    """
+    Builds graph for the new manifest reusing not affected parts of the previous graph.
+    Only changed and added nodes are validated, and only components of affected domains are rebuilt.
+    The previous graph must not be materialized into airflow DAGs yet (e.g. it's loaded from the cache).
+    """
+    changed_nodes = _changed_ids(previous_fingerprints.nodes, fingerprints.nodes)
+    changed_sources = _changed_ids(previous_fingerprints.sources, fingerprints.sources)
+
+    project_profile = Profiles(**profiles)[project_profile_name]
+    parsed_nodes = parse_dbt_nodes(
+        {unique_id: manifest['nodes'][unique_id] for unique_id in changed_nodes if unique_id in manifest['nodes']},
+        project_profile,
+        config.dbt_default_targets,
+        etl_service_name=etl_service_name,
+        parallel_parsing=config.parallel_parsing,
+    )
+    nodes_by_id = {node.unique_id: node for node in previous_graph.dbt_nodes if node.unique_id not in changed_nodes}
+    nodes_by_id.update((node.unique_id, node) for node in parsed_nodes)
+    nodes = [nodes_by_id[unique_id] for unique_id in manifest['nodes'] if unique_id in nodes_by_id]
+
+    previous_sources = {source.unique_id: source for source in previous_graph.dbt_sources}
+    sources = [
+        DbtSource(**source_info)
+        if unique_id in changed_sources or unique_id not in previous_sources
+        else previous_sources[unique_id]
+        for unique_id, source_info in manifest['sources'].items()
+    ]
+
+    affected_domains = find_affected_domains(previous_graph.dbt_nodes, nodes, changed_nodes, changed_sources)
+    graph = DbtAfGraph(nodes, sources, config)
+    if not affected_domains:
+        graph.nodes = previous_graph.nodes
+        return graph
+
+    # components of other domains are built only to resolve dependencies and then replaced with previous ones
+    partial_graph = DbtAfGraph(select_domains_nodes(nodes, affected_domains), sources, config)
+    partial_graph._build_dags()
+
+    graph.nodes = [
+        component for component in previous_graph.nodes if _component_domain(component) not in affected_domains
+    ] + [component for component in partial_graph.nodes if _component_domain(component) in affected_domains]
+    _relink(graph.nodes)
+
+    return graph
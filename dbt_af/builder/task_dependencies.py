@@ -1,35 +1,19 @@
 import typing as tp
 from collections import defaultdict
 
-from airflow.models.baseoperator import BaseOperator
-from airflow.utils.task_group import TaskGroup
+from dbt_af.builder.dag_plan import DagPlanBuilder, GroupSpec, TaskSpec
 
 if tp.TYPE_CHECKING:
     from dbt_af.builder.dag_components import DagComponent
 
 
-class DagDelayedDependency:
-    """
-    Delayed fixed pair of two tasks in Airflow DAG that have dependency between.
-    It works because in Airflow it's possible to set dependency between tasks at any time
-    after tasks and Dag are created.
-    """
-
-    def __init__(self, upstream: BaseOperator, downstream: BaseOperator):
-        self.upstream = upstream
-        self.downstream = downstream
-
-    def resolve(self):
-        self.upstream.set_downstream(self.downstream)
-
-
 class DagDelayedDependencyStream:
     """
     Helper class to create delayed dependency between two tasks in Airflow DAG.
     It represents a dependency between two tasks in Airflow DAG using >> and << operators.
     """
 
-    def __init__(self, stream: BaseOperator, registry):
+    def __init__(self, stream: tp.Union[TaskSpec, GroupSpec], registry):
         self.stream = stream
         self.registry = registry
 
@@ -54,13 +38,14 @@ class DagDelayedDependencyStream:
 
 class DagDelayedDependencyRegistry:
     """
-    Registry of delayed dependencies between tasks in Airflow DAG. It's used to create delayed dependencies and
-    resolve them at the end of the DagComponent creation.
+    Registry of delayed dependencies between planned tasks in Airflow DAG. It's used to create delayed dependencies and
+    add them to the DAG plan at the end of the DagComponent planning, the plan collects edges of all components of the
+    DAG without duplicates and the materializer sets them in the same order.
     Supports context manager interface to resolve dependencies at the exit of the context.
     Correctly resolves dependencies between TaskGroup >> TaskGroup and TaskGroup >> Task
 
     Example:
-        with DagDelayedDependencyRegistry() as delayed_deps:
+        with DagDelayedDependencyRegistry(plan) as delayed_deps:
             delayed_deps(group1) >> delayed_deps(task2)
             delayed_deps(task1) >> delayed_deps(task2)
             delayed_deps(group1) >> delayed_deps(group2)
@@ -71,10 +56,11 @@ class DagDelayedDependencyRegistry:
         task1 >> task2
     """
 
-    def __init__(self):
-        self._registry: tp.List[DagDelayedDependency] = []
+    def __init__(self, plan: DagPlanBuilder):
+        self.plan = plan
+        self._registry: tp.List[tuple[tp.Union[TaskSpec, GroupSpec], tp.Union[TaskSpec, GroupSpec]]] = []
 
-    def __call__(self, task: tp.Union[BaseOperator, TaskGroup]) -> DagDelayedDependencyStream:
+    def __call__(self, task: tp.Union[TaskSpec, GroupSpec]) -> DagDelayedDependencyStream:
         return DagDelayedDependencyStream(task, registry=self)
 
     def __enter__(self):
@@ -86,28 +72,31 @@ class DagDelayedDependencyRegistry:
     def __iter__(self):
         return iter(self._registry)
 
-    def register(self, upstream: BaseOperator, downstream: BaseOperator):
-        self._registry.append(DagDelayedDependency(upstream, downstream))
+    def register(self, upstream: tp.Union[TaskSpec, GroupSpec], downstream: tp.Union[TaskSpec, GroupSpec]):
+        self._registry.append((upstream, downstream))
 
     def _sort_dependencies(self):
         # HACK: https://github.com/apache/airflow/issues/16764#issuecomment-1015058864
         # we need to resolve TaskGroup >> TaskGroup dependencies first and then all other dependencies
         # it's necessary to avoid bug with inconsistent state of TaskGroup and dependencies between them.
+        # Dependencies are sorted only within the component: roots and leaves of task groups are taken at the moment
+        # when group dependencies are set, so they must follow task dependencies of already planned components.
         self._registry.sort(
-            key=lambda d: (isinstance(d.upstream, TaskGroup)) + (isinstance(d.downstream, TaskGroup)),
+            key=lambda d: isinstance(d[0], GroupSpec) + isinstance(d[1], GroupSpec),
             reverse=True,
         )
 
     def resolve_dependencies(self):
         self._sort_dependencies()
-        for dep in self._registry:
-            dep.resolve()
+        for upstream, downstream in self._registry:
+            self.plan.add_edge(upstream, downstream)
+        self._registry.clear()
 
 
 class RegistryDomainDependencies:
     def __init__(self):
-        self._registry: tp.Dict['DagComponent', tp.List[BaseOperator]] = defaultdict(list)
-        self.task_group: tp.Optional[TaskGroup] = None
+        self._registry: tp.Dict['DagComponent', tp.List[TaskSpec]] = defaultdict(list)
+        self.task_group: tp.Optional[GroupSpec] = None
 
     def __repr__(self):
         return f'{self.__class__.__name__}({self._registry})'
@@ -115,8 +104,8 @@ class RegistryDomainDependencies:
     def is_registered(self, component: 'DagComponent') -> bool:
         return component in self._registry
 
-    def add_dependency(self, component: 'DagComponent', wait_task: BaseOperator) -> None:
+    def add_dependency(self, component: 'DagComponent', wait_task: TaskSpec) -> None:
         self._registry[component].append(wait_task)
 
-    def get_dependency_wait_task(self, component: 'DagComponent') -> tp.List[BaseOperator]:
+    def get_dependency_wait_task(self, component: 'DagComponent') -> tp.List[TaskSpec]:
         return self._registry[component]
@@ -1,55 +1,11 @@
 from datetime import datetime
 from functools import partial
-from typing import Callable
+from typing import Iterable
 
-from croniter import croniter, croniter_range
-
-from dbt_af.common.scheduling import BaseScheduleTag
+from dbt_af.common.scheduling import BaseScheduleTag, EScheduleTag
 from dbt_af.parser.dbt_node_model import WaitPolicy
 
 
-class _TaskScheduleMapping:
-    def __init__(self, wait_policy: WaitPolicy):
-        self.wait_policy = wait_policy
-
-        self._mapping = {}
-
-    def is_registered(self, upstream_schedule_tag: BaseScheduleTag, downstream_schedule_tag: BaseScheduleTag) -> bool:
-        return (upstream_schedule_tag.name, downstream_schedule_tag.name) in self._mapping
-
-    def add(
-        self,
-        upstream_schedule_tag: BaseScheduleTag,
-        downstream_schedule_tag: BaseScheduleTag,
-        fn: Callable | list[Callable],
-    ):
-        if not isinstance(fn, list):
-            fn = [fn]
-        self._mapping[(upstream_schedule_tag.name, downstream_schedule_tag.name)] = fn
-        return self
-
-    @staticmethod
-    def _update_upstream_cron_args(fn: partial, upstream: BaseScheduleTag, downstream: BaseScheduleTag):
-        if fn is None:
-            return
-
-        fn.keywords.update({'self_schedule': downstream, 'upstream_schedule': upstream})
-
-    def get(self, key: tuple[BaseScheduleTag, BaseScheduleTag], default=None) -> list[Callable | None]:
-        """
-        If the result function is None (or list of None),
-        it means that there is no need to find a specific upstream task, wait for the last one.
-        """
-        if not isinstance(default, list):
-            default = [default]
-        stream_names = (key[0].name, key[1].name)
-        fns = self._mapping.get(stream_names, default)
-        for fn in fns:
-            self._update_upstream_cron_args(fn, upstream=key[0], downstream=key[1])
-
-        return fns
-
-
 def calculate_task_to_wait_execution_date(
     execution_date: datetime,
     self_schedule: BaseScheduleTag,
@@ -65,21 +21,16 @@ def calculate_task_to_wait_execution_date(
     """
     self_cron = self_schedule.cron_expression()
     upstream_cron = upstream_schedule.cron_expression()
-    interval_stop_dttm: datetime = croniter(self_cron.raw_cron_expression, execution_date).get_next(datetime)
+    interval_stop_dttm = self_cron.next_run(execution_date)
 
     if self_schedule < upstream_schedule:
-        cron_iter = croniter(upstream_cron.raw_cron_expression, interval_stop_dttm)
-        cron_iter.get_prev()
-        return cron_iter.get_prev(datetime)
+        return upstream_cron.prev_run(upstream_cron.prev_run(interval_stop_dttm))
     if self_schedule == upstream_schedule:
         if self_schedule.timeshift == upstream_schedule.timeshift:
             return execution_date
-        cron_iter = croniter(upstream_cron.raw_cron_expression, execution_date)
-        return cron_iter.get_prev(datetime)
+        return upstream_cron.prev_run(execution_date)
 
-    all_dts = list(
-        croniter_range(execution_date, interval_stop_dttm, upstream_cron.raw_cron_expression, ret_type=datetime)
-    )
+    all_dts = upstream_cron.runs_between(execution_date, interval_stop_dttm)
 
     if all_dts and all_dts[-1] == interval_stop_dttm:
         all_dts.pop()
@@ -90,4 +41,65 @@ def calculate_task_to_wait_execution_date(
     return all_dts[num_iter]
 
 
-GLOBAL_TASK_SCHEDULE_MAPPINGS = {policy: _TaskScheduleMapping(policy) for policy in WaitPolicy}
+def _build_execution_date_fns(
+    wait_policy: WaitPolicy,
+    upstream_schedule_tag: BaseScheduleTag,
+    downstream_schedule_tag: BaseScheduleTag,
+) -> tuple[partial, ...]:
+    match wait_policy:
+        case WaitPolicy.last:
+            embeddings_number = 0
+        case WaitPolicy.all:
+            embeddings_number = downstream_schedule_tag.cron_expression().embeddings_number(
+                upstream_schedule_tag.cron_expression(),
+                is_upstream_bigger=downstream_schedule_tag < upstream_schedule_tag,
+            )
+        case _:
+            raise TypeError(f'Unknown wait policy {wait_policy}')
+
+    schedules = {'self_schedule': downstream_schedule_tag, 'upstream_schedule': upstream_schedule_tag}
+    if not embeddings_number:
+        return (partial(calculate_task_to_wait_execution_date, **schedules),)
+    return tuple(
+        partial(calculate_task_to_wait_execution_date, num_iter=i, **schedules) for i in range(embeddings_number)
+    )
+
+
+class ExecutionDateFnTable:
+    """
+    Functions to calculate execution dates of upstream tasks for sensors by wait policy, upstream and downstream
+    schedule tags. Functions of the given schedule tags are built up front, functions of tags with other timeshifts are
+    built once on the first lookup. Stored functions are never changed, so the table is safe to use from threads.
+
+    The number of upstream runs inside a monthly interval depends on the length of the current month, so functions
+    for monthly downstreams with `WaitPolicy.all` are built on the first lookup as well.
+    """
+
+    def __init__(self, schedule_tags: Iterable[BaseScheduleTag]):
+        schedule_tags = list(schedule_tags)
+        self._fns: dict[tuple[WaitPolicy, str, str], tuple[partial, ...]] = {
+            (wait_policy, upstream.name, downstream.name): _build_execution_date_fns(wait_policy, upstream, downstream)
+            for wait_policy in WaitPolicy
+            for upstream in schedule_tags
+            for downstream in schedule_tags
+            if wait_policy != WaitPolicy.all or downstream.base_name != EScheduleTag.monthly.base_name
+        }
+
+    def get(
+        self,
+        wait_policy: WaitPolicy,
+        upstream_schedule_tag: BaseScheduleTag,
+        downstream_schedule_tag: BaseScheduleTag,
+    ) -> tuple[partial, ...]:
+        key = (wait_policy, upstream_schedule_tag.name, downstream_schedule_tag.name)
+        if (fns := self._fns.get(key)) is None:
+            # setdefault is atomic, so all threads get the same functions even if they are built concurrently
+            fns = self._fns.setdefault(
+                key, _build_execution_date_fns(wait_policy, upstream_schedule_tag, downstream_schedule_tag)
+            )
+        return fns
+
+
+EXECUTION_DATE_FNS = ExecutionDateFnTable(
+    schedule_tag.value() for schedule_tag in EScheduleTag if schedule_tag.default_cron_expression is not None
+)
@@ -10,6 +10,9 @@ OTHER_DBT_CLI_OPTIONS_DEFAULT = {'--option': 'value'}
 DBT_CLI_COMMAND_EXTRA_OPTIONS = '_dbt_cli_command_extra_options'
 DBT_CLI_COMMAND_EXTRA_FLAGS = '_dbt_cli_command_extra_flags'
 
+# on-demand backfill DAGs' params
+BACKFILL_MODELS_PARAM = 'backfill_models'
+
 DEFAULT_DAG_ARGS = {'owner': 'airflow', 'retries': 1, 'retry_delay': datetime.timedelta(minutes=1)}
 
 # tag for DBT dags in airflow that have regular schedule (not @manual)
@@ -1,12 +1,147 @@
+import calendar
 import datetime
+import re
+from typing import Callable, Iterator, Optional
 
 from attrs import define, field
 from croniter import croniter, croniter_range
 
+# the first Sunday after unix epoch, ticks of periodic calendars are counted from it
+_EPOCH_SUNDAY = datetime.datetime(1970, 1, 4)
+
+
+@define(frozen=True)
+class _PeriodicCalendar:
+    """
+    Ticks of cron expressions with a fixed period: every 15 minutes, hourly, daily and weekly ones.
+    """
+
+    anchor: datetime.datetime
+    period: datetime.timedelta
+
+    def _floor(self, dttm: datetime.datetime) -> datetime.datetime:
+        return dttm - (dttm - self.anchor) % self.period
+
+    def next_run(self, dttm: datetime.datetime) -> datetime.datetime:
+        return self._floor(dttm) + self.period
+
+    def prev_run(self, dttm: datetime.datetime) -> datetime.datetime:
+        tick = self._floor(dttm)
+        return tick - self.period if tick == dttm else tick
+
+    def runs_between(self, start: datetime.datetime, stop: datetime.datetime) -> list[datetime.datetime]:
+        tick = self._floor(start)
+        if tick < start:
+            tick += self.period
+        n_runs = (stop - tick) // self.period + 1 if tick <= stop else 0
+        return [tick + self.period * i for i in range(n_runs)]
+
+
+@define(frozen=True)
+class _MonthlyCalendar:
+    """
+    Ticks of monthly cron expressions; months without the day of month are skipped.
+    """
+
+    day: int
+    hour: int
+    minute: int
+
+    def _ticks(self, year: int, month: int, step: int) -> Iterator[datetime.datetime]:
+        month_index = year * 12 + month - 1
+        while True:
+            year, month = divmod(month_index, 12)
+            if self.day <= calendar.monthrange(year, month + 1)[1]:
+                yield datetime.datetime(year, month + 1, self.day, self.hour, self.minute)
+            month_index += step
+
+    def next_run(self, dttm: datetime.datetime) -> datetime.datetime:
+        return next(tick for tick in self._ticks(dttm.year, dttm.month, 1) if tick > dttm)
+
+    def prev_run(self, dttm: datetime.datetime) -> datetime.datetime:
+        return next(tick for tick in self._ticks(dttm.year, dttm.month, -1) if tick < dttm)
+
+    def runs_between(self, start: datetime.datetime, stop: datetime.datetime) -> list[datetime.datetime]:
+        runs = []
+        for tick in self._ticks(start.year, start.month, 1):
+            if tick > stop:
+                return runs
+            if tick >= start:
+                runs.append(tick)
+
+
+def _periodic(minutes: int, offset: Callable[..., datetime.timedelta]) -> Callable[..., _PeriodicCalendar]:
+    return lambda *parts: _PeriodicCalendar(_EPOCH_SUNDAY + offset(*parts), datetime.timedelta(minutes=minutes))
+
+
+# cron expressions of built-in schedule tags (see `BaseScheduleTag.af_repr`) by their calendars
+_CALENDARS: list[tuple[re.Pattern, Callable[..., _PeriodicCalendar | _MonthlyCalendar]]] = [
+    (
+        re.compile(r'\*/15 \* \* \* \*'),
+        _periodic(15, lambda: datetime.timedelta()),
+    ),
+    (
+        re.compile(r'([0-9]|1[0-4])-59/15 \* \* \* \*'),
+        _periodic(15, lambda minute: datetime.timedelta(minutes=int(minute))),
+    ),
+    (
+        re.compile(r'([0-5]?[0-9]) \* \* \* \*'),
+        _periodic(60, lambda minute: datetime.timedelta(minutes=int(minute))),
+    ),
+    (
+        re.compile(r'([0-5]?[0-9]) (1?[0-9]|2[0-3]) \* \* \*'),
+        _periodic(24 * 60, lambda minute, hour: datetime.timedelta(hours=int(hour), minutes=int(minute))),
+    ),
+    (
+        re.compile(r'([0-5]?[0-9]) (1?[0-9]|2[0-3]) \* \* ([0-6])'),
+        _periodic(
+            7 * 24 * 60,
+            lambda minute, hour, weekday: datetime.timedelta(days=int(weekday), hours=int(hour), minutes=int(minute)),
+        ),
+    ),
+    (
+        re.compile(r'([0-5]?[0-9]) (1?[0-9]|2[0-3]) ([1-9]|[12][0-9]|3[01]) \* \*'),
+        lambda minute, hour, day: _MonthlyCalendar(int(day), int(hour), int(minute)),
+    ),
+]
+
+
+def _find_calendar(raw_cron_expression: str) -> Optional[_PeriodicCalendar | _MonthlyCalendar]:
+    for pattern, build_calendar in _CALENDARS:
+        if match := pattern.fullmatch(raw_cron_expression):
+            return build_calendar(*match.groups())
+    return None
+
+
+def _validate_cron_expression(_, __, raw_cron_expression: str):
+    # cron expressions of built-in schedule tags are valid by construction, so they don't go through croniter
+    if _find_calendar(raw_cron_expression) is None:
+        croniter.is_valid(raw_cron_expression)
+
+
+def _is_utc(dttm: datetime.datetime) -> bool:
+    # cron ticks of other timezones depend on their DST transitions
+    return dttm.tzinfo is None or dttm.tzname() == 'UTC'
+
+
+def _naive(dttm: datetime.datetime) -> datetime.datetime:
+    return datetime.datetime(
+        dttm.year, dttm.month, dttm.day, dttm.hour, dttm.minute, dttm.second, dttm.microsecond, fold=dttm.fold
+    )
+
 
 @define(order=False)
 class CronExpression:
-    raw_cron_expression: str = field(validator=lambda _, __, val: croniter.is_valid(val))
+    """
+    Cron expression with its ticks. Ticks of cron expressions of built-in schedule tags are computed in closed form,
+    others go through croniter. Results are the same as of croniter: plain datetimes in the timezone of arguments.
+    """
+
+    raw_cron_expression: str = field(validator=_validate_cron_expression)
+    _calendar: Optional[_PeriodicCalendar | _MonthlyCalendar] = field(init=False, eq=False, repr=False)
+
+    def __attrs_post_init__(self):
+        self._calendar = _find_calendar(self.raw_cron_expression)
 
     def __eq__(self, other):
         if not isinstance(other, (CronExpression, str)):
@@ -15,15 +150,36 @@ class CronExpression:
             return self.raw_cron_expression == other
         return self.raw_cron_expression == other.raw_cron_expression
 
+    def next_run(self, dttm: datetime.datetime) -> datetime.datetime:
+        """
+        The first tick after `dttm`.
+        """
+        if self._calendar is None or not _is_utc(dttm):
+            return croniter(self.raw_cron_expression, dttm).get_next(datetime.datetime)
+        return self._calendar.next_run(_naive(dttm)).replace(tzinfo=dttm.tzinfo)
+
+    def prev_run(self, dttm: datetime.datetime) -> datetime.datetime:
+        """
+        The last tick before `dttm`.
+        """
+        if self._calendar is None or not _is_utc(dttm):
+            return croniter(self.raw_cron_expression, dttm).get_prev(datetime.datetime)
+        return self._calendar.prev_run(_naive(dttm)).replace(tzinfo=dttm.tzinfo)
+
+    def runs_between(self, start: datetime.datetime, stop: datetime.datetime) -> list[datetime.datetime]:
+        """
+        All ticks between `start` and `stop`, both ends are inclusive.
+        """
+        if self._calendar is None or not _is_utc(start) or not _is_utc(stop):
+            return list(croniter_range(start, stop, self.raw_cron_expression, ret_type=datetime.datetime))
+        return [tick.replace(tzinfo=start.tzinfo) for tick in self._calendar.runs_between(_naive(start), _naive(stop))]
+
     def distance_between_two_runs(self) -> datetime.timedelta:
         """
         Calculate the time difference between two consecutive runs of the cron expression.
         """
-        now = datetime.datetime.now()
-        cron_iter = croniter(self.raw_cron_expression, now)
-        next_run = cron_iter.get_next(datetime.datetime)
-        after_next_run = cron_iter.get_next(datetime.datetime)
-        return after_next_run - next_run
+        next_run = self.next_run(datetime.datetime.now())
+        return self.next_run(next_run) - next_run
 
     def embeddings_number(self, other: 'CronExpression | None', is_upstream_bigger: bool) -> int:
         """
@@ -36,20 +192,10 @@ class CronExpression:
         if is_upstream_bigger:
             return 0
 
-        now = datetime.datetime.now()
-        self_cron_iter = croniter(self.raw_cron_expression, now)
-        start_interval = self_cron_iter.get_next(datetime.datetime)
-        end_interval = self_cron_iter.get_next(datetime.datetime)
-
-        dts = list(
-            croniter_range(
-                start_interval,
-                end_interval,
-                other.raw_cron_expression,
-                ret_type=datetime.datetime,
-                expand_from_start_time=True,
-            )
-        )
+        start_interval = self.next_run(datetime.datetime.now())
+        end_interval = self.next_run(start_interval)
+
+        dts = other.runs_between(start_interval, end_interval)
         if dts and dts[-1] == end_interval:
             # both ends are inclusive, so we need to remove the last element if it's equal to the end_interval
             dts.pop()
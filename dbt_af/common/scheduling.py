@@ -2,23 +2,60 @@ import datetime
 import re
 from abc import ABC, abstractmethod
 from enum import Enum
-from functools import cache
+from typing import ClassVar
 
 from dbt_af.common.cron import CronExpression
 
 
 class BaseScheduleTag(ABC):
+    """
+    Schedule of dbt models: base schedule and its timeshift. Tags are interned by their class and timeshift, so each
+    distinct schedule is created once per process, and all its representations are computed only then.
+    """
+
     default_timeshift = datetime.timedelta()
 
-    def __init__(self, timeshift: datetime.timedelta | None = None):
+    # interned tags by their class and timeshift, both requested and normalized ones
+    _registry: ClassVar[dict[tuple[type, datetime.timedelta | None], 'BaseScheduleTag']] = {}
+
+    def __new__(cls, timeshift: datetime.timedelta | None = None):
+        tag = cls._registry.get((cls, timeshift))
+        if tag is not None:
+            return tag
+
+        normalized_timeshift = cls._normalize_timeshift(timeshift)
+        tag = cls._registry.get((cls, normalized_timeshift))
+        if tag is None:
+            tag = super().__new__(cls)
+            tag._init(normalized_timeshift)
+            cls._registry[(cls, normalized_timeshift)] = tag
+        if timeshift is None or timeshift == normalized_timeshift:
+            # clamped timeshifts are not interned, the max timeshift of monthly tags depends on the current month
+            cls._registry[(cls, timeshift)] = tag
+        return tag
+
+    @classmethod
+    def _normalize_timeshift(cls, timeshift: datetime.timedelta | None) -> datetime.timedelta | None:
         if timeshift is not None:
-            if self.default_cron_expression is None:
+            if cls.default_cron_expression is None:
                 raise ValueError('Cannot set timeshift for manual schedule tag')
 
             # if timeshift is greater than max timeshift, set it to max timeshift - 1 minute
-            max_timeshift = self.default_cron_expression.distance_between_two_runs()
+            max_timeshift = cls.default_cron_expression.distance_between_two_runs()
             timeshift = min(timeshift, max_timeshift - datetime.timedelta(minutes=1))
-        self.timeshift = timeshift or self.default_timeshift
+        return timeshift or cls.default_timeshift
+
+    def _init(self, timeshift: datetime.timedelta | None):
+        self.timeshift = timeshift
+        self._name = self._build_name()
+        self._hash = hash(self._name)
+        self._safe_name = re.sub(r'^@', 'dbt_', self._name)
+        self._af_repr = self._build_af_repr()
+        self._cron_expression = CronExpression(self._af_repr) if self._af_repr is not None else None
+
+    def __reduce__(self):
+        # unpickled tags are interned as well
+        return type(self), (self.timeshift,)
 
     @property
     @abstractmethod
@@ -27,6 +64,9 @@ class BaseScheduleTag(ABC):
 
     @property
     def name(self) -> str:
+        return self._name
+
+    def _build_name(self) -> str:
         if self.timeshift == self.default_timeshift or self.timeshift is None:
             return self.base_name
 
@@ -65,7 +105,7 @@ class BaseScheduleTag(ABC):
         return self.name
 
     def __hash__(self):
-        return hash(self.name)
+        return self._hash
 
     def __lt__(self, other):
         if not isinstance(other, BaseScheduleTag):
@@ -75,6 +115,8 @@ class BaseScheduleTag(ABC):
         return self.level < other.level
 
     def __eq__(self, other: 'str | BaseScheduleTag'):
+        if self is other:
+            return True
         if isinstance(other, str):
             return self.base_name == other
         if isinstance(other, BaseScheduleTag):
@@ -83,7 +125,7 @@ class BaseScheduleTag(ABC):
 
     @property
     def safe_name(self):
-        return re.sub(r'^@', 'dbt_', self.name)
+        return self._safe_name
 
     def split_timeshift(self) -> tuple[int, int, int]:
         full_days_shift = self.timeshift.days
@@ -92,20 +134,19 @@ class BaseScheduleTag(ABC):
 
         return full_days_shift, full_hours_shift, rest_minutes_shift
 
-    @cache
     def af_repr(self) -> str | None:
         """
         Returns airflow-like schedule representation.
         Could be cron expression or None if there's no schedule.
         """
+        return self._af_repr
+
+    def _build_af_repr(self) -> str | None:
         full_days_shift, full_hours_shift, rest_minutes_shift = self.split_timeshift()
         return self._af_repr_impl(full_days_shift, full_hours_shift, rest_minutes_shift)
 
     def cron_expression(self) -> CronExpression | None:
-        af_schedule = self.af_repr()
-        if af_schedule is None:
-            return None
-        return CronExpression(af_schedule)
+        return self._cron_expression
 
 
 class _MonthlyScheduleTag(BaseScheduleTag):
@@ -202,15 +243,16 @@ class _ManualScheduleTag(BaseScheduleTag):
     default_cron_expression = None
     level = 0
 
-    def __init__(self, timeshift: datetime.timedelta | None = None):
-        super().__init__(timeshift)
-        self.timeshift = None
+    @classmethod
+    def _normalize_timeshift(cls, timeshift: datetime.timedelta | None) -> None:
+        super()._normalize_timeshift(timeshift)
+        return None
 
     @staticmethod
     def _af_repr_impl(full_days_shift: int, full_hours_shift: int, rest_minutes_shift: int):
         return None
 
-    def af_repr(self):
+    def _build_af_repr(self):
         # there's no schedule for manual DAGs
         return None
 
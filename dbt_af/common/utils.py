@@ -4,11 +4,13 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, MutableMapping, Optional
 
+from airflow.exceptions import AirflowException
 from airflow.models import Variable
 from airflow.utils.context import Context
 from cachetools import TTLCache, cached
 
 from dbt_af.common.constants import (
+    BACKFILL_MODELS_PARAM,
     DBT_CLI_COMMAND_EXTRA_FLAGS,
     DBT_CLI_COMMAND_EXTRA_OPTIONS,
     OTHER_DBT_CLI_OPTIONS,
@@ -82,3 +84,28 @@ def build_dbt_run_model_bash_extra_options(params: MutableMapping[str, Any]) ->
             bash_options[option_name] = option_value
 
     return bash_options, bash_flags
+
+
+def is_model_selected_to_backfill(params: MutableMapping[str, Any], model_name: str) -> bool:
+    """
+    Used only for on-demand backfill DAGs: models not listed in `backfill_models` param are skipped, and all models
+    are run if the param is empty or not set.
+    """
+    selected_models = params.get(BACKFILL_MODELS_PARAM)
+    return not selected_models or model_name in selected_models
+
+
+def get_user_defined_interval(params: MutableMapping[str, Any]) -> Optional[tuple[str, str]]:
+    """
+    Returns interval of `start_dttm` and `end_dttm` params if both of them are set and differ, otherwise the interval
+    of DAG run should be used.
+    """
+    start_dttm, end_dttm = params.get('start_dttm'), params.get('end_dttm')
+    if (start_dttm is None) != (end_dttm is None):
+        raise AirflowException(
+            f'Both start_dttm and end_dttm params must be set to run for a custom interval, '
+            f'got start_dttm={start_dttm!r} and end_dttm={end_dttm!r}'
+        )
+    if start_dttm is None or start_dttm == end_dttm:
+        return None
+    return start_dttm, end_dttm
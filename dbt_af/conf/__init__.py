@@ -1,21 +1,27 @@
 from dbt_af.conf.config import (
+    BackfillConfig,
     Config,
     CustomAfCallbacksConfig,
     DbtDefaultTargetsConfig,
     DbtProjectConfig,
+    GraphCacheConfig,
     K8sConfig,
     MCDIntegrationConfig,
+    ParallelParsingConfig,
     RetriesConfig,
     RetryPolicy,
     TableauIntegrationConfig,
 )
 
 __all__ = [
+    'BackfillConfig',
     'Config',
     'DbtDefaultTargetsConfig',
     'DbtProjectConfig',
+    'GraphCacheConfig',
     'K8sConfig',
     'MCDIntegrationConfig',
+    'ParallelParsingConfig',
     'TableauIntegrationConfig',
     'CustomAfCallbacksConfig',
     'RetriesConfig',
@@ -57,9 +57,12 @@ class ModelDependenciesSection:
     Section to parametrize how model dependencies are handled.
 
     :param wait_policy: policy to build waits for models' dependencies
+    :param reduce_transitive_edges: whether to remove task edges implied by other paths within each DAG; it doesn't
+        change execution, but reduces number of dependencies that airflow scheduler checks and size of serialized DAGs
     """
 
     wait_policy: DependencyWaitPolicy = attrs.field(factory=DependencyWaitPolicy)
+    reduce_transitive_edges: bool = attrs.field(default=False, validator=attrs.validators.instance_of(bool))
 
 
 @attrs.define(frozen=True)
@@ -195,6 +198,23 @@ class DbtDefaultTargetsConfig:
         object.__setattr__(self, 'default_backfill_target', self.default_backfill_target or self.default_target)
 
 
+@attrs.define(frozen=True)
+class BackfillConfig:
+    """
+    Config for backfill DAGs.
+
+    :param mode: how models are backfilled:
+        `scheduled` - each domain has DAG `<domain>__backfill` with all its models that is scheduled daily, but runs
+        models only when its DAG run is cleared;
+        `on_demand` - the same DAGs without schedule; they are triggered with an interval and models to backfill in
+        DAG params;
+        `project` - there are no backfill DAGs of domains, the only DAG `<project>_dbt_backfill` without schedule runs
+        dbt selector given in DAG params on the default backfill target
+    """
+
+    mode: str = attrs.field(default='scheduled', validator=attrs.validators.in_(('scheduled', 'on_demand', 'project')))
+
+
 @attrs.define(frozen=True)
 class K8sConfig:
     """
@@ -208,6 +228,53 @@ class K8sConfig:
     airflow_identity_binding_selector: str = attrs.field(default=None)
 
 
+@attrs.define(frozen=True)
+class GraphCacheConfig:
+    """
+    Config for on-disk cache of built dbt-af graph.
+    The cache entry is keyed by hash of manifest.json, profiles.yml, dbt_project.yml and dbt-af config, so the graph is
+    rebuilt only when one of them changes (usually on deploy).
+
+    :param cache_dir: directory to store cache entries; it's safe to share it between several processes
+    :param max_entries: max number of cache entries to keep; the least recently used entries are removed first
+    :param max_size_mb: max total size of cache entries in megabytes
+    :param incremental_rebuild: on manifest change, rebuild only domains affected by changed nodes and reuse the rest
+        of the latest cached graph built with the same profiles and config
+    """
+
+    cache_dir: str | Path = attrs.field(validator=attrs.validators.instance_of((str, Path)), converter=Path)
+    max_entries: int = attrs.field(default=8, validator=attrs.validators.instance_of(int))
+    max_size_mb: int = attrs.field(default=512, validator=attrs.validators.instance_of(int))
+    incremental_rebuild: bool = attrs.field(default=True, validator=attrs.validators.instance_of(bool))
+
+
+@attrs.define(frozen=True)
+class ParallelParsingConfig:
+    """
+    Config to validate manifest nodes in a process pool.
+    Validation of nodes dominates graph building on big projects, but starting a pool has its own overhead, so
+    manifests with less than `min_nodes` nodes are always parsed serially.
+
+    :param min_nodes: min number of manifest nodes to switch to parallel parsing
+    :param chunk_size: number of nodes validated by one worker at once
+    :param max_workers: max number of worker processes; if not specified, then number of CPUs is used
+    :param start_method: multiprocessing start method for workers; `forkserver` is used by default, because forking
+        a multithreaded process (e.g. airflow scheduler or DAG processor) could deadlock workers; `fork` starts workers
+        faster, but it's safe only if DAG file is parsed in a single-threaded process
+    """
+
+    min_nodes: int = attrs.field(default=10_000, validator=attrs.validators.instance_of(int))
+    chunk_size: int = attrs.field(default=2_000, validator=attrs.validators.instance_of(int))
+    max_workers: Optional[int] = attrs.field(
+        default=None,
+        validator=attrs.validators.optional(attrs.validators.instance_of(int)),
+    )
+    start_method: str = attrs.field(
+        default='forkserver',
+        validator=attrs.validators.in_(('fork', 'forkserver', 'spawn')),
+    )
+
+
 @attrs.define(frozen=True)
 class RetryPolicy:
     """
@@ -289,6 +356,7 @@ class Config:
     :param dbt_default_targets: default dbt targets for different operators
     :param dbt_executable_path: path to dbt executable to run tasks
     :param model_dependencies: section to parametrize how model dependencies are handled
+    :param backfill: config for backfill DAGs
     :param include_single_model_manual_dag: whether to include single model manual dag; it will create airflow dag
         without schedule, only with manual trigger and preset trigger form, where model name and date interval can be
         specified
@@ -308,6 +376,10 @@ class Config:
     :param mcd: config for mcd integration; must be installed as extra dependency
     :params tableau: config for Tableau integration
     :param k8s: settings for k8s operators
+    :param graph_cache: config for on-disk cache of built dbt-af graph; if not specified, then graph is built from
+        manifest on each DAG file parse
+    :param parallel_parsing: config to validate manifest nodes in a process pool; if not specified, then nodes are
+        validated serially
 
     :param is_dev: (deprecated) use `dry_run` instead
     """
@@ -319,6 +391,7 @@ class Config:
     dbt_default_targets: DbtDefaultTargetsConfig = attrs.field()
     dbt_executable_path: str = attrs.field(default='dbt')
     model_dependencies: ModelDependenciesSection = attrs.field(factory=ModelDependenciesSection)
+    backfill: BackfillConfig = attrs.field(factory=BackfillConfig)
     include_single_model_manual_dag: bool = attrs.field(default=True)
     debug_mode_enabled: bool = attrs.field(default=True)
 
@@ -342,6 +415,10 @@ class Config:
     # k8s
     k8s: K8sConfig = attrs.field(factory=K8sConfig)
 
+    # compilation
+    graph_cache: Optional[GraphCacheConfig] = attrs.field(default=None)
+    parallel_parsing: Optional[ParallelParsingConfig] = attrs.field(default=None)
+
     # DEPRECATED fields
     is_dev: bool = attrs.field(default=False)
 
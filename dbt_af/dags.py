@@ -1,14 +1,21 @@
 import datetime as dt
-import json
-from typing import Optional
+import logging
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable, Optional
 
 import yaml
 from airflow.models.dag import DAG
 from airflow.models.param import Param
+from airflow.utils.dag_parsing_context import get_parsing_context
 
-from dbt_af.builder.dbt_af_builder import BackfillDomainDag, DbtAfGraph, get_domain_dag_start_date
+from dbt_af.builder.dag_materializer import DagMaterializer
+from dbt_af.builder.dbt_af_builder import DbtAfGraph, plan_dags, split_domains
+from dbt_af.builder.graph_cache import DbtAfGraphCache, graph_cache_base_key, graph_cache_key
+from dbt_af.builder.incremental import IncrementalRebuildError, ManifestFingerprints, rebuild_graph
 from dbt_af.common.af_callbacks import collect_af_custom_callbacks
 from dbt_af.common.constants import (
+    BACKFILL_TAG,
     DBT_CLI_COMMAND_EXTRA_FLAGS,
     DBT_CLI_COMMAND_EXTRA_OPTIONS,
     DBT_MODEL_DAG_PARAM,
@@ -18,53 +25,55 @@ from dbt_af.common.constants import (
 )
 from dbt_af.conf import Config
 from dbt_af.operators.run import DbtRun
+from dbt_af.parser.dbt_manifest_loader import load_manifest
+from dbt_af.parser.dbt_nodes_parser import (
+    DBT_AF_RESOURCE_TYPES,
+    get_node_info_domain,
+    parse_dbt_nodes,
+    select_etl_services_nodes_info,
+)
+from dbt_af.parser.dbt_profiles import Profiles
+from dbt_af.parser.dbt_source_model import DbtSource
 
 
 def dbt_main_dags(graph: DbtAfGraph) -> dict[str, DAG]:
-    af_dags = {}
-
     dag_callbacks, task_callbacks = collect_af_custom_callbacks(graph.config)
-    domains = {node.domain_dag for node in graph.nodes}
-
-    for domain_dag in domains:
-        dag = DAG(
-            domain_dag.dag_name,
-            start_date=get_domain_dag_start_date(graph, domain_dag),
-            description=graph.config.af_dag_description,
-            schedule=domain_dag.schedule.af_repr(),
-            catchup=domain_dag.catchup if not graph.config.dry_run else False,
-            default_args=DEFAULT_DAG_ARGS,
-            max_active_runs=graph.config.max_active_dag_runs,
-            render_template_as_native_obj=False,
-            tags=['dbt'] + domain_dag.tags,
-            **dag_callbacks,
-        )
-        domain_dag.af_dag = dag
-        af_dags[domain_dag.dag_name] = dag
-
-        if isinstance(domain_dag, BackfillDomainDag):
-            domain_dag.wrap_dag_with_endpoints()
+    materializer = DagMaterializer(graph.config, dag_callbacks, task_callbacks)
+    return {dag_id: materializer.materialize(plan) for dag_id, plan in plan_dags(graph).items()}
 
-    for node in graph.nodes:
-        node.domain_dag.af_dag = af_dags[node.domain_dag.dag_name]
 
-    for node in graph.nodes:
-        node.add_af_callbacks(task_callbacks)
-        if node.af_component is None:
-            node.init_af()
+def dbt_run_model_dag_name(config: Config) -> str:
+    return f'{config.dbt_project.dbt_project_name}_dbt_run_model'
 
-    for node in graph.nodes:
-        if isinstance(node.domain_dag, BackfillDomainDag):
-            start_task = node.domain_dag.start_endpoint
-            if len(node.af_component.upstream_task_ids) == 0:
-                start_task >> node.af_component
 
-    return af_dags
+def dbt_backfill_dag_name(config: Config) -> str:
+    return f'{config.dbt_project.dbt_project_name}_dbt_backfill'
 
 
 def dbt_run_model_dag(config: Config) -> dict[str, DAG]:
+    return _dbt_selector_dag(
+        config,
+        dbt_run_model_dag_name(config),
+        tags=[],
+        target_environment=config.dbt_default_targets.default_target,
+    )
+
+
+def dbt_backfill_dag(config: Config) -> dict[str, DAG]:
+    """
+    DAG to backfill models of the whole project when `config.backfill.mode` is `project`: it's triggered with dbt
+    selector and interval and runs them on the default backfill target.
+    """
+    return _dbt_selector_dag(
+        config,
+        dbt_backfill_dag_name(config),
+        tags=[BACKFILL_TAG],
+        target_environment=config.dbt_default_targets.default_backfill_target,
+    )
+
+
+def _dbt_selector_dag(config: Config, dag_name: str, tags: list[str], target_environment: str) -> dict[str, DAG]:
     dbt_project_name = config.dbt_project.dbt_project_name
-    dag_name = f'{dbt_project_name}_dbt_run_model'
 
     dag_callbacks, task_callbacks = collect_af_custom_callbacks(config)
     dag = DAG(
@@ -75,7 +84,7 @@ def dbt_run_model_dag(config: Config) -> dict[str, DAG]:
         catchup=False,
         default_args=DEFAULT_DAG_ARGS,
         max_active_runs=config.max_active_dag_runs,
-        tags=[dbt_project_name, 'dbt', 'system'],
+        tags=[dbt_project_name, 'dbt', 'system', *tags],
         params={
             DBT_MODEL_DAG_PARAM: Param(
                 '',
@@ -139,7 +148,6 @@ def dbt_run_model_dag(config: Config) -> dict[str, DAG]:
         **dag_callbacks,
     )
 
-    target_environment = config.dbt_default_targets.default_target
     DbtRun(
         task_id='dbt_model',
         model_name=None,
@@ -152,41 +160,312 @@ def dbt_run_model_dag(config: Config) -> dict[str, DAG]:
     return {dag_name: dag}
 
 
-def _compile_dbt_dags(
-    manifest_content: dict,
-    profiles: dict,
-    project_profile_name: str,
+def _system_dag_names(config: Config) -> list[str]:
+    names = []
+    if config.include_single_model_manual_dag:
+        names.append(dbt_run_model_dag_name(config))
+    if config.backfill.mode == 'project':
+        names.append(dbt_backfill_dag_name(config))
+    return names
+
+
+def _system_dags(config: Config, dag_id: Optional[str] = None) -> dict[str, DAG]:
+    """
+    System DAGs of the project; if `dag_id` is given, then only this DAG is built.
+    """
+    dags = {}
+    if dag_id in (None, dbt_run_model_dag_name(config)) and config.include_single_model_manual_dag:
+        dags.update(dbt_run_model_dag(config=config))
+    if dag_id in (None, dbt_backfill_dag_name(config)) and config.backfill.mode == 'project':
+        dags.update(dbt_backfill_dag(config=config))
+    return dags
+
+
+def _dags_from_graph(graph: DbtAfGraph, config: Config, include_system_dags: bool = True) -> dict[str, DAG]:
+    dags = {}
+
+    dags.update(dbt_main_dags(graph))
+    if include_system_dags:
+        dags.update(_system_dags(config))
+
+    return dags
+
+
+def _load_compile_inputs(manifest_path: str, config: Config) -> tuple[dict, dict, str]:
+    manifest = load_manifest(manifest_path)
+
+    with open(config.dbt_project.dbt_profiles_path / 'profiles.yml') as fin:
+        profiles = yaml.safe_load(fin)
+
+    with open(config.dbt_project.dbt_project_path / 'dbt_project.yml') as fin:
+        dbt_project_profile_name = yaml.safe_load(fin)['profile']
+
+    return manifest, profiles, dbt_project_profile_name
+
+
+def _build_graph(
+    manifest_path: str,
+    config: Config,
+    etl_service_name: Optional[str] = None,
+    domains: Optional[Iterable[str]] = None,
+) -> DbtAfGraph:
+    manifest, profiles, dbt_project_profile_name = _load_compile_inputs(manifest_path, config)
+
+    return DbtAfGraph.from_manifest(
+        manifest, profiles, dbt_project_profile_name, etl_service_name=etl_service_name, config=config, domains=domains
+    )
+
+
+def _build_dag_graph(
+    manifest_path: str,
+    config: Config,
+    dag_id: str,
+    etl_service_name: Optional[str] = None,
+    domains: Optional[Iterable[str]] = None,
+) -> DbtAfGraph:
+    """
+    Builds graph with components of one domain dag only; other nodes are validated only if they are upstreams.
+    """
+    manifest, profiles, dbt_project_profile_name = _load_compile_inputs(manifest_path, config)
+
+    # all domain dag names start with the domain name, but domain name itself could contain '__'
+    dag_domains = {
+        get_node_info_domain(node_info)
+        for node_info in manifest['nodes'].values()
+        if node_info['resource_type'] in DBT_AF_RESOURCE_TYPES
+    }
+    dag_domains = {domain for domain in dag_domains if dag_id.startswith(f'{domain}__')}
+    if domains is not None:
+        dag_domains &= set(domains)
+
+    graph = DbtAfGraph.from_manifest(
+        manifest,
+        profiles,
+        dbt_project_profile_name,
+        etl_service_name=etl_service_name,
+        config=config,
+        domains=dag_domains,
+    )
+    return graph.select_dag(dag_id)
+
+
+def _compile_dag_in_parsing_context(
+    manifest_path: str,
     config: Config,
+    dag_id: str,
     etl_service_name: Optional[str] = None,
+    domains: Optional[Iterable[str]] = None,
 ) -> dict[str, DAG]:
-    dags = {}
+    if dag_id in _system_dag_names(config):
+        return _system_dags(config, dag_id) if domains is None else {}
+
+    if config.graph_cache is not None:
+        graph = _build_graph_with_cache(manifest_path, config, etl_service_name=etl_service_name)
+        if domains is not None:
+            graph = graph.select_domains(domains)
+        graph = graph.select_dag(dag_id)
+    else:
+        graph = _build_dag_graph(manifest_path, config, dag_id, etl_service_name=etl_service_name, domains=domains)
+
+    return dbt_main_dags(graph)
+
+
+def _rebuild_graph_incrementally(
+    graph_cache: DbtAfGraphCache,
+    base_key: str,
+    manifest_path: str,
+    config: Config,
+    etl_service_name: Optional[str] = None,
+) -> tuple[DbtAfGraph, ManifestFingerprints]:
+    manifest, profiles, dbt_project_profile_name = _load_compile_inputs(manifest_path, config)
+    fingerprints = ManifestFingerprints.from_manifest(manifest)
+
+    previous_key = graph_cache.latest_key(base_key)
+    previous_entry = graph_cache.load_entry(previous_key, config) if previous_key is not None else None
+    if previous_entry is not None and previous_entry.fingerprints is not None:
+        try:
+            graph = rebuild_graph(
+                previous_entry.graph,
+                previous_entry.fingerprints,
+                fingerprints,
+                manifest,
+                profiles,
+                dbt_project_profile_name,
+                config=config,
+                etl_service_name=etl_service_name,
+            )
+            return graph, fingerprints
+        except IncrementalRebuildError as e:
+            logging.warning(f'Failed to rebuild dbt-af graph incrementally, building it from scratch: {e}')
 
     graph = DbtAfGraph.from_manifest(
-        manifest_content, profiles, project_profile_name, etl_service_name=etl_service_name, config=config
+        manifest, profiles, dbt_project_profile_name, etl_service_name=etl_service_name, config=config
     )
+    return graph, fingerprints
 
-    dags.update(dbt_main_dags(graph))
-    if config.include_single_model_manual_dag:
-        dags.update(dbt_run_model_dag(config=config))
 
-    return dags
+def _build_graph_with_cache(manifest_path: str, config: Config, etl_service_name: Optional[str] = None) -> DbtAfGraph:
+    graph_cache = DbtAfGraphCache(config.graph_cache)
+    profiles_path = config.dbt_project.dbt_profiles_path / 'profiles.yml'
+    dbt_project_path = config.dbt_project.dbt_project_path / 'dbt_project.yml'
+    cache_key = graph_cache_key(
+        manifest_path,
+        profiles_path,
+        dbt_project_path,
+        config=config,
+        etl_service_name=etl_service_name,
+    )
+
+    graph = graph_cache.load(cache_key, config)
+    if graph is not None:
+        return graph
+
+    fingerprints = None
+    if config.graph_cache.incremental_rebuild:
+        graph, fingerprints = _rebuild_graph_incrementally(
+            graph_cache,
+            graph_cache_base_key(profiles_path, dbt_project_path, config=config, etl_service_name=etl_service_name),
+            manifest_path,
+            config,
+            etl_service_name=etl_service_name,
+        )
+    else:
+        graph = _build_graph(manifest_path, config, etl_service_name=etl_service_name)
 
+    try:
+        graph_cache.save(cache_key, graph, fingerprints)
+    except Exception as e:
+        # cache is only an optimization, so DAGs must be built even if it's not writable
+        logging.warning(f'Failed to save dbt-af graph to cache {graph_cache.cache_dir}: {e}')
 
-def compile_dbt_af_dags(manifest_path: str, config: Config, etl_service_name: Optional[str] = None) -> dict[str, DAG]:
+    return graph
+
+
+def get_domains_partitions(
+    manifest_path: str,
+    n_partitions: int,
+    etl_service_name: Optional[str] = None,
+) -> list[list[str]]:
+    """
+    Splits domains of the project into `n_partitions` groups with roughly equal number of dbt nodes. Pass each group
+    as `domains` to `compile_dbt_af_dags` in its own DAG file, so DAGs are built in parallel by airflow DAG processors.
+    Nodes are not validated here, and partitions are the same in all DAG files for the same manifest.
+    """
+    manifest = load_manifest(manifest_path)
+    etl_service_names = [etl_service_name] if etl_service_name is not None else None
+
+    domains_weights = defaultdict(int)
+    for node_info in select_etl_services_nodes_info(manifest['nodes'], etl_service_names).values():
+        domains_weights[get_node_info_domain(node_info)] += 1
+
+    return split_domains(domains_weights, n_partitions)
+
+
+def compile_dbt_af_dags_for_etl_services(
+    manifest_path: str,
+    config: Config,
+    etl_service_names: Iterable[str],
+) -> dict[str, dict[str, DAG]]:
+    """
+    Compiles airflow DAGs for several etl services at once; the result for each service is the same as of
+    `compile_dbt_af_dags` with its `etl_service_name`.
+    Manifest is loaded and nodes of all services are validated only once, then graph of each service is built from
+    the shared pool of parsed nodes. Graph cache is not used here.
+    """
+    etl_service_names = list(etl_service_names)
+    manifest, profiles, dbt_project_profile_name = _load_compile_inputs(manifest_path, config)
+
+    # raw nodes are filtered by path once, so nodes out of all services are never validated
+    etl_services_node_ids = {
+        etl_service_name: set(select_etl_services_nodes_info(manifest['nodes'], [etl_service_name]))
+        for etl_service_name in etl_service_names
+    }
+    nodes = parse_dbt_nodes(
+        {
+            unique_id: node_info
+            for unique_id, node_info in manifest['nodes'].items()
+            if any(unique_id in node_ids for node_ids in etl_services_node_ids.values())
+        },
+        Profiles(**profiles)[dbt_project_profile_name],
+        config.dbt_default_targets,
+        parallel_parsing=config.parallel_parsing,
+    )
+    sources = [DbtSource(**source_info) for source_info in manifest['sources'].values()]
+
+    dag_id = get_parsing_context().dag_id
+    etl_services_dags = {}
+    for etl_service_name, node_ids in etl_services_node_ids.items():
+        graph = DbtAfGraph.from_nodes([node for node in nodes if node.unique_id in node_ids], sources, config)
+        if dag_id is not None:
+            # only one DAG is needed by airflow worker, see `compile_dbt_af_dags`
+            graph = graph.select_dag(dag_id)
+        etl_services_dags[etl_service_name] = _dags_from_graph(
+            graph,
+            config,
+            include_system_dags=dag_id is None or dag_id in _system_dag_names(config),
+        )
+
+    return etl_services_dags
+
+
+def compile_dbt_af_dags(
+    manifest_path: str,
+    config: Config,
+    etl_service_name: Optional[str] = None,
+    domains: Optional[Iterable[str]] = None,
+) -> dict[str, DAG]:
     """
     Compiles airflow DAGs from manifest according to provided dbt-af config.
     It's possible to use different etl service names for different model groups in one dbt project.
+    If `config.graph_cache` is set, then built graph is stored on disk and reused until manifest, profiles or config
+    are changed; on manifest change only domains affected by changed nodes are rebuilt.
+    If `domains` are given, then only DAGs of these domains are compiled; they are the same as in the full build, so
+    domains could be spread across several DAG files. System DAGs (e.g. `dbt_run_model`) are compiled only without
+    `domains`; use `dbt_run_model_dag` and `dbt_backfill_dag` directly to put them to a separate file.
+    If the file is parsed by airflow worker to run a single task, then only the DAG of this task is compiled.
     """
+    parsing_context = get_parsing_context()
+    if parsing_context.dag_id is not None:
+        return _compile_dag_in_parsing_context(
+            manifest_path,
+            config,
+            parsing_context.dag_id,
+            etl_service_name=etl_service_name,
+            domains=domains,
+        )
 
-    with open(manifest_path) as fin:
-        manifest = json.load(fin)
+    if config.graph_cache is not None:
+        # the full graph is cached, so it's shared by all DAG files compiling different domains
+        graph = _build_graph_with_cache(manifest_path, config, etl_service_name=etl_service_name)
+        if domains is not None:
+            graph = graph.select_domains(domains)
+    else:
+        graph = _build_graph(manifest_path, config, etl_service_name=etl_service_name, domains=domains)
 
-    with open(config.dbt_project.dbt_profiles_path / 'profiles.yml') as fin:
-        profiles = yaml.safe_load(fin)
+    return _dags_from_graph(graph, config, include_system_dags=domains is None)
 
-    with open(config.dbt_project.dbt_project_path / 'dbt_project.yml') as fin:
-        dbt_project_profile_name = yaml.safe_load(fin)['profile']
 
-    return _compile_dbt_dags(
-        manifest, profiles, dbt_project_profile_name, etl_service_name=etl_service_name, config=config
+def generate_static_dags(
+    manifest_path: str,
+    config: Config,
+    config_ref: str,
+    output_dir: str | Path,
+    etl_service_name: Optional[str] = None,
+) -> list[Path]:
+    """
+    Generates python module with a static DAG for each DAG of `compile_dbt_af_dags` and writes them to `output_dir`.
+    Generated modules import the config by `config_ref` (`module:attribute`) and build DAGs without manifest, so
+    they are parsed much faster. Only modules of changed DAGs are rewritten and modules of removed DAGs are deleted,
+    so each etl service needs its own `output_dir`. Returns paths of changed files.
+    System DAGs (e.g. `dbt_run_model`) are not generated, use `dbt_run_model_dag` and `dbt_backfill_dag` in
+    a separate DAG file.
+    """
+    # code generation isn't needed to compile DAGs, so it's not imported with this module
+    from dbt_af.builder.dag_codegen import DagModuleGenerator, write_dag_modules
+
+    graph = _build_graph(manifest_path, config, etl_service_name=etl_service_name)
+    generator = DagModuleGenerator(config, config_ref)
+
+    return write_dag_modules(
+        {dag_id: generator.generate(plan) for dag_id, plan in plan_dags(graph).items()}, output_dir
     )
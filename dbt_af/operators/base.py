@@ -1,23 +1,30 @@
+import copy
 import json
 import logging
 import shutil
 from datetime import timedelta
 from tempfile import TemporaryDirectory
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 try:
     import pydantic.v1 as pydantic
 except ModuleNotFoundError:
     import pydantic
 
+from airflow.models.param import ParamsDict
 from airflow.operators.bash import BashOperator
 from airflow.utils.context import Context
+from airflow.utils.helpers import validate_key
+from airflow.utils.task_group import TaskGroup, TaskGroupContext
 
-from dbt_af.common.constants import DBT_COMPILE_POOL
+from dbt_af.common.constants import BACKFILL_MODELS_PARAM, DBT_COMPILE_POOL
 from dbt_af.common.scheduling import BaseScheduleTag, EScheduleTag
-from dbt_af.common.utils import find_latest_log_file, init_environment
+from dbt_af.common.utils import find_latest_log_file, get_user_defined_interval, init_environment
 from dbt_af.conf import Config, RetryPolicy
 
+# mutable attributes of operators that are copied when operators are stamped from prototypes
+_COPIED_TYPES = frozenset({dict, list, set})
+
 
 def get_delay_by_schedule(schedule_tag):
     if schedule_tag is not None and schedule_tag == EScheduleTag.hourly():
@@ -167,7 +174,7 @@ class DbtModelVars(pydantic.BaseModel):
     overlap: bool = False
     extra: Dict = pydantic.Field(exclude=True)
 
-    _raw_keys_to_drop = {'start_dttm', 'end_dttm'}
+    _raw_keys_to_drop = {'start_dttm', 'end_dttm', BACKFILL_MODELS_PARAM}
     _dbt_keys_to_patch = {'dbt_start_dttm', 'dbt_end_dttm'}
 
     @pydantic.root_validator(pre=True)
@@ -225,11 +232,10 @@ class DbtIntervalActionOperator(DbtBaseOperator):
         parameters)
         """
         # user defined parameters
-        if 'start_dttm' in context['params'] and 'end_dttm' in context['params']:
-            if context['params']['start_dttm'] != context['params']['end_dttm']:
-                context['params']['dbt_start_dttm'] = context['params']['start_dttm']
-                context['params']['dbt_end_dttm'] = context['params']['end_dttm']
-                return context
+        user_defined_interval = get_user_defined_interval(context['params'])
+        if user_defined_interval:
+            context['params']['dbt_start_dttm'], context['params']['dbt_end_dttm'] = user_defined_interval
+            return context
 
         # if data_interval_start is equal to data_interval_end, we run dbt for the whole day starting
         # from data_interval_start.date()
@@ -258,11 +264,56 @@ class DbtBaseActionOperator(DbtIntervalActionOperator):
     ) -> None:
         self.model_name = f'{model_name}.{model_type}' if model_type else model_name
         self.model_name_wo_type = model_name
+        self.model_type = model_type
         self.overlap = overlap
 
         super().__init__(schedule_tag=schedule_tag, **kwargs)
         self.bash_options['--select'] = self.model_name
 
+    def stamp(self, task_id: str, model_name: str, task_group: Optional[TaskGroup] = None) -> 'DbtBaseActionOperator':
+        """
+        Creates an operator for another model with this one as a prototype. The result is the same as creating
+        the operator with the same arguments except `task_id`, `model_name` and `task_group`, but it doesn't go
+        through the init stack of airflow operators again, which takes most of the time of building large DAGs.
+        """
+        # copy goes through `__getstate__`, so the operator gets its own `__dict__` and mutable attributes are copied
+        operator = copy.copy(self)
+        state = operator.__dict__
+        for name, value in state.items():
+            # exact types are checked, `isinstance` is slow for abstract classes like `ParamsDict`
+            if type(value) in _COPIED_TYPES:
+                state[name] = value.copy()
+            elif type(value) is ParamsDict:
+                state[name] = copy.deepcopy(value)
+
+        init_kwargs = state['_BaseOperator__init_kwargs']
+        stamped_kwargs = {'task_id': task_id, 'task_group': task_group, **operator._stamp_model(model_name)}
+        init_kwargs.update((name, value) for name, value in stamped_kwargs.items() if name in init_kwargs)
+
+        # the same as `BaseOperator.__init__` adds the operator to its task group and DAG
+        dag = self.dag
+        task_group = task_group or TaskGroupContext.get_current_task_group(dag)
+        state.update(task_id=task_group.child_id(task_id) if task_group else task_id, task_group=None, _dag=None)
+        validate_key(operator.task_id)
+        if task_group:
+            task_group.add(operator)
+        operator.dag = dag
+
+        # setting attributes of the operator updates its init kwargs, but they must keep the arguments as they are
+        state['_BaseOperator__init_kwargs'] = init_kwargs
+        return operator
+
+    def _stamp_model(self, model_name: str) -> dict[str, Any]:
+        """
+        Sets attributes of the stamped operator that depend on the model and returns them as init arguments.
+        `__dict__` is updated directly, because `BaseOperator.__setattr__` resolves XCom arguments of template fields.
+        """
+        self.__dict__['model_name'] = f'{model_name}.{self.model_type}' if self.model_type else model_name
+        self.__dict__['model_name_wo_type'] = model_name
+        self.bash_options['--select'] = self.model_name
+        self.__dict__['bash_command'] = self.__dict__['_unrendered_bash_command'] = self.generate_bash(**self.__dict__)
+        return {'model_name': model_name, 'bash_command': self.bash_command}
+
     def _patch_path_to_dbt_bash(self, **kwargs) -> str:
         return (
             'if [[ "$DBT_ENABLE_MINI_DBT" = "true" ]]; '
@@ -3,8 +3,6 @@ from typing import TYPE_CHECKING, Any, Callable, List, Optional
 from airflow.operators.python import BranchPythonOperator
 from airflow.utils.context import Context
 
-from dbt_af.parser.dbt_node_model import DbtNodeConfig
-
 if TYPE_CHECKING:
     from airflow.models import DAG
     from airflow.utils.task_group import TaskGroup
@@ -25,15 +23,15 @@ class DbtBranchOperator(BranchPythonOperator):
         return super().execute(context)
 
 
-def create_decision_path_function(node_config: DbtNodeConfig, node_name: str) -> Callable:
+def create_decision_path_function(enable_from_dttm: str, disable_from_dttm: str, node_name: str) -> Callable:
     def decide_which_path(**kwargs) -> List[str]:
         is_enable = True
-        if node_config.enable_from_dttm:
-            if str(kwargs['data_interval_end']) < node_config.enable_from_dttm:
+        if enable_from_dttm:
+            if str(kwargs['data_interval_end']) < enable_from_dttm:
                 is_enable = False
         is_disable = False
-        if node_config.disable_from_dttm:
-            if str(kwargs['data_interval_start']) > node_config.disable_from_dttm:
+        if disable_from_dttm:
+            if str(kwargs['data_interval_start']) > disable_from_dttm:
                 is_disable = True
         if is_enable and not is_disable:
             downstream = [f'{node_name}__group.{node_name}']
@@ -44,3 +42,12 @@ def create_decision_path_function(node_config: DbtNodeConfig, node_name: str) ->
         return []
 
     return decide_which_path
+
+
+def decide_backfill_path(**kwargs) -> str:
+    """
+    Backfill DAGs are scheduled daily but do the work only when they are cleared and run again.
+    """
+    if kwargs['task_instance'].try_number > 1:
+        return 'start_work'
+    return 'do_nothing'
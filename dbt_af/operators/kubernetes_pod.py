@@ -15,6 +15,7 @@ except (ModuleNotFoundError, ImportError):
     from airflow.providers.cncf.kubernetes.operators.pod import KubernetesPodOperator
 
 from dbt_af.common.constants import AZ_MI_BINDING_LABEL_NAME
+from dbt_af.common.utils import get_user_defined_interval, is_model_selected_to_backfill
 from dbt_af.conf import Config
 from dbt_af.parser.dbt_profiles import KubernetesTarget
 
@@ -86,12 +87,22 @@ class DbtKubernetesPodOperator(KubernetesPodOperator):
         ]
 
     def execute(self, context: 'Context'):
+        if not is_model_selected_to_backfill(context.get('params') or {}, self.dbt_model_name):
+            # handle case for on-demand backfill DAGs; the task succeeds, so downstream models are still run
+            self.log.info('Model %s is not selected to backfill, pod is not started', self.dbt_model_name)
+            return
+
         model_config = self._find_model_config_by_name()
         model_config_b64 = base64.b64encode(json.dumps(model_config).encode()).decode()
+        # interval of user-defined parameters (e.g. of on-demand backfill DAGs) takes precedence over the data interval
+        start_dttm, end_dttm = get_user_defined_interval(context.get('params') or {}) or (
+            context['data_interval_start'].isoformat(),
+            context['data_interval_end'].isoformat(),
+        )
 
         self.env_vars.append(k8s.V1EnvVar(name='MODEL_CONFIG_B64', value=model_config_b64))
-        self.env_vars.append(k8s.V1EnvVar(name='START_DTTM', value=context['data_interval_start'].isoformat()))
-        self.env_vars.append(k8s.V1EnvVar(name='END_DTTM', value=context['data_interval_end'].isoformat()))
+        self.env_vars.append(k8s.V1EnvVar(name='START_DTTM', value=start_dttm))
+        self.env_vars.append(k8s.V1EnvVar(name='END_DTTM', value=end_dttm))
         self.env_vars.append(k8s.V1EnvVar(name='AIRFLOW_UNIQUE_NAME', value=os.getenv('AIRFLOW_UNIQUE_NAME')))
         self.env_vars.append(k8s.V1EnvVar(name='DAG_RUN_CONF', value=json.dumps(context['dag_run'].conf or {})))
 
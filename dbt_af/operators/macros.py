@@ -10,6 +10,8 @@ from dbt_af.parser.dbt_node_model import DbtAFMaintenanceConfig, DbtModelMainten
 
 
 class DbtRunMacroOperation(DbtIntervalActionOperator):
+    macro_name: str
+
     def __init__(self, dbt_af_config: Config, **kwargs):
         self.macro = self.macro_name
 
@@ -24,59 +26,55 @@ class DbtRunMacroOperation(DbtIntervalActionOperator):
 
     @property
     def af_task_name(self) -> str:
-        safe_macro_name = f'dbt_{self.macro_name}'
-        if hasattr(self, 'model_name'):
-            return f'{safe_macro_name}__{self.model_name.replace(".", "_")}'
+        return self.get_af_task_name(getattr(self, 'model_name', None))
+
+    @classmethod
+    def get_af_task_name(cls, model_name: Optional[str] = None) -> str:
+        safe_macro_name = f'dbt_{cls.macro_name}'
+        if model_name is not None:
+            return f'{safe_macro_name}__{model_name.replace(".", "_")}'
         return safe_macro_name
 
     @property
     def cli_command(self) -> str:
         return 'run-operation {macro}'
 
-    @property
-    def macro_name(self) -> str:
-        raise NotImplementedError()
-
     @property
     def macro_args(self) -> Optional[dict]:
         return None
 
 
 class DbtStageExternalSources(DbtRunMacroOperation):
+    macro_name = 'stage_external_sources'
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
 
-    @property
-    def macro_name(self) -> str:
-        return 'stage_external_sources'
-
 
 class DbtPersistFullDocumentation(DbtRunMacroOperation):
+    macro_name = 'persist_docs_full'
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
 
-    @property
-    def macro_name(self) -> str:
-        return 'persist_docs_full'
-
 
 class DbtPersistTableDocumentation(DbtRunMacroOperation):
+    macro_name = 'persist_docs'
+
     def __init__(self, model_name, maintenance_config: DbtAFMaintenanceConfig, **kwargs) -> None:
         self.model_name = model_name
         self.maintenance_config = maintenance_config
 
         super().__init__(**kwargs)
 
-    @property
-    def macro_name(self) -> str:
-        return 'persist_docs'
-
     @property
     def macro_args(self) -> dict:
         return {'model_name': self.model_name}
 
 
 class DbtOptimizeTable(DbtRunMacroOperation):
+    macro_name = 'optimize_table'
+
     def __init__(
         self,
         model_name: str,
@@ -90,16 +88,14 @@ class DbtOptimizeTable(DbtRunMacroOperation):
 
         super().__init__(target_environment=target_environment, max_active_tis_per_dag=max_active_tis_per_dag, **kwargs)
 
-    @property
-    def macro_name(self) -> str:
-        return 'optimize_table'
-
     @property
     def macro_args(self) -> dict:
         return {'model_name': self.model_name}
 
 
 class DbtVacuumTable(DbtRunMacroOperation):
+    macro_name = 'vacuum_table'
+
     def __init__(
         self,
         model_name: str,
@@ -113,16 +109,14 @@ class DbtVacuumTable(DbtRunMacroOperation):
 
         super().__init__(target_environment=target_environment, max_active_tis_per_dag=max_active_tis_per_dag, **kwargs)
 
-    @property
-    def macro_name(self) -> str:
-        return 'vacuum_table'
-
     @property
     def macro_args(self) -> dict:
         return {'model_name': self.model_name}
 
 
 class DbtDeduplicateTable(DbtRunMacroOperation):
+    macro_name = 'deduplicate_table'
+
     def __init__(
         self, model_name: str, maintenance_config: DbtAFMaintenanceConfig, target_environment: str, **kwargs
     ) -> None:
@@ -132,16 +126,14 @@ class DbtDeduplicateTable(DbtRunMacroOperation):
 
         super().__init__(target_environment=target_environment, **kwargs)
 
-    @property
-    def macro_name(self) -> str:
-        return 'deduplicate_table'
-
     @property
     def macro_args(self) -> dict:
         return {'model_name': self.model_name}
 
 
 class DbtSetTTLOnTable(DbtRunMacroOperation):
+    macro_name = 'set_ttl_on_table'
+
     def __init__(
         self,
         model_name: str,
@@ -155,10 +147,6 @@ class DbtSetTTLOnTable(DbtRunMacroOperation):
 
         super().__init__(target_environment=target_environment, max_active_tis_per_dag=max_active_tis_per_dag, **kwargs)
 
-    @property
-    def macro_name(self) -> str:
-        return 'set_ttl_on_table'
-
     @property
     def macro_args(self) -> dict:
         return {
@@ -205,3 +193,7 @@ class DbtMaintenanceOperatorFactory:
             dbt_af_config=dbt_af_config,
             **kwargs,
         )
+
+    @staticmethod
+    def get_task_id(model_name: str, maintenance_type: 'DbtModelMaintenanceType') -> str:
+        return _MAPPING_MAINTENANCE_TYPE_TO_OPERATOR[maintenance_type].get_af_task_name(model_name)
@@ -1,9 +1,9 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from airflow import Dataset
 
 from dbt_af.common.constants import DBT_MODEL_DAG_PARAM
-from dbt_af.common.utils import build_dbt_run_model_bash_extra_options
+from dbt_af.common.utils import build_dbt_run_model_bash_extra_options, is_model_selected_to_backfill
 from dbt_af.conf import Config
 from dbt_af.operators.base import DbtBaseActionOperator
 
@@ -34,8 +34,19 @@ class DbtBaseDatasetOperator(DbtBaseActionOperator):
                 self.bash_options.update(bash_options)
                 self.bash_flags.update(bash_flags)
 
+            if not is_model_selected_to_backfill(context['params'], self.model_name_wo_type):
+                # handle case for on-demand backfill DAGs; the task succeeds, so downstream models are still run
+                self.log.info('Model %s is not selected to backfill, dbt is not run', self.model_name_wo_type)
+                return
+
         super().execute(context)
 
+    def _stamp_model(self, model_name: str) -> dict[str, Any]:
+        init_kwargs = super()._stamp_model(model_name)
+        if self.outlets:
+            self.__dict__['outlets'] = init_kwargs['outlets'] = [Dataset(model_name)]
+        return init_kwargs
+
     def _patch_path_to_dbt_bash(self, **kwargs):
         if self.model_name_wo_type == DBT_MODEL_DAG_PARAM:
             return 'PATH_TO_DBT=$DBT_PROJECT_DIR && '
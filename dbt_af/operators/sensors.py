@@ -1,7 +1,7 @@
 import logging
 import os
 import shutil
-from functools import cached_property, partial
+from functools import cached_property
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, Optional, Sequence
 
@@ -11,11 +11,8 @@ from airflow.sensors.external_task import ExternalTaskSensor
 from airflow.sensors.python import PythonSensor
 from airflow.utils.state import State
 
-from dbt_af.common.af_scheduling_utils import (
-    GLOBAL_TASK_SCHEDULE_MAPPINGS,
-    _TaskScheduleMapping,
-    calculate_task_to_wait_execution_date,
-)
+# calculate_task_to_wait_execution_date is a compatibility re-export, it used to be defined in this module
+from dbt_af.common.af_scheduling_utils import EXECUTION_DATE_FNS, calculate_task_to_wait_execution_date  # noqa: F401
 from dbt_af.common.constants import DBT_SENSOR_POOL
 from dbt_af.common.scheduling import BaseScheduleTag, EScheduleTag
 from dbt_af.conf import Config
@@ -36,51 +33,6 @@ _POKE_INTERVALS_SECONDS = {
 }
 
 
-def get_execution_date_fn_mapping(
-    wait_policy: WaitPolicy,
-    upstream_schedule_tag: BaseScheduleTag,
-    downstream_schedule_tag: BaseScheduleTag,
-) -> _TaskScheduleMapping:
-    """
-    This function returns mapping of functions to calculate the correct execution dates for sensors in runtime.
-    It builds a whole matrix of all possible combinations for upstream and downstream schedules
-    and calculates functions.
-    """
-    match wait_policy:
-        case WaitPolicy.last:
-            _mapping = GLOBAL_TASK_SCHEDULE_MAPPINGS[wait_policy]
-            if _mapping.is_registered(upstream_schedule_tag, downstream_schedule_tag):
-                return _mapping
-
-            _mapping.add(
-                upstream_schedule_tag,
-                downstream_schedule_tag,
-                partial(calculate_task_to_wait_execution_date),
-            )
-        case WaitPolicy.all:
-            _mapping = GLOBAL_TASK_SCHEDULE_MAPPINGS[wait_policy]
-            if _mapping.is_registered(upstream_schedule_tag, downstream_schedule_tag):
-                return _mapping
-
-            embeddings_number = downstream_schedule_tag.cron_expression().embeddings_number(
-                upstream_schedule_tag.cron_expression(),
-                is_upstream_bigger=downstream_schedule_tag < upstream_schedule_tag,
-            )
-            _mapping.add(
-                upstream_schedule_tag,
-                downstream_schedule_tag,
-                (
-                    [partial(calculate_task_to_wait_execution_date, num_iter=i) for i in range(embeddings_number)]
-                    if embeddings_number
-                    else [partial(calculate_task_to_wait_execution_date)]
-                ),
-            )
-        case _:
-            raise TypeError(f'Unknown wait policy {wait_policy}')
-
-    return _mapping
-
-
 class AfExecutionDateFn:
     """
     This class is used to get execution dates for sensors.
@@ -103,12 +55,8 @@ class AfExecutionDateFn:
         self.downstream_schedule_tag = downstream_schedule_tag
         self.wait_policy = wait_policy
 
-    def get_execution_dates(self) -> list[Optional[callable]]:
-        return get_execution_date_fn_mapping(
-            self.wait_policy,
-            self.upstream_schedule_tag,
-            self.downstream_schedule_tag,
-        ).get((self.upstream_schedule_tag, self.downstream_schedule_tag))
+    def get_execution_dates(self) -> tuple[callable, ...]:
+        return EXECUTION_DATE_FNS.get(self.wait_policy, self.upstream_schedule_tag, self.downstream_schedule_tag)
 
 
 class DbtExternalSensor(ExternalTaskSensor):
@@ -1,18 +1,19 @@
 import logging
-from typing import Any, Sequence
+from typing import Any, Optional, Sequence
 
 from airflow import __version__ as airflow_version
 from airflow.operators.python import PythonVirtualenvOperator
 from airflow.utils.context import Context
 from packaging.version import Version
 
+from dbt_af.common.utils import is_model_selected_to_backfill
 from dbt_af.conf import Config
 from dbt_af.parser.dbt_profiles import VenvTarget
 
 
 class DbtPythonVenvOperator(PythonVirtualenvOperator):
     template_fields: Sequence[str] = tuple(
-        {'dbt_model_path', 'target_details'}.union(PythonVirtualenvOperator.template_fields)
+        sorted({'dbt_model_path', 'target_details'}.union(PythonVirtualenvOperator.template_fields))
     )
     template_fields_renderers = {'target_details': 'python'}
 
@@ -22,8 +23,10 @@ class DbtPythonVenvOperator(PythonVirtualenvOperator):
         target_details: VenvTarget,
         dbt_af_config: Config,
         env: dict[str, str] | None = None,
+        dbt_model_name: Optional[str] = None,
         **kwargs,
     ):
+        self.dbt_model_name = dbt_model_name
         self.target_details = target_details
         self.env_vars = env
         self.dbt_model_path = dbt_model_path
@@ -48,6 +51,11 @@ class DbtPythonVenvOperator(PythonVirtualenvOperator):
         )
 
     def execute(self, context: Context) -> Any:
+        if self.dbt_model_name and not is_model_selected_to_backfill(context.get('params') or {}, self.dbt_model_name):
+            # handle case for on-demand backfill DAGs; the task succeeds, so downstream models are still run
+            self.log.info('Model %s is not selected to backfill, it is not run', self.dbt_model_name)
+            return None
+
         with open(self.dbt_af_config.dbt_project.dbt_models_path / self.dbt_model_path, 'r') as f:
             model_code = f.read()
         self.op_args = (model_code,)
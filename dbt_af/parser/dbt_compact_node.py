@@ -0,0 +1,180 @@
+import sys
+from pathlib import Path
+from typing import Optional
+
+import attrs
+
+from dbt_af.common.scheduling import BaseScheduleTag, EScheduleTag
+from dbt_af.common.utils import TestTag
+from dbt_af.conf import DbtDefaultTargetsConfig
+from dbt_af.parser.dbt_node_model import (
+    DbtAFMaintenanceConfig,
+    DbtModelMaintenanceType,
+    DbtNode,
+    DbtNodeConfig,
+    DependencyConfig,
+    TableauRefreshTaskConfig,
+)
+from dbt_af.parser.dbt_profiles import KubernetesTarget, Target, VenvTarget
+
+_DEFAULT_DEPENDENCY_CONFIG = DependencyConfig()
+
+
+class NodeDependenciesConfig(dict[str, DependencyConfig]):
+    """
+    Dependencies config of a model; missing dependencies get default config without being added to the mapping.
+    """
+
+    def __missing__(self, key: str) -> DependencyConfig:
+        return _DEFAULT_DEPENDENCY_CONFIG
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+@attrs.define(frozen=True)
+class CompactDbtNodeConfig:
+    """
+    Part of `DbtNodeConfig` that is used by dbt-af builder and operators after manifest is parsed.
+    """
+
+    schedule: BaseScheduleTag
+    dependencies: NodeDependenciesConfig
+    env: dict[str, str]
+    dbt_target: str
+    bf_cluster: Optional[str]
+    enable_from_dttm: str
+    disable_from_dttm: str
+    domain_start_date: str
+    maintenance: DbtAFMaintenanceConfig
+    tableau_refresh_tasks: tuple[TableauRefreshTaskConfig, ...]
+
+    @classmethod
+    def from_dbt_node_config(cls, config: DbtNodeConfig) -> 'CompactDbtNodeConfig':
+        return cls(
+            schedule=config.schedule,
+            dependencies=NodeDependenciesConfig(config.dependencies or {}),
+            env=config.env,
+            dbt_target=config.dbt_target or '',
+            bf_cluster=config.bf_cluster,
+            enable_from_dttm=config.enable_from_dttm or '',
+            disable_from_dttm=config.disable_from_dttm or '',
+            domain_start_date=config.domain_start_date or '',
+            maintenance=config.maintenance,
+            tableau_refresh_tasks=tuple(config.tableau_refresh_tasks or ()),
+        )
+
+
+@attrs.define(frozen=True, eq=False)
+class CompactDbtNode:
+    """
+    Runtime representation of dbt node that keeps only fields used by dbt-af builder and operators.
+    All derived properties of `DbtNode` are computed once, when the node is created from validated `DbtNode`.
+    """
+
+    unique_id: str
+    resource_type: str
+    resource_name: str
+    domain: str
+    path: str
+    original_file_path: str
+    materialized: str
+    model_type: Optional[str]
+    test_type: Optional[str]
+    depends_on: tuple[str, ...]
+    depends_on_sources: tuple[str, ...]
+    cluster: Optional[str]
+    airflow_parallelism: int
+    maintenance_types: tuple[DbtModelMaintenanceType, ...]
+    config: CompactDbtNodeConfig
+    target_details: Optional[Target | KubernetesTarget | VenvTarget] = None
+
+    @classmethod
+    def from_dbt_node(cls, node: DbtNode, config: Optional[CompactDbtNodeConfig] = None) -> 'CompactDbtNode':
+        """
+        `config` is a compact version of `node.config`, it's passed to share one instance between nodes with the same
+        config.
+        """
+        return cls(
+            unique_id=node.unique_id,
+            resource_type=_intern(node.resource_type),
+            resource_name=node.resource_name,
+            domain=_intern(node.domain),
+            path=node.path,
+            original_file_path=node.original_file_path,
+            materialized=_intern(node.materialized or ''),
+            model_type=_intern(node.model_type),
+            test_type=_intern(node.test_type),
+            depends_on=tuple(node.depends_on),
+            depends_on_sources=tuple(node.depends_on_sources),
+            cluster=_intern(cls._get_cluster(node)),
+            airflow_parallelism=node.get_airflow_parallelism(),
+            maintenance_types=tuple(node.get_required_maintenance_types()),
+            config=config or CompactDbtNodeConfig.from_dbt_node_config(node.config),
+            target_details=node.target_details,
+        )
+
+    @staticmethod
+    def _get_cluster(node: DbtNode) -> Optional[str]:
+        """
+        Target environment of non-test node if it's not set explicitly (see `DbtNode.target_environment`)
+        """
+        if node.is_test():
+            return None
+        if len(node.config.pre_hook) == 0 and node.model_type == 'sql':
+            if node.config.schedule in (EScheduleTag.daily(), EScheduleTag.weekly()):
+                return node.config.daily_sql_cluster
+            return node.config.sql_cluster
+        return node.config.py_cluster
+
+    def __hash__(self):
+        return hash(self.unique_id)
+
+    def __eq__(self, other):
+        if isinstance(other, (CompactDbtNode, DbtNode)):
+            return self.unique_id == other.unique_id
+        if isinstance(other, str):
+            return self.unique_id == other
+        raise TypeError(f'Cannot compare {self.__class__.__name__} with {other.__class__.__name__}')
+
+    @property
+    def original_file_path_without_extension(self) -> str:
+        return str(Path(self.original_file_path).with_suffix(''))
+
+    def target_environment(self, default_dbt_targets: DbtDefaultTargetsConfig) -> str:
+        if self.config.dbt_target:
+            return self.config.dbt_target
+        if self.is_test():
+            return default_dbt_targets.default_for_tests_target
+        return self.cluster
+
+    def is_model(self) -> bool:
+        return self.resource_type == 'model'
+
+    def is_view(self) -> bool:
+        return self.materialized == 'view'
+
+    def is_snapshot(self) -> bool:
+        return self.resource_type == 'snapshot'
+
+    def is_test(self) -> bool:
+        return self.resource_type == 'test'
+
+    def is_small_test(self) -> bool:
+        return self.test_type == TestTag.small.value
+
+    def is_medium_test(self) -> bool:
+        return self.test_type == TestTag.medium.value
+
+    def is_large_test(self) -> bool:
+        return self.test_type == TestTag.large.value
+
+    def is_seed(self) -> bool:
+        return self.resource_type == 'seed'
+
+    def get_airflow_parallelism(self) -> int:
+        return self.airflow_parallelism
+
+    def get_required_maintenance_types(self) -> list[DbtModelMaintenanceType]:
+        return list(self.maintenance_types)
@@ -0,0 +1,124 @@
+import json
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Optional
+
+# only these fields of manifest['nodes'] are used by dbt-af; all others (raw_code, columns, docs, unrendered_config,
+# etc.) could be huge and are never read, so there is no need to keep and validate them
+DBT_NODE_FIELDS = frozenset(
+    {
+        'database',
+        'schema',
+        'name',
+        'resource_type',
+        'package_name',
+        'path',
+        'original_file_path',
+        'unique_id',
+        'fqn',
+        'alias',
+        'checksum',
+        'config',
+        'tags',
+        'depends_on',
+        'language',
+        'access',
+        'version',
+        'latest_version',
+    }
+)
+
+# only these fields of manifest['sources'] are used by dbt-af
+DBT_SOURCE_FIELDS = frozenset(
+    {
+        'database',
+        'schema',
+        'name',
+        'resource_type',
+        'package_name',
+        'path',
+        'original_file_path',
+        'unique_id',
+        'fqn',
+        'source_name',
+        'loader',
+        'identifier',
+        'loaded_at_field',
+        'freshness',
+        'external',
+        'tags',
+        'config',
+        'relation_name',
+    }
+)
+
+MANIFEST_SECTIONS_FIELDS = {
+    'nodes': DBT_NODE_FIELDS,
+    'sources': DBT_SOURCE_FIELDS,
+}
+
+
+def is_ijson_installed() -> bool:
+    return find_spec('ijson') is not None
+
+
+def slim_manifest_record(record: dict[str, Any], fields: frozenset[str]) -> dict[str, Any]:
+    return {field: value for field, value in record.items() if field in fields}
+
+
+def _iter_section_streaming(fin: BinaryIO, section: str) -> Iterator[tuple[str, dict[str, Any]]]:
+    import ijson
+
+    fin.seek(0)
+    # ijson picks the fastest available backend (yajl2_c if it's compiled); each record is built by the backend
+    # one by one, so only one full node is kept in memory at a time
+    yield from ijson.kvitems(fin, section, use_float=True)
+
+
+def _load_manifest_streaming(manifest_path: Path) -> dict[str, dict[str, dict[str, Any]]]:
+    manifest = {}
+    with open(manifest_path, 'rb') as fin:
+        for section, fields in MANIFEST_SECTIONS_FIELDS.items():
+            manifest[section] = {
+                unique_id: slim_manifest_record(record, fields)
+                for unique_id, record in _iter_section_streaming(fin, section)
+            }
+
+    return manifest
+
+
+def _load_manifest_in_memory(manifest_path: Path) -> dict[str, dict[str, dict[str, Any]]]:
+    with open(manifest_path) as fin:
+        raw_manifest = json.load(fin)
+
+    return slim_manifest(raw_manifest)
+
+
+def slim_manifest(manifest: dict) -> dict[str, dict[str, dict[str, Any]]]:
+    """
+    Drops all sections and fields from already loaded manifest that are not used by dbt-af.
+    """
+    return {
+        section: {unique_id: slim_manifest_record(record, fields) for unique_id, record in manifest[section].items()}
+        for section, fields in MANIFEST_SECTIONS_FIELDS.items()
+    }
+
+
+def load_manifest(manifest_path: str | Path, streaming: Optional[bool] = None) -> dict[str, dict[str, dict[str, Any]]]:
+    """
+    Loads only fields of `nodes` and `sources` from manifest.json that are used by dbt-af.
+    The result has the same layout as the original manifest, so it could be passed to `DbtAfGraph.from_manifest`.
+
+    :param manifest_path: path to manifest.json
+    :param streaming: whether to parse manifest incrementally; it requires extra `fast` (ijson) to be installed.
+        By default, streaming is used if ijson is installed.
+    """
+    manifest_path = Path(manifest_path)
+    if streaming is None:
+        streaming = is_ijson_installed()
+    if streaming and not is_ijson_installed():
+        raise ImportError('ijson is not installed. Please install dbt-af[fast] to use streaming manifest loader.')
+
+    if streaming:
+        return _load_manifest_streaming(manifest_path)
+    return _load_manifest_in_memory(manifest_path)
@@ -231,9 +231,9 @@ class DbtNode(pydantic.BaseModel):
     build_path: Optional[str]
     deferred: Optional[bool]
     unrendered_config: Optional[Dict[str, Any]]
-    created_at: float
+    created_at: float = pydantic.Field(default=0.0)
     relation_name: Optional[str]
-    raw_code: str
+    raw_code: str = pydantic.Field(default='')
     language: Optional[str]
     refs: Optional[List[Dict[str, Any]]]
     sources: Optional[List[Any]] = pydantic.Field(default_factory=list)
@@ -0,0 +1,242 @@
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional
+
+from dbt_af.conf import DbtDefaultTargetsConfig, ParallelParsingConfig
+from dbt_af.parser.dbt_compact_node import CompactDbtNode, CompactDbtNodeConfig
+from dbt_af.parser.dbt_node_model import DbtNode, DbtNodeConfig
+from dbt_af.parser.dbt_profiles import Profile
+
+DBT_AF_RESOURCE_TYPES = ('test', 'model', 'snapshot', 'seed')
+
+
+def is_node_info_at_etl_service(node_info: dict[str, Any], etl_service_name: str) -> bool:
+    """
+    Checks raw manifest node the same way as `DbtNode.is_at_etl_service` does, but without validation.
+    """
+    return etl_service_name in node_info['original_file_path'].split('/')
+
+
+def select_etl_services_nodes_info(
+    manifest_nodes: dict[str, dict[str, Any]],
+    etl_service_names: Optional[Iterable[str]] = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Selects raw manifest nodes of dbt-af resource types that belong to any of the given etl services (all nodes if
+    services are not specified). Other nodes are not used by dbt-af, so they are not validated at all.
+    """
+    etl_service_names = set(etl_service_names) if etl_service_names is not None else None
+    return {
+        unique_id: node_info
+        for unique_id, node_info in manifest_nodes.items()
+        if node_info['resource_type'] in DBT_AF_RESOURCE_TYPES
+        # TODO: add sensors for models in different etl services
+        and (
+            etl_service_names is None
+            or any(is_node_info_at_etl_service(node_info, etl_service_name) for etl_service_name in etl_service_names)
+        )
+    }
+
+
+class DbtNodeConfigsCache:
+    """
+    Validated node configs keyed by raw config payload. Usually most of the nodes have identical configs inherited from
+    folder configs of `dbt_project.yml`, so each distinct config is validated only once and nodes with identical configs
+    share one instance of compact config.
+    """
+
+    def __init__(self):
+        self._configs: dict[str, tuple[DbtNodeConfig, CompactDbtNodeConfig]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._configs)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def parse_node(self, node_info: dict[str, Any]) -> tuple[DbtNode, CompactDbtNodeConfig]:
+        """
+        Validates node reusing already validated config with the same payload if any.
+        """
+        raw_config = node_info.get('config')
+        if not isinstance(raw_config, dict):
+            # let pydantic report the error
+            node = DbtNode(**node_info)
+            return node, CompactDbtNodeConfig.from_dbt_node_config(node.config)
+
+        key = json.dumps(raw_config, sort_keys=True, default=str)
+        if key in self._configs:
+            self.hits += 1
+            config, compact_config = self._configs[key]
+            return DbtNode(**{**node_info, 'config': config}), compact_config
+
+        self.misses += 1
+        node = DbtNode(**node_info)
+        self._configs[key] = node.config, CompactDbtNodeConfig.from_dbt_node_config(node.config)
+        return node, self._configs[key][1]
+
+
+def parse_dbt_nodes_chunk(
+    nodes_info: Iterable[dict[str, Any]],
+    project_profile: Profile,
+    default_dbt_targets: DbtDefaultTargetsConfig,
+    configs_cache: Optional[DbtNodeConfigsCache] = None,
+) -> list[CompactDbtNode]:
+    configs_cache = configs_cache if configs_cache is not None else DbtNodeConfigsCache()
+    nodes = []
+    for node_info in nodes_info:
+        node, compact_config = configs_cache.parse_node(node_info)
+        node.set_target_details(project_profile, default_dbt_targets)
+        # validated pydantic node is dropped here, only compact runtime representation is kept
+        nodes.append(CompactDbtNode.from_dbt_node(node, config=compact_config))
+
+    return nodes
+
+
+def _parse_dbt_nodes_chunk_with_stats(
+    nodes_info: list[dict[str, Any]],
+    project_profile: Profile,
+    default_dbt_targets: DbtDefaultTargetsConfig,
+) -> tuple[list[CompactDbtNode], int, int]:
+    configs_cache = DbtNodeConfigsCache()
+    nodes = parse_dbt_nodes_chunk(nodes_info, project_profile, default_dbt_targets, configs_cache)
+    return nodes, configs_cache.hits, configs_cache.misses
+
+
+def get_node_info_domain(node_info: dict[str, Any]) -> str:
+    """
+    Gets domain of a raw manifest node without validation, the same way as `DbtNode.domain` does.
+    """
+    if node_info['resource_type'] == 'test':
+        return node_info['fqn'][3]
+    return node_info['fqn'][1]
+
+
+def select_domains_nodes_info(
+    manifest_nodes: dict[str, dict[str, Any]],
+    domains: Iterable[str],
+) -> dict[str, dict[str, Any]]:
+    """
+    Selects raw manifest nodes that could be needed to build dag components of the given domains: nodes of the domains,
+    their upstreams with all upstreams of the same domains, tests of all of them and upstreams of these tests and
+    upstreams. It's a superset of nodes selected by `select_domains_nodes` after validation, so only a small part of big
+    manifest has to be validated.
+    """
+    domains = set(domains)
+    nodes_info = {
+        unique_id: node_info
+        for unique_id, node_info in manifest_nodes.items()
+        if node_info['resource_type'] in DBT_AF_RESOURCE_TYPES
+    }
+
+    def _upstreams(unique_ids: Iterable[str]) -> set[str]:
+        return {
+            upstream
+            for unique_id in unique_ids
+            for upstream in nodes_info[unique_id]['depends_on']['nodes']
+            if upstream in nodes_info
+        }
+
+    def _tests(unique_ids: set[str]) -> set[str]:
+        return {
+            unique_id
+            for unique_id, node_info in nodes_info.items()
+            if node_info['resource_type'] == 'test' and not unique_ids.isdisjoint(node_info['depends_on']['nodes'])
+        }
+
+    domain_ids = {
+        unique_id for unique_id, node_info in nodes_info.items() if get_node_info_domain(node_info) in domains
+    }
+    domain_ids |= _tests(domain_ids)
+    selected_ids = domain_ids | _upstreams(domain_ids)
+    pending = list(selected_ids - domain_ids)
+    while pending:
+        unique_id = pending.pop()
+        for upstream in _upstreams([unique_id]) - selected_ids:
+            if get_node_info_domain(nodes_info[upstream]) == get_node_info_domain(nodes_info[unique_id]):
+                selected_ids.add(upstream)
+                pending.append(upstream)
+    selected_ids |= _tests(selected_ids)
+    selected_ids |= _upstreams(selected_ids)
+
+    return {unique_id: node_info for unique_id, node_info in nodes_info.items() if unique_id in selected_ids}
+
+
+def _chunked(items: Iterable[dict[str, Any]], chunk_size: int) -> Iterator[list[dict[str, Any]]]:
+    items = iter(items)
+    while chunk := list(islice(items, chunk_size)):
+        yield chunk
+
+
+def _get_max_workers(parallel_parsing: ParallelParsingConfig) -> int:
+    return parallel_parsing.max_workers or os.cpu_count() or 1
+
+
+def _parse_dbt_nodes_parallel(
+    nodes_info: list[dict[str, Any]],
+    project_profile: Profile,
+    default_dbt_targets: DbtDefaultTargetsConfig,
+    parallel_parsing: ParallelParsingConfig,
+    configs_cache: DbtNodeConfigsCache,
+) -> list[CompactDbtNode]:
+    chunks = list(_chunked(nodes_info, parallel_parsing.chunk_size))
+    max_workers = min(_get_max_workers(parallel_parsing), len(chunks))
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context(parallel_parsing.start_method),
+    ) as executor:
+        # map keeps order of chunks, so nodes are returned in manifest order
+        parsed_chunks = executor.map(
+            partial(
+                _parse_dbt_nodes_chunk_with_stats,
+                project_profile=project_profile,
+                default_dbt_targets=default_dbt_targets,
+            ),
+            chunks,
+        )
+        nodes = []
+        # each worker has its own configs cache, so configs are shared only within a chunk
+        for chunk_nodes, hits, misses in parsed_chunks:
+            nodes.extend(chunk_nodes)
+            configs_cache.hits += hits
+            configs_cache.misses += misses
+        return nodes
+
+
+def parse_dbt_nodes(
+    manifest_nodes: dict[str, dict[str, Any]],
+    project_profile: Profile,
+    default_dbt_targets: DbtDefaultTargetsConfig,
+    etl_service_name: Optional[str] = None,
+    parallel_parsing: Optional[ParallelParsingConfig] = None,
+    configs_cache: Optional[DbtNodeConfigsCache] = None,
+) -> list[CompactDbtNode]:
+    """
+    Validates manifest nodes and converts them to compact runtime representation.
+    Nodes are filtered by resource type and etl service before validation.
+    Each distinct node config is validated once (see `DbtNodeConfigsCache`); pass `configs_cache` to reuse it between
+    calls or to get hit rate of the cache.
+    If `parallel_parsing` is set and manifest is big enough, then nodes are validated in a process pool; the result
+    is the same as for serial parsing.
+    """
+    configs_cache = configs_cache if configs_cache is not None else DbtNodeConfigsCache()
+    etl_service_names = [etl_service_name] if etl_service_name else None
+    nodes_info = list(select_etl_services_nodes_info(manifest_nodes, etl_service_names).values())
+    if (
+        parallel_parsing is None
+        or len(nodes_info) < parallel_parsing.min_nodes
+        or len(nodes_info) <= parallel_parsing.chunk_size
+        or _get_max_workers(parallel_parsing) < 2
+    ):
+        return parse_dbt_nodes_chunk(nodes_info, project_profile, default_dbt_targets, configs_cache)
+
+    return _parse_dbt_nodes_parallel(nodes_info, project_profile, default_dbt_targets, parallel_parsing, configs_cache)
@@ -36,23 +36,23 @@ class DbtSource(pydantic.BaseModel):
     unique_id: str
     fqn: List[str]
     source_name: str
-    source_description: str
+    source_description: str = pydantic.Field(default='')
     loader: str
     identifier: str
-    quoting: Dict[str, Any]
+    quoting: Dict[str, Any] = pydantic.Field(default_factory=dict)
     loaded_at_field: str = pydantic.Field(default=None)
     freshness: DbtSourceFreshness
     external: Optional[Dict[str, Any]] = pydantic.Field(default=None)
-    description: str
-    columns: Dict[str, Any]
-    meta: Dict[str, Any]
-    source_meta: Dict[str, Any]
+    description: str = pydantic.Field(default='')
+    columns: Dict[str, Any] = pydantic.Field(default_factory=dict)
+    meta: Dict[str, Any] = pydantic.Field(default_factory=dict)
+    source_meta: Dict[str, Any] = pydantic.Field(default_factory=dict)
     tags: List[str]
     config: DbtSourceConfig
     patch_path: Optional[str] = pydantic.Field(default=None)
-    unrendered_config: Dict[str, Any]
+    unrendered_config: Dict[str, Any] = pydantic.Field(default_factory=dict)
     relation_name: str
-    created_at: float
+    created_at: float = pydantic.Field(default=0.0)
 
     def __hash__(self) -> int:
         return hash(self.unique_id)
@@ -0,0 +1,64 @@
+"""
+Compares backfill modes (`Config.backfill.mode`) on a synthetic manifest: number of DAGs and tasks, time to build them
+from parsed nodes (the part of DAG file parse time that depends on the mode) and number of task instances created by
+daily runs of backfill DAGs that do nothing:
+
+    python -m scripts.benchmarks.backfill_modes --n-models 5000
+"""
+
+import time
+
+import attrs
+import typer
+
+from dbt_af.builder.dag_materializer import DagMaterializer
+from dbt_af.builder.dbt_af_builder import DbtAfGraph, plan_dags
+from dbt_af.common.constants import BACKFILL_TAG
+from dbt_af.conf import BackfillConfig
+from dbt_af.dags import dbt_backfill_dag
+from dbt_af.parser.dbt_manifest_loader import slim_manifest
+from dbt_af.parser.dbt_nodes_parser import parse_dbt_nodes
+from scripts.benchmarks.synthetic_manifest import generate_manifest, synthetic_config, synthetic_profile
+
+cli = typer.Typer()
+
+MODES = ('scheduled', 'on_demand', 'project')
+
+
+@cli.command()
+def compare(
+    n_models: int = typer.Option(5_000),
+    n_domains: int = typer.Option(20),
+):
+    manifest = slim_manifest(generate_manifest(n_models, n_domains=n_domains))
+    nodes = parse_dbt_nodes(manifest['nodes'], synthetic_profile(), synthetic_config().dbt_default_targets)
+
+    results = {}
+    for mode in MODES:
+        config = attrs.evolve(synthetic_config(), backfill=BackfillConfig(mode=mode))
+        materializer = DagMaterializer(config, dag_callbacks={}, task_callbacks={})
+
+        start = time.perf_counter()
+        graph = DbtAfGraph.from_nodes(nodes, [], config)
+        dags = [materializer.materialize(plan) for plan in plan_dags(graph).values()]
+        if mode == 'project':
+            dags.extend(dbt_backfill_dag(config).values())
+        build_time = time.perf_counter() - start
+
+        daily_tis = sum(len(dag.tasks) for dag in dags if BACKFILL_TAG in dag.tags and dag.schedule_interval)
+        results[mode] = len(dags), sum(len(dag.tasks) for dag in dags), build_time, daily_tis
+        del graph, dags
+
+    n_dags, n_tasks, build_time, _ = results['scheduled']
+    typer.echo(f'{n_models} models in {n_domains} domains:')
+    for mode, (mode_dags, mode_tasks, mode_time, daily_tis) in results.items():
+        typer.echo(
+            f'  {mode:<10} {mode_dags:>5} DAGs ({mode_dags / n_dags - 1:+.0%}), '
+            f'{mode_tasks:>6} tasks ({mode_tasks / n_tasks - 1:+.0%}), '
+            f'built in {mode_time:.2f} s ({mode_time / build_time - 1:+.0%}), '
+            f'{daily_tis} idle task instances per day'
+        )
+
+
+if __name__ == '__main__':
+    cli()
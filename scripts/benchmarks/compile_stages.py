@@ -0,0 +1,222 @@
+"""
+Compiles DAGs of a synthetic project stage by stage, the same way as `compile_dbt_af_dags` does: loading of
+manifest and profiles, validation of nodes, graph building, planning and materialization of DAGs. Wall time and peak
+RSS of every stage, number of DAGs, tasks and task edges are appended to a JSON history, and the run is compared with
+the latest one of the same parameters, e.g. to compare commits:
+
+    python -m scripts.benchmarks.compile_stages measure --n-models 20000 --history compile_history.json
+    git checkout other-branch
+    python -m scripts.benchmarks.compile_stages measure --n-models 20000 --history compile_history.json
+
+Every run compiles DAGs in a fresh interpreter, so peak RSS doesn't include the generator and previous runs; it's
+the high-water mark of the process, i.e. it never decreases from stage to stage.
+"""
+
+import datetime
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import typer
+import yaml
+
+from scripts.benchmarks.synthetic_manifest import SCHEDULES, generate_manifest, synthetic_config, write_project
+
+cli = typer.Typer()
+
+STAGES = ('load', 'validate', 'graph', 'plan', 'materialize')
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on linux and in bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss / 2**20 if sys.platform == 'darwin' else peak_rss / 2**10
+
+
+def _run_stages(project_path: Path) -> dict[str, Any]:
+    from dbt_af.builder.dag_materializer import DagMaterializer
+    from dbt_af.builder.dbt_af_builder import DbtAfGraph, plan_dags
+    from dbt_af.builder.edges_reduction import count_edges
+    from dbt_af.parser.dbt_manifest_loader import load_manifest
+    from dbt_af.parser.dbt_nodes_parser import parse_dbt_nodes
+    from dbt_af.parser.dbt_profiles import Profiles
+    from dbt_af.parser.dbt_source_model import DbtSource
+
+    config = synthetic_config(project_path)
+    stages = {}
+
+    def _measure(stage: str, fn: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        result = fn()
+        stages[stage] = {'time_s': time.perf_counter() - start, 'peak_rss_mb': _peak_rss_mb()}
+        return result
+
+    def _load():
+        manifest = load_manifest(project_path / 'target' / 'manifest.json')
+        with open(config.dbt_project.dbt_profiles_path / 'profiles.yml') as fin:
+            profiles = yaml.safe_load(fin)
+        with open(config.dbt_project.dbt_project_path / 'dbt_project.yml') as fin:
+            profile_name = yaml.safe_load(fin)['profile']
+        return manifest, Profiles(**profiles)[profile_name]
+
+    def _validate():
+        nodes = parse_dbt_nodes(
+            manifest['nodes'],
+            project_profile,
+            config.dbt_default_targets,
+            parallel_parsing=config.parallel_parsing,
+        )
+        return nodes, [DbtSource(**source_info) for source_info in manifest['sources'].values()]
+
+    materializer = DagMaterializer(config, dag_callbacks={}, task_callbacks={})
+    manifest, project_profile = _measure('load', _load)
+    nodes, sources = _measure('validate', _validate)
+    graph = _measure('graph', lambda: DbtAfGraph.from_nodes(nodes, sources, config))
+    plans = _measure('plan', lambda: plan_dags(graph))
+    dags = _measure('materialize', lambda: [materializer.materialize(plan) for plan in plans.values()])
+
+    return {
+        'stages': stages,
+        'n_nodes': len(nodes),
+        'n_dags': len(dags),
+        'n_tasks': sum(len(dag.tasks) for dag in dags),
+        'n_edges': sum(count_edges(dag) for dag in dags),
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        revision = subprocess.run(
+            ['git', 'describe', '--always', '--dirty'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return revision or None
+
+
+def _merge_runs(runs: list[dict[str, Any]]) -> dict[str, Any]:
+    # counts are the same in every run, time is the median and peak RSS is the maximum over runs
+    result = dict(runs[0])
+    result['stages'] = {
+        stage: {
+            'time_s': statistics.median(run['stages'][stage]['time_s'] for run in runs),
+            'peak_rss_mb': max(run['stages'][stage]['peak_rss_mb'] for run in runs),
+        }
+        for stage in STAGES
+    }
+    result['total_time_s'] = sum(stage['time_s'] for stage in result['stages'].values())
+    return result
+
+
+def _load_history(history_path: Path | None) -> list[dict[str, Any]]:
+    if history_path is None or not history_path.exists():
+        return []
+    with open(history_path) as fin:
+        return json.load(fin)
+
+
+def _echo_record(record: dict[str, Any], previous: dict[str, Any] | None):
+    def _change(current: float, before: float) -> str:
+        return f' ({current / before - 1:+.1%})' if before else ''
+
+    typer.echo(
+        f'{record["n_nodes"]} nodes: {record["n_dags"]} DAGs, {record["n_tasks"]} tasks, {record["n_edges"]} edges'
+    )
+    if previous is not None:
+        typer.echo(f'compared with {previous["revision"]} at {previous["timestamp"]}')
+    typer.echo(f'  {"stage":<12} {"time, s":>8}{"":<10} {"peak RSS, MB":>12}')
+    for stage, values in record['stages'].items():
+        time_change = rss_change = ''
+        if previous is not None:
+            time_change = _change(values['time_s'], previous['stages'][stage]['time_s'])
+            rss_change = _change(values['peak_rss_mb'], previous['stages'][stage]['peak_rss_mb'])
+        typer.echo(
+            f'  {stage:<12} {values["time_s"]:>8.2f}{time_change:<10} {values["peak_rss_mb"]:>12.0f}{rss_change}'
+        )
+    total_change = _change(record['total_time_s'], previous['total_time_s']) if previous is not None else ''
+    typer.echo(f'  {"total":<12} {record["total_time_s"]:>8.2f}{total_change}')
+
+
+@cli.command()
+def measure(
+    n_models: int = typer.Option(20_000),
+    n_domains: int = typer.Option(50),
+    max_dependencies: int = typer.Option(3, help='fan-in: max number of upstreams of a model'),
+    upstream_window: int = typer.Option(5, help='fan-out: models depend only on this number of latest models'),
+    cross_domain_ratio: float = typer.Option(None, help='share of dependencies on models of other domains'),
+    tests_ratio: float = typer.Option(0.5),
+    schedule: list[str] = typer.Option(list(SCHEDULES), help='schedules of domains, repeat to make more frequent'),
+    test_tag: list[str] = typer.Option([''], help='tags of tests, repeat to make more frequent; empty is small'),
+    seed: int = typer.Option(42),
+    repeat: int = typer.Option(3),
+    history: Path = typer.Option(None, help='JSON file with results of previous runs, the run is appended to it'),
+):
+    params = {
+        'n_models': n_models,
+        'n_domains': n_domains,
+        'max_dependencies': max_dependencies,
+        'upstream_window': upstream_window,
+        'cross_domain_ratio': cross_domain_ratio,
+        'tests_ratio': tests_ratio,
+        'schedules': schedule,
+        'test_tags': test_tag,
+        'seed': seed,
+    }
+    with tempfile.TemporaryDirectory() as project_dir:
+        manifest = generate_manifest(
+            n_models,
+            n_domains=n_domains,
+            max_dependencies=max_dependencies,
+            tests_ratio=tests_ratio,
+            seed=seed,
+            schedules=schedule,
+            test_tags=test_tag,
+            upstream_window=upstream_window,
+            cross_domain_ratio=cross_domain_ratio,
+        )
+        write_project(Path(project_dir), manifest)
+        del manifest
+
+        runs = []
+        for _ in range(repeat):
+            result = subprocess.run(
+                [sys.executable, '-m', 'scripts.benchmarks.compile_stages', 'stages', project_dir],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            runs.append(json.loads(result.stdout.splitlines()[-1]))
+
+    record = {
+        'revision': _git_revision(),
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'params': params,
+        **_merge_runs(runs),
+    }
+
+    runs_history = _load_history(history)
+    previous = next((run for run in reversed(runs_history) if run['params'] == params), None)
+    _echo_record(record, previous)
+
+    if history is not None:
+        with open(history, 'w') as fout:
+            json.dump([*runs_history, record], fout, indent=2)
+
+
+@cli.command(hidden=True)
+def stages(project_path: Path):
+    """
+    Runs stages in the current interpreter and prints the result as JSON, it's called by `measure`.
+    """
+    typer.echo(json.dumps(_run_stages(project_path)))
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,69 @@
+"""
+Reports the number of planned edges, time and peak memory of planning and materialization of dbt-af DAGs of
+a synthetic manifest, and memory that is still held by plans after planning:
+
+    python -m scripts.benchmarks.dag_build --n-models 5000 --max-dependencies 8
+"""
+
+import gc
+import time
+import tracemalloc
+
+import typer
+
+from dbt_af.builder.dag_materializer import DagMaterializer
+from dbt_af.builder.dbt_af_builder import DbtAfGraph, plan_dags
+from dbt_af.builder.edges_reduction import count_edges
+from dbt_af.parser.dbt_manifest_loader import slim_manifest
+from dbt_af.parser.dbt_nodes_parser import parse_dbt_nodes
+from scripts.benchmarks.synthetic_manifest import generate_manifest, synthetic_config, synthetic_profile
+
+cli = typer.Typer()
+
+
+@cli.command()
+def measure(
+    n_models: int = typer.Option(5_000),
+    n_domains: int = typer.Option(20),
+    max_dependencies: int = typer.Option(8),
+):
+    config = synthetic_config()
+    manifest = slim_manifest(generate_manifest(n_models, n_domains=n_domains, max_dependencies=max_dependencies))
+    nodes = parse_dbt_nodes(manifest['nodes'], synthetic_profile(), config.dbt_default_targets)
+    graph = DbtAfGraph.from_nodes(nodes, [], config)
+    materializer = DagMaterializer(config, dag_callbacks={}, task_callbacks={})
+
+    start = time.perf_counter()
+    plans = plan_dags(graph)
+    planning_time = time.perf_counter() - start
+    start = time.perf_counter()
+    dags = [materializer.materialize(plan) for plan in plans.values()]
+    materialization_time = time.perf_counter() - start
+
+    typer.echo(f'{len(plans)} DAGs, {sum(len(dag.tasks) for dag in dags)} tasks')
+    typer.echo(f'  planned edges: {sum(len(plan.edges) for plan in plans.values())}')
+    typer.echo(f'  task edges: {sum(count_edges(dag) for dag in dags)}')
+    typer.echo(f'  planning: {planning_time:.2f} s, materialization: {materialization_time:.2f} s')
+    del plans, dags
+
+    # memory is measured in a separate run, tracing slows down allocations a lot
+    gc.collect()
+    tracemalloc.start()
+    plans = plan_dags(graph)
+    gc.collect()
+    plans_memory, planning_peak = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    dags = [materializer.materialize(plan) for plan in plans.values()]
+    dags_memory, materialization_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    typer.echo(f'  planning peak: {planning_peak / 2**20:.1f} MB, held by plans: {plans_memory / 2**20:.1f} MB')
+    typer.echo(
+        f'  materialization peak: {materialization_peak / 2**20:.1f} MB, '
+        f'held by plans and DAGs: {dags_memory / 2**20:.1f} MB'
+    )
+    del plans, dags
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,65 @@
+"""
+Reports how many task edges are removed from dbt-af DAGs by transitive reduction
+(`ModelDependenciesSection.reduce_transitive_edges`) on synthetic manifests, how it changes size of serialized DAGs
+and how long the reduction takes:
+
+    python -m scripts.benchmarks.edges_reduction --n-models 5000 --max-dependencies 3 --max-dependencies 8
+"""
+
+import json
+import time
+
+import typer
+from airflow.serialization.serialized_objects import SerializedDAG
+
+from dbt_af.builder.dag_materializer import DagMaterializer
+from dbt_af.builder.dbt_af_builder import DbtAfGraph, plan_dags
+from dbt_af.builder.edges_reduction import reduce_transitive_edges
+from dbt_af.parser.dbt_manifest_loader import slim_manifest
+from dbt_af.parser.dbt_nodes_parser import parse_dbt_nodes
+from scripts.benchmarks.synthetic_manifest import generate_manifest, synthetic_config, synthetic_profile
+
+cli = typer.Typer()
+
+
+def _serialized_size(dags) -> int:
+    return sum(len(json.dumps(SerializedDAG.to_dict(dag))) for dag in dags)
+
+
+@cli.command()
+def compare(
+    n_models: int = typer.Option(5_000),
+    n_domains: int = typer.Option(20),
+    max_dependencies: list[int] = typer.Option([3, 8]),
+):
+    config = synthetic_config()
+    project_profile = synthetic_profile()
+    materializer = DagMaterializer(config, dag_callbacks={}, task_callbacks={})
+
+    typer.echo(
+        f'{"max deps":>8} {"edges":>8} {"reduced":>8} {"removed":>8} '
+        f'{"serialized, MB":>15} {"reduced, MB":>12} {"reduction, s":>13}'
+    )
+    for n_deps in max_dependencies:
+        manifest = slim_manifest(generate_manifest(n_models, n_domains=n_domains, max_dependencies=n_deps))
+        nodes = parse_dbt_nodes(manifest['nodes'], project_profile, config.dbt_default_targets)
+        graph = DbtAfGraph.from_nodes(nodes, [], config)
+        dags = [materializer.materialize(plan) for plan in plan_dags(graph).values()]
+        serialized_size = _serialized_size(dags)
+
+        n_edges = n_reduced_edges = 0
+        start = time.perf_counter()
+        for dag in dags:
+            before, after = reduce_transitive_edges(dag)
+            n_edges += before
+            n_reduced_edges += after
+        reduction_time = time.perf_counter() - start
+
+        typer.echo(
+            f'{n_deps:>8} {n_edges:>8} {n_reduced_edges:>8} {1 - n_reduced_edges / n_edges:>8.1%} '
+            f'{serialized_size / 2**20:>15.1f} {_serialized_size(dags) / 2**20:>12.1f} {reduction_time:>13.3f}'
+        )
+
+
+if __name__ == '__main__':
+    cli()
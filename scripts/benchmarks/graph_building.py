@@ -0,0 +1,54 @@
+"""
+Measures build time of dbt-af graph (dag components and start dates of domain dags), planning of DAGs and their
+materialization into airflow objects on synthetic manifests of different sizes; time per node should stay roughly the
+same:
+
+    python -m scripts.benchmarks.graph_building --n-models 5000 --n-models 15000 --n-models 33000
+"""
+
+import time
+
+import typer
+
+from dbt_af.builder.dag_materializer import DagMaterializer
+from dbt_af.builder.dbt_af_builder import DbtAfGraph, get_domain_dags_start_dates, plan_dags
+from dbt_af.parser.dbt_manifest_loader import slim_manifest
+from dbt_af.parser.dbt_nodes_parser import parse_dbt_nodes
+from scripts.benchmarks.synthetic_manifest import generate_manifest, synthetic_config, synthetic_profile
+
+cli = typer.Typer()
+
+
+@cli.command()
+def compare(n_models: list[int] = typer.Option([5_000, 15_000, 33_000])):
+    config = synthetic_config()
+    project_profile = synthetic_profile()
+
+    typer.echo(f'{"nodes":>8} {"build, s":>10} {"us/node":>8} {"plan, s":>10} {"materialize, s":>15}')
+    for n in n_models:
+        manifest = slim_manifest(generate_manifest(n))
+        nodes = parse_dbt_nodes(manifest['nodes'], project_profile, config.dbt_default_targets)
+
+        start = time.perf_counter()
+        graph = DbtAfGraph.from_nodes(nodes, [], config)
+        get_domain_dags_start_dates(graph)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        plans = plan_dags(graph)
+        plan_time = time.perf_counter() - start
+
+        materializer = DagMaterializer(config, dag_callbacks={}, task_callbacks={})
+        start = time.perf_counter()
+        for plan in plans.values():
+            materializer.materialize(plan)
+        materialize_time = time.perf_counter() - start
+
+        typer.echo(
+            f'{len(nodes):>8} {build_time:>10.3f} {build_time / len(nodes) * 1e6:>8.1f} '
+            f'{plan_time:>10.3f} {materialize_time:>15.3f}'
+        )
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,78 @@
+"""
+Measures cold import time of `dbt_af.dags` with `python -X importtime` in fresh interpreters. Modules of airflow
+that are loaded by any DAG file are imported first, so the reported time is the cost added by dbt-af itself.
+Fails if the median time exceeds the budget or if operators of optional targets are imported eagerly:
+
+    python -m scripts.benchmarks.import_time --repeat 5 --budget-ms 500
+"""
+
+import statistics
+import subprocess
+import sys
+
+import typer
+
+cli = typer.Typer()
+
+# imported by any DAG file anyway
+AIRFLOW_MODULES = ('airflow.models.dag', 'airflow.operators.python', 'airflow.sensors.external_task')
+# must be imported only when DAGs have tasks of these targets
+DEFERRED_MODULES = ('dbt_af.operators.kubernetes_pod', 'dbt_af.operators.venv', 'dbt_af.operators.supplemental')
+
+
+def _import_times(module: str) -> tuple[dict[str, tuple[int, int]], set[str]]:
+    code = (
+        f'import {", ".join(AIRFLOW_MODULES)}\n'
+        'import sys\n'
+        'before = set(sys.modules)\n'
+        f'import {module}\n'
+        'print(*(name for name in sys.modules if name not in before))\n'
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True
+    )
+
+    # lines of `-X importtime` are `import time: <self, us> | <cumulative, us> | <indent><module>`
+    times: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or line.endswith('imported package'):
+            continue
+        self_time, cumulative_time, name = line.removeprefix('import time:').split('|')
+        if self_time.strip().isdigit():
+            times[name.strip()] = int(self_time), int(cumulative_time)
+
+    loaded_modules = set(result.stdout.split())
+    return {name: value for name, value in times.items() if name in loaded_modules}, loaded_modules
+
+
+@cli.command()
+def measure(
+    module: str = typer.Option('dbt_af.dags'),
+    repeat: int = typer.Option(5),
+    top: int = typer.Option(15),
+    budget_ms: float = typer.Option(None, help='fail if the median import time exceeds the budget'),
+):
+    totals = []
+    for _ in range(repeat):
+        times, loaded_modules = _import_times(module)
+        totals.append(sum(self_time for self_time, _ in times.values()) / 1000)
+
+    typer.echo(f'{module}: {len(loaded_modules)} new modules, median {statistics.median(totals):.1f} ms')
+    typer.echo(f'  runs, ms: {", ".join(f"{total:.1f}" for total in totals)}')
+    typer.echo('  slowest modules (self / cumulative, ms) in the last run:')
+    for name, (self_time, cumulative_time) in sorted(times.items(), key=lambda item: -item[1][0])[:top]:
+        typer.echo(f'    {self_time / 1000:>8.1f} {cumulative_time / 1000:>8.1f}  {name}')
+
+    failed = False
+    if eager_modules := sorted(loaded_modules.intersection(DEFERRED_MODULES)):
+        typer.echo(f'modules of optional targets are imported eagerly: {", ".join(eager_modules)}', err=True)
+        failed = True
+    if budget_ms is not None and statistics.median(totals) > budget_ms:
+        typer.echo(f'median import time exceeds the budget of {budget_ms:.1f} ms', err=True)
+        failed = True
+    if failed:
+        raise typer.Exit(1)
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,98 @@
+"""
+Compares peak RSS and wall time of manifest loading strategies.
+
+Every strategy is measured in a fresh interpreter, so peak RSS of one run doesn't affect the others:
+
+    python -m scripts.benchmarks.manifest_loading compare path/to/manifest.json
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import typer
+
+cli = typer.Typer()
+
+LOADERS = ('json', 'in_memory', 'streaming')
+
+
+def _load(manifest_path: Path, loader: str) -> dict:
+    from dbt_af.parser.dbt_manifest_loader import load_manifest
+
+    if loader == 'json':
+        # the way manifest was loaded before dbt_manifest_loader was introduced
+        with open(manifest_path) as fin:
+            return json.load(fin)
+    return load_manifest(manifest_path, streaming=loader == 'streaming')
+
+
+def _validate(manifest: dict) -> int:
+    from dbt_af.parser.dbt_node_model import DbtNode
+    from dbt_af.parser.dbt_source_model import DbtSource
+
+    nodes = [DbtNode(**node) for node in manifest['nodes'].values()]
+    sources = [DbtSource(**source) for source in manifest['sources'].values()]
+    return len(nodes) + len(sources)
+
+
+@cli.command(hidden=True)
+def measure(manifest_path: Path, loader: str):
+    # import everything beforehand to measure only loading and validation
+    import dbt_af.parser.dbt_manifest_loader  # noqa: F401
+    import dbt_af.parser.dbt_node_model  # noqa: F401
+    import dbt_af.parser.dbt_source_model  # noqa: F401
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    manifest = _load(manifest_path, loader)
+    load_time = time.perf_counter() - start
+    n_objects = _validate(manifest)
+    total_time = time.perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(
+        json.dumps(
+            {
+                'loader': loader,
+                'objects': n_objects,
+                'load_time_s': round(load_time, 3),
+                'total_time_s': round(total_time, 3),
+                # ru_maxrss is in kilobytes on linux
+                'peak_rss_mb': round(peak_rss / 1024, 1),
+                'peak_rss_delta_mb': round((peak_rss - rss_before) / 1024, 1),
+            }
+        )
+    )
+
+
+@cli.command()
+def compare(manifest_path: Path, repeats: int = typer.Option(3, help='number of runs for each loader')):
+    from dbt_af.parser.dbt_manifest_loader import is_ijson_installed
+
+    loaders = [loader for loader in LOADERS if loader != 'streaming' or is_ijson_installed()]
+    typer.echo(f'manifest size: {manifest_path.stat().st_size / 2**20:.1f} MB')
+    typer.echo(f'{"loader":<10} {"objects":>8} {"load, s":>8} {"total, s":>9} {"peak RSS, MB":>13}')
+    for loader in loaders:
+        runs = []
+        for _ in range(repeats):
+            output = subprocess.run(
+                [sys.executable, '-m', 'scripts.benchmarks.manifest_loading', 'measure', str(manifest_path), loader],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+
+        best = min(runs, key=lambda run: run['total_time_s'])
+        typer.echo(
+            f'{loader:<10} {best["objects"]:>8} {best["load_time_s"]:>8} {best["total_time_s"]:>9} '
+            f'{max(run["peak_rss_mb"] for run in runs):>13}'
+        )
+
+
+if __name__ == '__main__':
+    cli()
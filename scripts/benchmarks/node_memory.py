@@ -0,0 +1,65 @@
+"""
+Compares memory footprint and attribute access cost of validated pydantic `DbtNode` and `CompactDbtNode`:
+
+    python -m scripts.benchmarks.node_memory --n-models 20000
+"""
+
+import gc
+import time
+import tracemalloc
+from typing import Callable
+
+import typer
+
+from dbt_af.conf import DbtDefaultTargetsConfig
+from dbt_af.parser.dbt_compact_node import CompactDbtNode
+from dbt_af.parser.dbt_manifest_loader import slim_manifest
+from dbt_af.parser.dbt_node_model import DbtNode
+from scripts.benchmarks.synthetic_manifest import generate_manifest
+
+cli = typer.Typer()
+
+
+def _retained_memory(build: Callable[[], list]) -> tuple[list, int]:
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objects, retained
+
+
+def _access_time(nodes: list, default_dbt_targets: DbtDefaultTargetsConfig, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for node in nodes:
+            # typical attribute accesses of dbt-af builder for one node
+            node.domain, node.resource_name, node.depends_on, node.config.schedule, node.config.dependencies
+            node.is_small_test(), node.is_large_test(), node.target_environment(default_dbt_targets)
+    return time.perf_counter() - start
+
+
+@cli.command()
+def compare(n_models: int = typer.Option(20_000), repeats: int = typer.Option(3)):
+    records = list(slim_manifest(generate_manifest(n_models))['nodes'].values())
+    default_dbt_targets = DbtDefaultTargetsConfig(default_target='default')
+
+    dbt_nodes, dbt_nodes_memory = _retained_memory(lambda: [DbtNode(**record) for record in records])
+    # pydantic nodes are dropped right after conversion, as it's done in DbtAfGraph.from_manifest
+    compact_nodes, compact_nodes_memory = _retained_memory(
+        lambda: [CompactDbtNode.from_dbt_node(DbtNode(**record)) for record in records]
+    )
+
+    typer.echo(f'nodes: {len(records)}')
+    typer.echo(f'{"node type":<16} {"bytes/node":>10} {"access, s":>10}')
+    for name, nodes, memory in (
+        ('DbtNode', dbt_nodes, dbt_nodes_memory),
+        ('CompactDbtNode', compact_nodes, compact_nodes_memory),
+    ):
+        access_time = _access_time(nodes, default_dbt_targets, repeats)
+        typer.echo(f'{name:<16} {memory // len(nodes):>10} {access_time:>10.3f}')
+
+
+if __name__ == '__main__':
+    cli()
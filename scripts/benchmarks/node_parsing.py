@@ -0,0 +1,55 @@
+"""
+Compares serial and parallel validation of manifest nodes and shows hit rate of node configs cache:
+
+    python -m scripts.benchmarks.node_parsing --n-models 20000 --max-workers 4
+"""
+
+import time
+from typing import Optional
+
+import typer
+
+from dbt_af.conf import DbtDefaultTargetsConfig, ParallelParsingConfig
+from dbt_af.parser.dbt_manifest_loader import slim_manifest
+from dbt_af.parser.dbt_nodes_parser import DbtNodeConfigsCache, parse_dbt_nodes
+from dbt_af.parser.dbt_profiles import Profile
+from scripts.benchmarks.synthetic_manifest import generate_manifest
+
+cli = typer.Typer()
+
+
+@cli.command()
+def compare(
+    n_models: int = typer.Option(20_000),
+    chunk_size: int = typer.Option(2_000),
+    max_workers: Optional[int] = typer.Option(None),
+):
+    manifest_nodes = slim_manifest(generate_manifest(n_models))['nodes']
+    target = {'type': 'postgres', 'schema': 'dwh'}
+    project_profile = Profile(
+        target='dev',
+        outputs={name: target for name in ('dev', 'py_cluster', 'sql_cluster', 'daily_sql_cluster')},
+    )
+    default_dbt_targets = DbtDefaultTargetsConfig(default_target='dev')
+
+    typer.echo(f'nodes: {len(manifest_nodes)}')
+    for name, parallel_parsing in (
+        ('serial', None),
+        ('parallel', ParallelParsingConfig(min_nodes=0, chunk_size=chunk_size, max_workers=max_workers)),
+    ):
+        configs_cache = DbtNodeConfigsCache()
+        start = time.perf_counter()
+        parse_dbt_nodes(
+            manifest_nodes,
+            project_profile,
+            default_dbt_targets,
+            parallel_parsing=parallel_parsing,
+            configs_cache=configs_cache,
+        )
+        typer.echo(
+            f'{name:<10} {time.perf_counter() - start:.3f} s, configs cache hit rate {configs_cache.hit_rate:.1%}'
+        )
+
+
+if __name__ == '__main__':
+    cli()
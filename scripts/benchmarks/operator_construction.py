@@ -0,0 +1,85 @@
+"""
+Compares creating `DbtRun` operators through the whole init stack of airflow operators and stamping them from
+a prototype (`DbtBaseActionOperator.stamp`), and materialization of DAGs of a synthetic manifest with and without
+prototypes:
+
+    python -m scripts.benchmarks.operator_construction --n-operators 10000 --n-models 5000
+"""
+
+import time
+
+import pendulum
+import typer
+from airflow.models.dag import DAG
+
+from dbt_af.builder.dag_materializer import DagMaterializer
+from dbt_af.builder.dbt_af_builder import DbtAfGraph, plan_dags
+from dbt_af.common.scheduling import EScheduleTag
+from dbt_af.operators.run import DbtRun
+from dbt_af.parser.dbt_manifest_loader import slim_manifest
+from dbt_af.parser.dbt_nodes_parser import parse_dbt_nodes
+from scripts.benchmarks.synthetic_manifest import generate_manifest, synthetic_config, synthetic_profile
+
+cli = typer.Typer()
+
+
+def _create_operators(n_operators: int, stamp: bool) -> float:
+    config = synthetic_config()
+    kwargs = {
+        'dbt_af_config': config,
+        'schedule_tag': EScheduleTag.daily(),
+        'is_dataset_enable': False,
+        'overlap': False,
+        'max_active_tis_per_dag': None,
+        'model_type': 'sql',
+        'target_environment': config.dbt_default_targets.default_target,
+        'env': {},
+    }
+
+    dag = DAG('operator_construction', start_date=pendulum.datetime(2024, 1, 1), schedule=None)
+    start = time.perf_counter()
+    prototype = DbtRun(task_id='model_0', model_name='model_0', task_group=None, dag=dag, **kwargs)
+    for i in range(1, n_operators):
+        if stamp:
+            prototype.stamp(f'model_{i}', f'model_{i}', None)
+        else:
+            DbtRun(task_id=f'model_{i}', model_name=f'model_{i}', task_group=None, dag=dag, **kwargs)
+    return time.perf_counter() - start
+
+
+def _materialize(n_models: int, use_prototypes: bool) -> float:
+    config = synthetic_config()
+    manifest = slim_manifest(generate_manifest(n_models))
+    nodes = parse_dbt_nodes(manifest['nodes'], synthetic_profile(), config.dbt_default_targets)
+    plans = plan_dags(DbtAfGraph.from_nodes(nodes, [], config))
+    materializer = DagMaterializer(config, dag_callbacks={}, task_callbacks={}, use_prototypes=use_prototypes)
+
+    start = time.perf_counter()
+    for plan in plans.values():
+        materializer.materialize(plan)
+    return time.perf_counter() - start
+
+
+@cli.command()
+def compare(
+    n_operators: int = typer.Option(10_000),
+    n_models: int = typer.Option(5_000, help='models of the synthetic manifest, 0 to skip materialization'),
+):
+    # the first round warms up imports and caches
+    _create_operators(100, stamp=False)
+
+    created, stamped = _create_operators(n_operators, stamp=False), _create_operators(n_operators, stamp=True)
+    typer.echo(f'{n_operators} DbtRun operators:')
+    typer.echo(f'  created: {created:.2f} s ({created / n_operators * 1e6:.0f} us per operator)')
+    typer.echo(f'  stamped: {stamped:.2f} s ({stamped / n_operators * 1e6:.0f} us per operator)')
+    typer.echo(f'  speedup: x{created / stamped:.1f}')
+
+    if n_models:
+        without_prototypes, with_prototypes = _materialize(n_models, False), _materialize(n_models, True)
+        typer.echo(f'materialization of {n_models} models:')
+        typer.echo(f'  without prototypes: {without_prototypes:.2f} s')
+        typer.echo(f'  with prototypes: {with_prototypes:.2f} s, x{without_prototypes / with_prototypes:.1f}')
+
+
+if __name__ == '__main__':
+    cli()
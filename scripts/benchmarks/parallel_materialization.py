@@ -0,0 +1,83 @@
+"""
+Measures how materialization of dbt-af DAGs scales when domains are split into partitions compiled by separate
+processes (as airflow DAG processors do with one DAG file per partition, see `dbt_af.dags.get_domains_partitions`):
+
+    python -m scripts.benchmarks.parallel_materialization --n-domains 300 --n-partitions 1 --n-partitions 8
+
+Each partition is planned and materialized in its own process, the reported speedup is relative to one process.
+`critical, s` is time of the slowest partition, i.e. the wall time with enough CPUs. The last line shows the cost of
+shipping materialized DAGs between processes in airflow serialized form, which is why DAGs are not built in a pool.
+"""
+
+import multiprocessing
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import typer
+from airflow.serialization.serialized_objects import SerializedDAG
+
+from dbt_af.builder.dag_materializer import DagMaterializer
+from dbt_af.builder.dbt_af_builder import DbtAfGraph, plan_dags, split_domains
+from dbt_af.parser.dbt_manifest_loader import slim_manifest
+from dbt_af.parser.dbt_nodes_parser import parse_dbt_nodes
+from scripts.benchmarks.synthetic_manifest import generate_manifest, synthetic_config, synthetic_profile
+
+cli = typer.Typer()
+
+# graph is inherited by forked workers, so it's not pickled for each partition
+_GRAPH: DbtAfGraph | None = None
+
+
+def _materialize_domains(domains: list[str]) -> tuple[float, int]:
+    start = time.perf_counter()
+    graph = _GRAPH.select_domains(domains)
+    materializer = DagMaterializer(graph.config, dag_callbacks={}, task_callbacks={})
+    dags = [materializer.materialize(plan) for plan in plan_dags(graph).values()]
+    return time.perf_counter() - start, sum(len(dag.tasks) for dag in dags)
+
+
+@cli.command()
+def compare(
+    n_models: int = typer.Option(15_000),
+    n_domains: int = typer.Option(300),
+    n_partitions: list[int] = typer.Option([1, 2, 4, 8]),
+):
+    global _GRAPH
+
+    config = synthetic_config()
+    project_profile = synthetic_profile()
+    manifest = slim_manifest(generate_manifest(n_models, n_domains=n_domains))
+    nodes = parse_dbt_nodes(manifest['nodes'], project_profile, config.dbt_default_targets)
+    _GRAPH = DbtAfGraph.from_nodes(nodes, [], config)
+    domains_weights = Counter(node.domain for node in nodes)
+
+    typer.echo(f'{"partitions":>10} {"wall, s":>8} {"critical, s":>11} {"speedup":>8} {"tasks":>8}')
+    base_time = None
+    for n in n_partitions:
+        partitions = split_domains(domains_weights, n)
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=n, mp_context=multiprocessing.get_context('fork')) as executor:
+            results = list(executor.map(_materialize_domains, partitions))
+        wall_time = time.perf_counter() - start
+        base_time = base_time or wall_time
+
+        critical_time = max(partition_time for partition_time, _ in results)
+        n_tasks = sum(partition_tasks for _, partition_tasks in results)
+        typer.echo(f'{n:>10} {wall_time:>8.2f} {critical_time:>11.2f} {base_time / wall_time:>8.2f} {n_tasks:>8}')
+
+    materializer = DagMaterializer(config, dag_callbacks={}, task_callbacks={})
+    start = time.perf_counter()
+    dags = [materializer.materialize(plan) for plan in plan_dags(_GRAPH).values()]
+    materialize_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for dag in dags:
+        SerializedDAG.from_dict(SerializedDAG.to_dict(dag))
+    round_trip_time = time.perf_counter() - start
+    typer.echo(
+        f'materialization: {materialize_time:.2f}s, serialized round trip of the same DAGs: {round_trip_time:.2f}s'
+    )
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,55 @@
+"""
+Compares ticks of cron expressions of built-in schedule tags computed by `CronExpression` and by croniter: the next
+and the previous tick and all ticks inside a day, as they are used by sensors:
+
+    python -m scripts.benchmarks.schedule_ticks --n-dates 2000
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+import typer
+from croniter import croniter, croniter_range
+
+from dbt_af.common.scheduling import EScheduleTag
+
+cli = typer.Typer()
+
+
+def _tick_with_croniter(raw_cron_expression: str, dttm: datetime, stop: datetime) -> int:
+    croniter(raw_cron_expression, dttm).get_next(datetime)
+    croniter(raw_cron_expression, dttm).get_prev(datetime)
+    return len(list(croniter_range(dttm, stop, raw_cron_expression, ret_type=datetime)))
+
+
+@cli.command()
+def compare(n_dates: int = typer.Option(2_000), seed: int = typer.Option(0)):
+    rnd = random.Random(seed)
+    dates = [datetime(2020, 1, 1) + timedelta(minutes=rnd.randrange(5 * 365 * 24 * 60)) for _ in range(n_dates)]
+    crons = [tag.value().cron_expression() for tag in EScheduleTag]
+    crons = [cron for cron in crons if cron is not None]
+
+    # ticks inside the interval of a daily downstream, the most common case of sensors
+    stops = [dttm + timedelta(days=1) for dttm in dates]
+    for cron in crons:
+        start = time.perf_counter()
+        for dttm, stop in zip(dates, stops):
+            cron.next_run(dttm)
+            cron.prev_run(dttm)
+            cron.runs_between(dttm, stop)
+        closed_form = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for dttm, stop in zip(dates, stops):
+            _tick_with_croniter(cron.raw_cron_expression, dttm, stop)
+        with_croniter = time.perf_counter() - start
+
+        typer.echo(
+            f'{cron.raw_cron_expression:>15}: {closed_form * 1e6 / n_dates:>8.0f} us vs croniter '
+            f'{with_croniter * 1e6 / n_dates:>8.0f} us per date, x{with_croniter / closed_form:.0f}'
+        )
+
+
+if __name__ == '__main__':
+    cli()
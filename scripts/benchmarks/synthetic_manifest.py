@@ -0,0 +1,277 @@
+"""
+Generator of synthetic dbt manifests of arbitrary size for dbt-af benchmarks.
+
+Models are spread across domains, every model depends on a few models of the same or previous domains and about
+a half of models have a small test. The manifest contains only sections that are read by dbt-af, and `raw_code` and
+`columns` are filled to keep the size of records close to real ones. `write_project` puts the manifest together with
+`profiles.yml` and `dbt_project.yml` to a directory, so DAGs could be compiled with `compile_dbt_af_dags`:
+
+    python -m scripts.benchmarks.synthetic_manifest /tmp/synthetic --n-models 20000 --schedule @daily --schedule @hourly
+"""
+
+import hashlib
+import json
+import random
+from pathlib import Path
+from typing import Any, Sequence
+
+import typer
+import yaml
+
+from dbt_af.conf import Config, DbtDefaultTargetsConfig, DbtProjectConfig
+from dbt_af.parser.dbt_profiles import Profile
+
+cli = typer.Typer()
+
+PROJECT_NAME = 'dwh'
+SCHEDULES = ('@daily', '@daily', '@daily', '@hourly', '@weekly')
+LAYERS = ('ods', 'dds', 'cdm')
+
+
+def _model_config(schedule: str, dependencies: dict[str, Any]) -> dict[str, Any]:
+    return {
+        'enabled': True,
+        'alias': None,
+        'schema': 'dwh',
+        'database': None,
+        'tags': [],
+        'meta': {},
+        'group': None,
+        'materialized': 'incremental',
+        'incremental_strategy': 'merge',
+        'persist_docs': {},
+        'quoting': {},
+        'column_types': {},
+        'full_refresh': None,
+        'unique_key': 'id',
+        'on_schema_change': 'ignore',
+        'grants': {},
+        'packages': [],
+        'docs': {'show': True, 'node_color': None},
+        'contract': {'enforced': False, 'alias_types': True},
+        'partition_by': 'event_dt',
+        'post-hook': [],
+        'pre-hook': [],
+        'schedule': schedule,
+        'dependencies': dependencies,
+        'py_cluster': 'py_cluster',
+        'sql_cluster': 'sql_cluster',
+        'daily_sql_cluster': 'daily_sql_cluster',
+        'bf_cluster': 'bf_cluster',
+    }
+
+
+def _node(
+    resource_type: str,
+    unique_id: str,
+    fqn: list[str],
+    path: str,
+    config: dict,
+    depends_on: list[str],
+    tags: Sequence[str] = (),
+) -> dict:
+    return {
+        'database': 'dwh',
+        'schema': 'dwh',
+        'name': fqn[-1],
+        'resource_type': resource_type,
+        'package_name': PROJECT_NAME,
+        'path': path,
+        'original_file_path': f'etl_service/dbt/models/{path}',
+        'unique_id': unique_id,
+        'fqn': fqn,
+        'alias': fqn[-1],
+        'checksum': {'name': 'sha256', 'checksum': hashlib.sha256(unique_id.encode()).hexdigest()},
+        'config': config,
+        'tags': list(tags),
+        'description': f'Synthetic {resource_type} {fqn[-1]}',
+        'columns': {
+            f'column_{i}': {'name': f'column_{i}', 'description': '', 'meta': {}, 'data_type': 'string', 'tags': []}
+            for i in range(10)
+        },
+        'meta': {},
+        'docs': {'show': True, 'node_color': None},
+        'unrendered_config': {'materialized': config['materialized']},
+        'created_at': 1700000000.0,
+        'relation_name': f'dwh.dwh.{fqn[-1]}',
+        'raw_code': '\n'.join(f'select {i} as column_{i}' for i in range(50)),
+        'language': 'sql',
+        'refs': [],
+        'sources': [],
+        'metrics': [],
+        'depends_on': {'macros': [], 'nodes': depends_on},
+        'access': 'protected',
+        'version': None,
+        'latest_version': None,
+    }
+
+
+def _pick_upstreams(
+    rnd: random.Random,
+    domain_candidates: list[str],
+    cross_domain_candidates: list[str],
+    n_dependencies: int,
+    cross_domain_ratio: float | None,
+) -> list[str]:
+    if cross_domain_ratio is None:
+        candidates = domain_candidates + cross_domain_candidates
+        return rnd.sample(candidates, k=min(len(candidates), n_dependencies))
+
+    n_cross_domain = sum(rnd.random() < cross_domain_ratio for _ in range(n_dependencies))
+    return rnd.sample(domain_candidates, k=min(len(domain_candidates), n_dependencies - n_cross_domain)) + rnd.sample(
+        cross_domain_candidates, k=min(len(cross_domain_candidates), n_cross_domain)
+    )
+
+
+def generate_manifest(
+    n_models: int,
+    n_domains: int = 50,
+    max_dependencies: int = 3,
+    tests_ratio: float = 0.5,
+    seed: int = 42,
+    schedules: Sequence[str] = SCHEDULES,
+    test_tags: Sequence[str] = ('',),
+    upstream_window: int = 5,
+    cross_domain_ratio: float | None = None,
+) -> dict[str, Any]:
+    """
+    :param max_dependencies: fan-in, every model depends on up to `max_dependencies` models
+    :param schedules: schedules of domains are drawn from it, repeat schedules to make them more frequent
+    :param test_tags: tags of tests are drawn from it, e.g. `('', '', '@medium', '@large')`; empty tag is a small test
+    :param upstream_window: models depend only on the latest `upstream_window` models of their domain (and on the
+        latest two models of previous three domains), so the smaller the window, the larger fan-out of models
+    :param cross_domain_ratio: share of dependencies on models of other domains; by default all candidates are equal
+    """
+    rnd = random.Random(seed)
+    nodes = {}
+    models_by_domain: dict[int, list[str]] = {n_domain: [] for n_domain in range(n_domains)}
+    domain_schedules = {n_domain: rnd.choice(schedules) for n_domain in range(n_domains)}
+
+    for n_model in range(n_models):
+        n_domain = n_model % n_domains
+        domain = f'domain_{n_domain}'
+        layer = LAYERS[n_model // n_domains % len(LAYERS)]
+        name = f'{domain}__{layer}__model_{n_model}'
+        unique_id = f'model.{PROJECT_NAME}.{name}'
+
+        # upstreams are taken only from already generated models, so the graph is always acyclic
+        depends_on = _pick_upstreams(
+            rnd,
+            models_by_domain[n_domain][-upstream_window:],
+            [
+                upstream
+                for upstream_domain in range(max(0, n_domain - 3), n_domain)
+                for upstream in models_by_domain[upstream_domain][-2:]
+            ],
+            rnd.randint(0, max_dependencies),
+            cross_domain_ratio,
+        )
+
+        nodes[unique_id] = _node(
+            'model',
+            unique_id,
+            [PROJECT_NAME, domain, layer, name],
+            f'{domain}/{layer}/{name}.sql',
+            _model_config(domain_schedules[n_domain], dependencies={}),
+            depends_on,
+        )
+        models_by_domain[n_domain].append(unique_id)
+
+        if rnd.random() < tests_ratio:
+            # a single tag isn't drawn, so manifests with default tags are the same for the same seed
+            test_tag = rnd.choice(test_tags) if len(test_tags) > 1 else test_tags[0]
+            test_name = f'not_null_{name}_id'
+            test_id = f'test.{PROJECT_NAME}.{test_name}.{n_model:010x}'
+            nodes[test_id] = _node(
+                'test',
+                test_id,
+                [PROJECT_NAME, 'dbt', 'models', domain, layer, test_name],
+                f'{domain}/{layer}/{name}.yml',
+                {'enabled': True, 'schema': 'dwh', 'tags': [], 'meta': {}, 'materialized': 'test'},
+                [unique_id],
+                tags=[test_tag] if test_tag else [],
+            )
+
+    return {'metadata': {'dbt_version': '1.10.0'}, 'nodes': nodes, 'sources': {}}
+
+
+def synthetic_config(project_path: Path = Path('.')) -> Config:
+    """
+    dbt-af config for synthetic manifests; paths are read only by `compile_dbt_af_dags` (see `write_project`).
+    """
+    return Config(
+        dbt_project=DbtProjectConfig(
+            dbt_project_name=PROJECT_NAME,
+            dbt_project_path=project_path,
+            dbt_models_path=project_path,
+            dbt_profiles_path=project_path,
+            dbt_target_path=project_path / 'target',
+            dbt_log_path=project_path,
+            dbt_schema=PROJECT_NAME,
+        ),
+        dbt_default_targets=DbtDefaultTargetsConfig(default_target='dev'),
+    )
+
+
+def _profile() -> dict[str, Any]:
+    target = {'type': 'postgres', 'schema': PROJECT_NAME}
+    return {
+        'target': 'dev',
+        'outputs': {name: target for name in ('dev', 'py_cluster', 'sql_cluster', 'daily_sql_cluster')},
+    }
+
+
+def synthetic_profile() -> Profile:
+    """
+    Project profile with all targets used by synthetic models.
+    """
+    return Profile.parse_obj(_profile())
+
+
+def write_project(project_path: Path, manifest: dict[str, Any]) -> Path:
+    """
+    Writes the manifest to `target/manifest.json` of the project together with `profiles.yml` and `dbt_project.yml`
+    that are read by `compile_dbt_af_dags`; returns the path of the manifest.
+    """
+    manifest_path = project_path / 'target' / 'manifest.json'
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, 'w') as fout:
+        json.dump(manifest, fout)
+
+    with open(project_path / 'profiles.yml', 'w') as fout:
+        yaml.safe_dump({PROJECT_NAME: _profile()}, fout)
+    with open(project_path / 'dbt_project.yml', 'w') as fout:
+        yaml.safe_dump({'name': PROJECT_NAME, 'profile': PROJECT_NAME}, fout)
+
+    return manifest_path
+
+
+@cli.command()
+def generate(
+    project_path: Path,
+    n_models: int = typer.Option(20_000, help='number of models'),
+    n_domains: int = typer.Option(50, help='number of domains'),
+    max_dependencies: int = typer.Option(3, help='fan-in: max number of upstreams of a model'),
+    upstream_window: int = typer.Option(5, help='fan-out: models depend only on this number of latest models'),
+    cross_domain_ratio: float = typer.Option(None, help='share of dependencies on models of other domains'),
+    tests_ratio: float = typer.Option(0.5, help='share of models with a test'),
+    schedule: list[str] = typer.Option(list(SCHEDULES), help='schedules of domains, repeat to make more frequent'),
+    test_tag: list[str] = typer.Option([''], help='tags of tests, repeat to make more frequent; empty is small'),
+    seed: int = typer.Option(42, help='random seed'),
+):
+    manifest = generate_manifest(
+        n_models,
+        n_domains=n_domains,
+        max_dependencies=max_dependencies,
+        tests_ratio=tests_ratio,
+        seed=seed,
+        schedules=schedule,
+        test_tags=test_tag,
+        upstream_window=upstream_window,
+        cross_domain_ratio=cross_domain_ratio,
+    )
+    write_project(project_path, manifest)
+
+
+if __name__ == '__main__':
+    cli()
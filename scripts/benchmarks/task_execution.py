@@ -0,0 +1,249 @@
+"""
+Measures the overhead of running a single dbt-af task apart from the dbt command itself: `DbtRun.execute`,
+`DbtSourceFreshnessSensor._check_freshness` and preparation of `DbtKubernetesPodOperator` (the pod is not started).
+Tasks are run against a synthetic project with a manifest of the given size and a stub dbt executable that exits
+immediately, and the latency of each task is broken down by phase:
+
+    python -m scripts.benchmarks.task_execution --n-models 20000 --repeat 20 --budget-ms 200
+
+Pass a script to `--dbt-executable` to include its startup into the `subprocess` phase. The command fails if the
+median latency of any task exceeds the budget.
+"""
+
+import contextlib
+import functools
+import logging
+import shutil
+import statistics
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from unittest import mock
+
+import attrs
+import pendulum
+import typer
+from airflow.hooks.subprocess import SubprocessHook
+from airflow.models.dag import DAG
+from airflow.operators.bash import BashOperator
+
+from dbt_af.common.scheduling import EScheduleTag
+from dbt_af.conf import Config
+from dbt_af.operators import base as base_operators
+from dbt_af.operators import sensors
+from dbt_af.operators.kubernetes_pod import DbtKubernetesPodOperator, KubernetesPodOperator
+from dbt_af.operators.run import DbtRun
+from dbt_af.parser.dbt_profiles import KubernetesTarget
+from scripts.benchmarks.synthetic_manifest import generate_manifest, synthetic_config, write_project
+
+cli = typer.Typer()
+
+STUB_DBT = '#!/bin/sh\nexit 0\n'
+
+
+class _Phases:
+    """
+    Accumulates time spent in wrapped functions of the current run by phase.
+    """
+
+    def __init__(self):
+        self.times: dict[str, float] = defaultdict(float)
+
+    def timed(self, phase: str, fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def _wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.times[phase] += time.perf_counter() - start
+
+        return _wrapper
+
+    def temporary_directory(self) -> type[tempfile.TemporaryDirectory]:
+        phases = self
+
+        class _TimedTemporaryDirectory(tempfile.TemporaryDirectory):
+            def __init__(self, *args, **kwargs):
+                start = time.perf_counter()
+                super().__init__(*args, **kwargs)
+                phases.times['tmp_dir'] += time.perf_counter() - start
+
+            def __exit__(self, *args):
+                start = time.perf_counter()
+                try:
+                    return super().__exit__(*args)
+                finally:
+                    phases.times['tmp_dir'] += time.perf_counter() - start
+
+        return _TimedTemporaryDirectory
+
+
+@contextlib.contextmanager
+def _timed_phases() -> Iterator[_Phases]:
+    phases = _Phases()
+    temporary_directory = phases.temporary_directory()
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(mock.patch.object(base_operators, 'TemporaryDirectory', temporary_directory))
+        stack.enter_context(mock.patch.object(sensors, 'TemporaryDirectory', temporary_directory))
+        stack.enter_context(mock.patch.object(shutil, 'copy', phases.timed('manifest_copy', shutil.copy)))
+        stack.enter_context(mock.patch.object(BashOperator, 'get_env', phases.timed('env', BashOperator.get_env)))
+        stack.enter_context(
+            mock.patch.object(SubprocessHook, 'run_command', phases.timed('subprocess', SubprocessHook.run_command))
+        )
+        stack.enter_context(
+            mock.patch.object(
+                DbtKubernetesPodOperator,
+                '_find_model_config_by_name',
+                phases.timed('manifest_scan', DbtKubernetesPodOperator._find_model_config_by_name),
+            )
+        )
+        yield phases
+
+
+def _context(dag: DAG, task) -> dict[str, Any]:
+    data_interval_start = pendulum.datetime(2024, 1, 1, tz='UTC')
+    return {
+        'dag': dag,
+        'task': task,
+        'params': {},
+        'data_interval_start': data_interval_start,
+        'data_interval_end': data_interval_start.add(days=1),
+        'dag_run': mock.Mock(conf={}),
+        'run_id': 'benchmark',
+    }
+
+
+def _measure(prepare: Callable[[], Callable[[], Any]], repeat: int) -> dict[str, list[float]]:
+    """
+    :param prepare: creates a new operator and returns the function to measure; operators are changed by `execute`,
+        so each run needs a new one
+    """
+    results = defaultdict(list)
+    for _ in range(repeat):
+        run = prepare()
+        with _timed_phases() as phases:
+            start = time.perf_counter()
+            run()
+            total = time.perf_counter() - start
+        for phase, phase_time in phases.times.items():
+            results[phase].append(phase_time)
+        results['other'].append(total - sum(phases.times.values()))
+        results['total'].append(total)
+    return results
+
+
+def _echo(name: str, results: dict[str, list[float]]):
+    typer.echo(f'{name}: median {statistics.median(results["total"]) * 1000:.1f} ms')
+    for phase, times in results.items():
+        if phase != 'total':
+            typer.echo(f'  {phase:<14} {statistics.median(times) * 1000:>8.2f} ms')
+
+
+@cli.command()
+def measure(
+    n_models: int = typer.Option(20_000, help='number of models in the manifest'),
+    repeat: int = typer.Option(20),
+    dbt_executable: str = typer.Option(None, help='dbt executable, by default a stub that exits immediately'),
+    budget_ms: float = typer.Option(None, help='fail if the median latency of any task exceeds the budget'),
+):
+    # logs of every run of operators would bury the results
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as project_dir:
+        project_path = Path(project_dir)
+        manifest = generate_manifest(n_models)
+        write_project(project_path, manifest)
+        model = next(node for node in manifest['nodes'].values() if node['resource_type'] == 'model')
+        del manifest
+        typer.echo(f'manifest.json: {(project_path / "target" / "manifest.json").stat().st_size / 2**20:.1f} MB')
+
+        if dbt_executable is None:
+            dbt_executable = str(project_path / 'dbt')
+            Path(dbt_executable).write_text(STUB_DBT)
+            Path(dbt_executable).chmod(0o755)
+        (project_path / model['path']).parent.mkdir(parents=True)
+        (project_path / model['path']).write_text('def model(dbt, session):\n    return None\n')
+
+        config = attrs.evolve(synthetic_config(project_path), dbt_executable_path=dbt_executable)
+        results = {
+            'DbtRun.execute': _measure(functools.partial(_prepare_run, config, model), repeat),
+            'DbtSourceFreshnessSensor._check_freshness': _measure(
+                functools.partial(_prepare_freshness_check, config), repeat
+            ),
+            'DbtKubernetesPodOperator.execute (without pod)': _measure(
+                functools.partial(_prepare_pod, config, model), repeat
+            ),
+        }
+
+    failed = False
+    for name, task_results in results.items():
+        _echo(name, task_results)
+        if budget_ms is not None and statistics.median(task_results['total']) * 1000 > budget_ms:
+            typer.echo(f'median latency of {name} exceeds the budget of {budget_ms:.1f} ms', err=True)
+            failed = True
+    if failed:
+        raise typer.Exit(1)
+
+
+def _dag() -> DAG:
+    return DAG('task_execution', start_date=pendulum.datetime(2024, 1, 1), schedule=None)
+
+
+def _prepare_run(config: Config, model: dict[str, Any]) -> Callable[[], Any]:
+    dag = _dag()
+    operator = DbtRun(
+        task_id=model['name'],
+        model_name=model['name'],
+        dbt_af_config=config,
+        schedule_tag=EScheduleTag.daily(),
+        target_environment='dev',
+        dag=dag,
+        task_group=None,
+    )
+    return functools.partial(operator.execute, _context(dag, operator))
+
+
+def _prepare_freshness_check(config: Config) -> Callable[[], Any]:
+    sensor = sensors.DbtSourceFreshnessSensor(
+        task_id='freshness',
+        dag=_dag(),
+        env={},
+        source_name='source',
+        source_identifier='table',
+        dbt_af_config=config,
+    )
+    return sensor._check_freshness
+
+
+def _prepare_pod(config: Config, model: dict[str, Any]) -> Callable[[], Any]:
+    dag = _dag()
+    operator = DbtKubernetesPodOperator(
+        task_id=model['name'],
+        dbt_model_name=model['name'],
+        dbt_model_path=model['path'],
+        target_details=KubernetesTarget(
+            type='kubernetes',
+            node_pool_selector_name='pool',
+            node_pool='pool',
+            image_name='image',
+            pod_cpu_guarantee='1',
+            pod_memory_guarantee='1G',
+            tolerations=[],
+        ),
+        dbt_af_config=config,
+        dag=dag,
+    )
+
+    def _execute():
+        # only the preparation of the pod is measured, it's never started
+        with mock.patch.object(KubernetesPodOperator, 'execute'):
+            operator.execute(_context(dag, operator))
+
+    return _execute
+
+
+if __name__ == '__main__':
+    cli()
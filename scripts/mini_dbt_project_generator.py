@@ -1,4 +1,3 @@
-import json
 import os
 import shutil
 from pathlib import Path
@@ -7,6 +6,7 @@ import typer
 import yaml
 
 from dbt_af.builder.dbt_model_path_graph_builder import DbtModelPathGraph
+from dbt_af.parser.dbt_manifest_loader import load_manifest
 
 cli = typer.Typer()
 
@@ -15,8 +15,7 @@ cli = typer.Typer()
 def generate_mini_dbt_projects(manifest_path: str, dbt_project_path: str, result_path: str):
     generate_mini_dbt_template(dbt_project_path, result_path, 'mini_dbt_template')
 
-    with open(manifest_path) as fin:
-        manifest = json.load(fin)
+    manifest = load_manifest(manifest_path)
 
     graph = DbtModelPathGraph.from_manifest(manifest)
 
@@ -0,0 +1,35 @@
+"""
+Generates static DAG files for dbt-af DAGs of the project, so airflow parses them without reading the manifest:
+
+    python -m scripts.static_dags path/to/manifest.json my_dags.dbt_af_config:config dags/dbt_af_generated
+
+The config module must be importable both here and by airflow, and it shouldn't compile DAGs itself.
+"""
+
+import importlib
+
+import typer
+
+from dbt_af.dags import generate_static_dags
+
+cli = typer.Typer()
+
+
+@cli.command()
+def generate(
+    manifest_path: str,
+    config_ref: str,
+    output_dir: str,
+    etl_service_name: str = typer.Option(None),
+):
+    module_name, _, attribute = config_ref.partition(':')
+    config = getattr(importlib.import_module(module_name), attribute)
+
+    changed = generate_static_dags(manifest_path, config, config_ref, output_dir, etl_service_name=etl_service_name)
+    for path in changed:
+        typer.echo(f'{"removed" if not path.exists() else "written"}: {path}')
+    typer.echo(f'{len(changed)} files changed')
+
+
+if __name__ == '__main__':
+    cli()
@@ -13,7 +13,7 @@ import yaml
 from click.testing import CliRunner
 from dbt.cli import dbt_cli
 
-from dbt_af.builder.dbt_af_builder import DbtAfGraph, DbtNode
+from dbt_af.builder.dbt_af_builder import DbtAfGraph
 from dbt_af.conf import (
     Config,
     DbtDefaultTargetsConfig,
@@ -22,6 +22,7 @@ from dbt_af.conf import (
     MCDIntegrationConfig,
     TableauIntegrationConfig,
 )
+from dbt_af.parser.dbt_node_model import DbtNode
 
 # Project specific hack to catch as many error as possible
 DBT_FIXTURES_DIR = Path(__file__).parent.absolute() / 'fixtures'
@@ -293,7 +294,10 @@ class TmpManifest(TestManifest):
 
 @pytest.fixture
 def mock_node_is_etl_service():
-    with patch.object(DbtNode, 'is_at_etl_service', lambda *args, **kwargs: True):
+    with (
+        patch.object(DbtNode, 'is_at_etl_service', lambda *args, **kwargs: True),
+        patch('dbt_af.parser.dbt_nodes_parser.is_node_info_at_etl_service', lambda *args, **kwargs: True),
+    ):
         yield
 
 
@@ -389,6 +393,18 @@ def dags_domain_depends_on_another_partially(compiled_main_dags):
         yield dags
 
 
+@pytest.fixture
+def dags_domain_depends_on_chain_in_another_domain(compiled_main_dags):
+    """
+    A1 -> A2 -> A3
+    A1, A3 -> B1
+    A1 (wait_policy: all), A3 -> B2
+
+    """
+    with compiled_main_dags('domain_depends_on_chain_in_another_domain', with_dbt_run_check=True) as dags:
+        yield dags
+
+
 @pytest.fixture
 def dags_domain_depends_on_two_domains(compiled_main_dags):
     """
@@ -0,0 +1,8 @@
+{{
+    config(
+        materialized="table",
+    )
+}}
+
+
+select 1 as id, 'a' as val
@@ -0,0 +1,9 @@
+{{
+    config(
+        materialized="table",
+    )
+}}
+
+
+select *
+from {{ ref("a2") }}
@@ -0,0 +1,10 @@
+{{
+    config(
+        materialized="table",
+    )
+}}
+
+
+select a3.*
+from {{ ref("a3") }} as a3
+join {{ ref("a1") }} as a1 using (id)
@@ -0,0 +1,11 @@
+{{
+    config(
+        materialized="table",
+        dependencies={"a1": {"wait_policy": "all"}},
+    )
+}}
+
+
+select a3.*
+from {{ ref("a3") }} as a3
+join {{ ref("a1") }} as a1 using (id)
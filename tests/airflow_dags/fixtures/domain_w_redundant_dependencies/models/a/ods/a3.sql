@@ -0,0 +1,10 @@
+{{
+    config(
+        materialized="table",
+    )
+}}
+
+
+select a2.*
+from {{ ref("a2") }} as a2
+join {{ ref("a1") }} as a1 using (id)
@@ -0,0 +1,11 @@
+{{
+    config(
+        materialized="table",
+    )
+}}
+
+
+select a3.*
+from {{ ref("a3") }} as a3
+join {{ ref("a2") }} as a2 using (id)
+join {{ ref("a1") }} as a1 using (id)
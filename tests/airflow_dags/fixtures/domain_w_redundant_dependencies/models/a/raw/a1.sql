@@ -0,0 +1,12 @@
+{{
+    config(
+        materialized="table",
+    )
+}}
+
+
+select 1 as id, 'a' as val
+union all
+select 2 as id, 'b' as val
+union all
+select 3 as id, 'c' as val
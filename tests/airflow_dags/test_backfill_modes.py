@@ -0,0 +1,197 @@
+import json
+from unittest.mock import Mock, patch
+
+import attrs
+import pendulum
+import pytest
+from airflow.exceptions import AirflowException
+from airflow.serialization.serialized_objects import SerializedDAG
+from airflow.utils.dag_parsing_context import _AIRFLOW_PARSING_CONTEXT_DAG_ID
+
+from dbt_af.common.constants import BACKFILL_MODELS_PARAM, BACKFILL_TAG
+from dbt_af.conf import BackfillConfig
+from dbt_af.operators.base import DbtBaseOperator, DbtIntervalActionOperator, DbtModelVars
+from dbt_af.operators.run import DbtRun
+
+
+@pytest.fixture
+def compile_dags(dbt_manifest, get_config, monkeypatch, mock_init_airflow_environment, mock_mcd_callbacks):
+    from dbt_af.dags import compile_dbt_af_dags
+
+    def _compile(backfill_mode: str, dag_id: str = None):
+        with dbt_manifest('sequential_domains') as target_path, monkeypatch.context() as patch_context:
+            config = attrs.evolve(get_config(target_path), backfill=BackfillConfig(mode=backfill_mode))
+            if dag_id is not None:
+                # airflow parsing context manager doesn't unset its variables
+                patch_context.setenv(_AIRFLOW_PARSING_CONTEXT_DAG_ID, dag_id)
+            return compile_dbt_af_dags(str(target_path / 'manifest.json'), config=config)
+
+    return _compile
+
+
+def test_on_demand_backfill_dags_are_not_scheduled(compile_dags):
+    dags = compile_dags('scheduled')
+    on_demand_dags = compile_dags('on_demand')
+
+    assert sorted(on_demand_dags) == sorted(dags)
+    for dag_id, dag in on_demand_dags.items():
+        if not dag_id.endswith('__backfill'):
+            assert SerializedDAG.to_dict(dag) == SerializedDAG.to_dict(dags[dag_id])
+            continue
+
+        scheduled_dag = dags[dag_id]
+        assert scheduled_dag.schedule_interval == '0 0 * * *'
+        assert dag.schedule_interval is None
+        assert not dag.catchup
+        assert BACKFILL_TAG in dag.tags
+        assert sorted(dag.params) == [BACKFILL_MODELS_PARAM, 'end_dttm', 'start_dttm']
+        assert dag.params[BACKFILL_MODELS_PARAM] == []
+
+        assert set(scheduled_dag.task_ids) - set(dag.task_ids) == {'branch', 'do_nothing', 'start_work'}
+        for task in dag.tasks:
+            assert task.upstream_task_ids == scheduled_dag.get_task(task.task_id).upstream_task_ids - {'start_work'}
+
+
+def test_project_backfill_dag_replaces_backfill_dags_of_domains(compile_dags):
+    dags = compile_dags('scheduled')
+    project_dags = compile_dags('project')
+
+    assert sorted(project_dags) == sorted(
+        [dag_id for dag_id in dags if not dag_id.endswith('__backfill')] + ['dwh_dbt_backfill']
+    )
+    backfill_dag = project_dags['dwh_dbt_backfill']
+    assert backfill_dag.schedule_interval is None
+    assert BACKFILL_TAG in backfill_dag.tags
+    assert backfill_dag.task_ids == ['dbt_model']
+    assert backfill_dag.get_task('dbt_model').target_environment == 'prod_bf_cluster'
+    assert project_dags['dwh_dbt_run_model'].get_task('dbt_model').target_environment == 'prod'
+
+    assert list(compile_dags('project', dag_id='dwh_dbt_backfill')) == ['dwh_dbt_backfill']
+    assert compile_dags('scheduled', dag_id='dwh_dbt_backfill') == {}
+
+
+@pytest.mark.parametrize(
+    'selected_models, is_run',
+    [
+        ([], True),
+        (['a1', 'a2'], True),
+        (['a2'], False),
+    ],
+)
+def test_on_demand_backfill_runs_only_selected_models(get_config, tmp_path, selected_models, is_run):
+    operator = DbtRun(
+        task_id='a1__bf',
+        model_name='a1',
+        model_type='sql',
+        dbt_af_config=get_config(tmp_path),
+        target_environment='prod_bf_cluster',
+    )
+    with patch.object(DbtIntervalActionOperator, 'execute') as execute:
+        operator.execute({'params': {BACKFILL_MODELS_PARAM: selected_models}})
+
+    assert execute.called == is_run
+    assert DbtModelVars(start_dttm='a', end_dttm='b', **{BACKFILL_MODELS_PARAM: selected_models}).dict() == {
+        'start_dttm': 'a',
+        'end_dttm': 'b',
+        'overlap': False,
+    }
+
+
+@pytest.mark.parametrize(
+    'start_dttm, end_dttm, expected_interval',
+    [
+        # the data interval of DAG run is used
+        (None, None, ('2024-01-01T00:00:00+00:00', '2024-01-02T00:00:00+00:00')),
+        ('2023-01-01T00:00:00', '2023-06-01T00:00:00', ('2023-01-01T00:00:00', '2023-06-01T00:00:00')),
+    ],
+)
+def test_on_demand_backfill_interval(get_config, tmp_path, start_dttm, end_dttm, expected_interval):
+    operator = DbtRun(
+        task_id='a1__bf',
+        model_name='a1',
+        model_type='sql',
+        dbt_af_config=get_config(tmp_path),
+        target_environment='prod_bf_cluster',
+    )
+    data_interval_start = pendulum.datetime(2024, 1, 1, tz='UTC')
+    with patch.object(DbtBaseOperator, 'execute'):
+        operator.execute(
+            {
+                'params': {'start_dttm': start_dttm, 'end_dttm': end_dttm, BACKFILL_MODELS_PARAM: []},
+                'data_interval_start': data_interval_start,
+                'data_interval_end': data_interval_start.add(days=1),
+            }
+        )
+
+    dbt_vars = json.loads(operator.bash_options['--vars'].strip("'"))
+    assert (dbt_vars['start_dttm'], dbt_vars['end_dttm']) == expected_interval
+
+
+@pytest.mark.parametrize(
+    'start_dttm, end_dttm',
+    [
+        ('2023-01-01T00:00:00+00:00', None),
+        (None, '2023-06-01T00:00:00+00:00'),
+    ],
+)
+def test_on_demand_backfill_interval_must_have_both_ends(get_config, tmp_path, start_dttm, end_dttm):
+    operator = DbtRun(
+        task_id='a1__bf',
+        model_name='a1',
+        model_type='sql',
+        dbt_af_config=get_config(tmp_path),
+        target_environment='prod_bf_cluster',
+    )
+    data_interval_start = pendulum.datetime(2024, 1, 1, tz='UTC')
+    with patch.object(DbtBaseOperator, 'execute') as execute, pytest.raises(AirflowException, match='end_dttm'):
+        operator.execute(
+            {
+                'params': {'start_dttm': start_dttm, 'end_dttm': end_dttm, BACKFILL_MODELS_PARAM: []},
+                'data_interval_start': data_interval_start,
+                'data_interval_end': data_interval_start.add(days=1),
+            }
+        )
+
+    assert not execute.called
+
+
+@pytest.mark.parametrize(
+    'selected_models, is_run',
+    [
+        ([], True),
+        (['a1'], True),
+        (['b1'], False),
+    ],
+)
+def test_on_demand_backfill_of_kubernetes_model(
+    dbt_manifest, get_config, mock_init_airflow_environment, mock_mcd_callbacks, selected_models, is_run
+):
+    from dbt_af.dags import compile_dbt_af_dags
+    from dbt_af.operators.kubernetes_pod import KubernetesPodOperator
+
+    with dbt_manifest('domain_w_task_in_kubernetes') as target_path:
+        config = attrs.evolve(get_config(target_path, with_k8s=True), backfill=BackfillConfig(mode='on_demand'))
+        dags = compile_dbt_af_dags(str(target_path / 'manifest.json'), config=config)
+        operator = dags['a__backfill'].get_task('a1__bf')
+        data_interval_start = pendulum.datetime(2024, 1, 1, tz='UTC')
+        params = {
+            'start_dttm': '2023-01-01T00:00:00+00:00',
+            'end_dttm': '2023-06-01T00:00:00+00:00',
+            BACKFILL_MODELS_PARAM: selected_models,
+        }
+        with patch.object(KubernetesPodOperator, 'execute') as execute:
+            operator.execute(
+                {
+                    'params': params,
+                    'data_interval_start': data_interval_start,
+                    'data_interval_end': data_interval_start.add(days=1),
+                    'dag_run': Mock(conf={}),
+                }
+            )
+
+    assert type(operator).__name__ == 'DbtKubernetesPodOperator'
+    assert execute.called == is_run
+    if is_run:
+        env_vars = {env_var.name: env_var.value for env_var in operator.env_vars}
+        assert env_vars['START_DTTM'] == params['start_dttm']
+        assert env_vars['END_DTTM'] == params['end_dttm']
@@ -120,6 +120,31 @@ def test_domain_depends_on_two_domains_has_correct_dags(dags_domain_depends_on_t
         run_all_tasks_in_dag(dags)
 
 
+def test_domain_depends_on_chain_in_another_domain_waits_only_for_last_upstream(
+    dags_domain_depends_on_chain_in_another_domain,
+    run_airflow_tasks,
+):
+    dags = dags_domain_depends_on_chain_in_another_domain
+
+    b = dags['b__daily']
+    # a3 succeeds only after a1 in the same run of a__daily, so b1 waits only for a3;
+    # b2 waits for all runs of a1, and it's not implied by waits for a3
+    assert sorted(b.task_ids) == [
+        'a__daily__dependencies__group.wait__a1',
+        'a__daily__dependencies__group.wait__a3',
+        'b1',
+        'b2',
+    ]
+    assert node_ids(b.task_dict['b1'].upstream_list) == ['a__daily__dependencies__group.wait__a3']
+    assert node_ids(b.task_dict['b2'].upstream_list) == [
+        'a__daily__dependencies__group.wait__a1',
+        'a__daily__dependencies__group.wait__a3',
+    ]
+
+    if run_airflow_tasks:
+        run_all_tasks_in_dag(dags)
+
+
 def test_hourly_task_with_tests_has_correct_dags(dags_hourly_task_with_tests, run_airflow_tasks):
     dags = dags_hourly_task_with_tests
 
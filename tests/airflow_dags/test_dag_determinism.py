@@ -0,0 +1,68 @@
+import json
+import os
+import pickle
+import subprocess
+import sys
+
+import attrs
+import pytest
+
+from dbt_af.conf.config import DependencyWaitPolicy, ModelDependenciesSection
+
+# prints hashes of serialized DAGs the same way as airflow computes them for `serialized_dag` table
+_DAG_HASHES_SCRIPT = """
+import hashlib
+import json
+import pickle
+import sys
+
+from airflow.serialization.serialized_objects import SerializedDAG
+
+from dbt_af.dags import compile_dbt_af_dags
+
+with open(sys.argv[2], 'rb') as fin:
+    config = pickle.load(fin)
+
+dags = compile_dbt_af_dags(sys.argv[1], config=config)
+print(json.dumps({
+    dag_id: hashlib.md5(json.dumps(SerializedDAG.to_dict(dag), sort_keys=True).encode()).hexdigest()
+    for dag_id, dag in dags.items()
+}))
+"""
+
+
+def _dag_hashes(manifest_path, config_path, hash_seed):
+    result = subprocess.run(
+        [sys.executable, '-c', _DAG_HASHES_SCRIPT, manifest_path, config_path],
+        env={**os.environ, 'PYTHONHASHSEED': str(hash_seed)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    'fixture_name, wait_policy',
+    [
+        ('two_domains_depend_on_two', DependencyWaitPolicy(per_domain=False, per_task=True)),
+        ('domain_depends_on_two_domains', DependencyWaitPolicy(per_domain=False, per_task=True)),
+        ('domain_model_w_maintenance', DependencyWaitPolicy()),
+        ('domain_w_task_in_venv', DependencyWaitPolicy()),
+    ],
+)
+def test_serialized_dags_do_not_depend_on_hash_seed(dbt_manifest, get_config, tmp_path, fixture_name, wait_policy):
+    with dbt_manifest(fixture_name) as target_path:
+        config = attrs.evolve(
+            get_config(target_path),
+            model_dependencies=ModelDependenciesSection(wait_policy=wait_policy),
+        )
+        config_path = tmp_path / 'config.pickle'
+        with open(config_path, 'wb') as fout:
+            pickle.dump(config, fout)
+
+        manifest_path = str(target_path / 'manifest.json')
+        hashes = [_dag_hashes(manifest_path, str(config_path), hash_seed) for hash_seed in range(4)]
+
+    assert hashes[0]
+    assert all(dag_hashes == hashes[0] for dag_hashes in hashes[1:])
@@ -0,0 +1,136 @@
+import copy
+import pickle
+from unittest.mock import patch
+
+import pytest
+from airflow.models.baseoperator import BaseOperator
+
+from dbt_af.builder.dag_materializer import DagMaterializer
+from dbt_af.builder.dbt_af_builder import DbtAfGraph, plan_dags
+from dbt_af.parser.dbt_manifest_loader import load_manifest
+
+
+def _dags_structure(dags):
+    return {
+        dag_id: sorted((task.task_id, sorted(task.downstream_task_ids)) for task in dag.tasks)
+        for dag_id, dag in dags.items()
+    }
+
+
+@pytest.mark.parametrize(
+    'fixture_name',
+    [
+        'domain_depends_on_another_with_test',
+        'domain_w_enable_disable_models',
+        'domain_w_source_freshness',
+        'domain_model_w_maintenance',
+        'two_domains_with_diff_scheduling_and_shifts',
+    ],
+)
+def test_dags_are_planned_without_airflow_objects(
+    dbt_manifest,
+    dbt_profiles,
+    get_config,
+    fixture_name,
+    mock_node_is_etl_service,
+    mock_init_airflow_environment,
+):
+    with dbt_manifest(fixture_name) as target_path, dbt_profiles() as (profiles, profile_name):
+        config = get_config(target_path)
+        manifest = load_manifest(target_path / 'manifest.json')
+
+    graph = DbtAfGraph.from_manifest(manifest, profiles, profile_name, config=config)
+    with patch.object(BaseOperator, '__init__', side_effect=AssertionError('operators must not be created')):
+        plans = plan_dags(graph)
+
+    restored_plans = pickle.loads(pickle.dumps(plans))
+    assert {dag_id: plan.digest for dag_id, plan in restored_plans.items()} == {
+        dag_id: plan.digest for dag_id, plan in plans.items()
+    }
+
+    materializer = DagMaterializer(config, dag_callbacks={}, task_callbacks={})
+    dags = {dag_id: materializer.materialize(plan) for dag_id, plan in restored_plans.items()}
+    for dag_id, plan in plans.items():
+        assert sorted(task.task_id for task in dags[dag_id].tasks) == sorted(task.node_id for task in plan.tasks)
+        assert sum(len(task.downstream_task_ids) for task in dags[dag_id].tasks) >= len(plan.edges)
+
+
+def test_plan_digest_changes_only_for_changed_dags(
+    dbt_manifest,
+    dbt_profiles,
+    get_config,
+    mock_node_is_etl_service,
+    mock_init_airflow_environment,
+):
+    with dbt_manifest('sequential_domains') as target_path, dbt_profiles() as (profiles, profile_name):
+        config = get_config(target_path)
+        manifest = load_manifest(target_path / 'manifest.json')
+
+    changed_manifest = copy.deepcopy(manifest)
+    changed_manifest['nodes']['model.dwh.c1']['config']['enable_from_dttm'] = '2024-01-01T00:00:00'
+
+    digests = {
+        dag_id: plan.digest
+        for dag_id, plan in plan_dags(DbtAfGraph.from_manifest(manifest, profiles, profile_name, config=config)).items()
+    }
+    same_digests = {
+        dag_id: plan.digest
+        for dag_id, plan in plan_dags(DbtAfGraph.from_manifest(manifest, profiles, profile_name, config=config)).items()
+    }
+    changed_digests = {
+        dag_id: plan.digest
+        for dag_id, plan in plan_dags(
+            DbtAfGraph.from_manifest(changed_manifest, profiles, profile_name, config=config)
+        ).items()
+    }
+
+    assert same_digests == digests
+    assert {dag_id for dag_id, digest in changed_digests.items() if digests[dag_id] != digest} == {
+        'c__daily',
+        'c__backfill',
+    }
+
+
+@pytest.mark.parametrize(
+    'fixture_name',
+    [
+        'domain_w_redundant_dependencies',
+        'domain_depends_on_another_with_test',
+        'hourly_task_with_tests',
+        'two_domains_with_diff_scheduling_and_shifts',
+    ],
+)
+def test_edges_are_set_as_with_set_downstream(
+    dbt_manifest,
+    dbt_profiles,
+    get_config,
+    fixture_name,
+    mock_node_is_etl_service,
+    mock_init_airflow_environment,
+):
+    with dbt_manifest(fixture_name) as target_path, dbt_profiles() as (profiles, profile_name):
+        config = get_config(target_path)
+        manifest = load_manifest(target_path / 'manifest.json')
+
+    plans = plan_dags(DbtAfGraph.from_manifest(manifest, profiles, profile_name, config=config))
+    for plan in plans.values():
+        assert len(set(plan.edges)) == len(plan.edges)
+
+    def _set_downstream(plan, nodes):
+        for edge in plan.edges:
+            nodes[edge.upstream].set_downstream(nodes[edge.downstream])
+
+    materializer = DagMaterializer(config, dag_callbacks={}, task_callbacks={})
+    dags = {dag_id: materializer.materialize(plan) for dag_id, plan in plans.items()}
+    with patch.object(DagMaterializer, '_set_edges', side_effect=_set_downstream):
+        expected_dags = {dag_id: materializer.materialize(plan) for dag_id, plan in plans.items()}
+
+    assert _dags_structure(dags) == _dags_structure(expected_dags)
+    for dag_id, dag in dags.items():
+        assert {task.task_id: sorted(task.upstream_task_ids) for task in dag.tasks} == {
+            task.task_id: sorted(task.upstream_task_ids) for task in expected_dags[dag_id].tasks
+        }
+        assert {group_id: sorted(group.downstream_group_ids) for group_id, group in dag.task_group_dict.items()} == {
+            group_id: sorted(group.downstream_group_ids)
+            for group_id, group in expected_dags[dag_id].task_group_dict.items()
+        }
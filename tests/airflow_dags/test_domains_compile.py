@@ -0,0 +1,147 @@
+import attrs
+import pytest
+
+from dbt_af.builder.dag_components import DagModel
+from dbt_af.builder.dbt_af_builder import DbtAfGraph
+from dbt_af.conf import GraphCacheConfig
+from dbt_af.conf.config import DependencyWaitPolicy, ModelDependenciesSection
+from dbt_af.parser.dbt_manifest_loader import load_manifest
+
+
+def _dags_structure(dags):
+    return {
+        dag_id: sorted(
+            (
+                task.task_id,
+                sorted(task.downstream_task_ids),
+                getattr(task, 'external_dag_id', None),
+                getattr(task, 'external_task_id', None),
+            )
+            for task in dag.tasks
+        )
+        for dag_id, dag in dags.items()
+    }
+
+
+@pytest.mark.parametrize(
+    'fixture_name',
+    [
+        'sequential_domains',
+        'domain_depends_on_two_domains',
+        'domain_depends_on_chain_in_another_domain',
+        'domain_depends_on_another_with_test',
+        'domain_depends_on_another_with_multischeduling',
+        'two_domains_with_diff_scheduling_and_shifts',
+        'domain_w_source_freshness',
+    ],
+)
+@pytest.mark.parametrize('wait_policy', [DependencyWaitPolicy(), DependencyWaitPolicy(per_domain=False, per_task=True)])
+def test_domains_graph_equals_full_graph(
+    dbt_manifest,
+    dbt_profiles,
+    get_config,
+    fixture_name,
+    wait_policy,
+    mock_node_is_etl_service,
+    mock_init_airflow_environment,
+    mock_mcd_callbacks,
+):
+    from dbt_af.dags import dbt_main_dags
+
+    with dbt_manifest(fixture_name) as target_path, dbt_profiles() as (profiles, profile_name):
+        config = attrs.evolve(
+            get_config(target_path),
+            model_dependencies=ModelDependenciesSection(wait_policy=wait_policy),
+        )
+        manifest = load_manifest(target_path / 'manifest.json')
+
+    full_graph = DbtAfGraph.from_manifest(manifest, profiles, profile_name, config=config)
+    full_af_dags = dbt_main_dags(full_graph)
+    full_dags = _dags_structure(full_af_dags)
+
+    for node in full_graph.nodes:
+        if isinstance(node, DagModel):
+            task_ids = {
+                task.task_id.split('.')[-1]: task.task_id for task in full_af_dags[node.domain_dag.dag_name].tasks
+            }
+            assert node.sensor_endpoint_task_id == task_ids.get(f'{node.safe_name}__end', task_ids[node.safe_name])
+
+    domains = {node.domain_dag.domain_name for node in full_graph.nodes}
+    for domain in domains:
+        graph = DbtAfGraph.from_manifest(manifest, profiles, profile_name, config=config, domains=[domain])
+        dags = _dags_structure(dbt_main_dags(graph))
+
+        assert dags == {
+            dag_id: structure
+            for dag_id, structure in full_dags.items()
+            if any(node.domain_dag.dag_name == dag_id for node in graph.nodes)
+        }
+        assert {node.domain_dag.domain_name for node in graph.nodes} == {domain}
+
+
+def test_compile_dbt_af_dags_for_domains(
+    dbt_manifest,
+    get_config,
+    tmp_path,
+    mock_init_airflow_environment,
+    mock_mcd_callbacks,
+):
+    from dbt_af.dags import compile_dbt_af_dags
+
+    with dbt_manifest('sequential_domains') as target_path:
+        config = attrs.evolve(get_config(target_path), include_single_model_manual_dag=True)
+        manifest_path = str(target_path / 'manifest.json')
+
+        full_dags = _dags_structure(compile_dbt_af_dags(manifest_path, config=config))
+        domains_dags = _dags_structure(compile_dbt_af_dags(manifest_path, config=config, domains=['b']))
+        cached_domains_dags = _dags_structure(
+            compile_dbt_af_dags(
+                manifest_path,
+                config=attrs.evolve(config, graph_cache=GraphCacheConfig(cache_dir=tmp_path / 'cache')),
+                domains=['b'],
+            )
+        )
+
+    assert 'dwh_dbt_run_model' in full_dags
+    assert sorted(domains_dags) == ['b__backfill', 'b__daily']
+    assert domains_dags == {dag_id: full_dags[dag_id] for dag_id in domains_dags}
+    assert cached_domains_dags == domains_dags
+
+
+def test_split_domains_balances_weights():
+    from dbt_af.builder.dbt_af_builder import split_domains
+
+    domains_weights = {'a': 5, 'b': 4, 'c': 3, 'd': 3, 'e': 1}
+
+    assert split_domains(domains_weights, 2) == [['a', 'd'], ['b', 'c', 'e']]
+    assert split_domains(dict(reversed(domains_weights.items())), 2) == split_domains(domains_weights, 2)
+    assert split_domains(domains_weights, 10) == [['a'], ['b'], ['c'], ['d'], ['e']]
+    with pytest.raises(ValueError):
+        split_domains(domains_weights, 0)
+
+
+def test_compile_dbt_af_dags_for_domains_partitions(
+    dbt_manifest,
+    get_config,
+    mock_init_airflow_environment,
+    mock_mcd_callbacks,
+):
+    from dbt_af.dags import compile_dbt_af_dags, dbt_run_model_dag_name, get_domains_partitions
+
+    with dbt_manifest('two_domains_depend_on_two') as target_path:
+        config = get_config(target_path)
+        manifest_path = str(target_path / 'manifest.json')
+
+        full_dags = _dags_structure(compile_dbt_af_dags(manifest_path, config=config))
+        # system DAGs are compiled only without domains
+        full_dags.pop(dbt_run_model_dag_name(config), None)
+        partitions = get_domains_partitions(manifest_path, 2)
+        partitions_dags = [
+            _dags_structure(compile_dbt_af_dags(manifest_path, config=config, domains=partition))
+            for partition in partitions
+        ]
+
+    assert len(partitions) == 2
+    assert sorted(domain for partition in partitions for domain in partition) == ['a', 'b', 'c', 'd']
+    assert sum(len(dags) for dags in partitions_dags) == len(full_dags)
+    assert {dag_id: structure for dags in partitions_dags for dag_id, structure in dags.items()} == full_dags
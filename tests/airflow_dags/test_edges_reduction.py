@@ -0,0 +1,127 @@
+import attrs
+import pendulum
+import pytest
+from airflow.models.dag import DAG
+from airflow.operators.empty import EmptyOperator
+from airflow.operators.python import BranchPythonOperator
+from airflow.utils.trigger_rule import TriggerRule
+
+from dbt_af.builder.dag_materializer import DagMaterializer
+from dbt_af.builder.dbt_af_builder import DbtAfGraph, plan_dags
+from dbt_af.builder.edges_reduction import count_edges, reduce_transitive_edges
+from dbt_af.conf.config import DependencyWaitPolicy, ModelDependenciesSection
+from dbt_af.parser.dbt_manifest_loader import load_manifest
+
+
+def _edges(dag):
+    return {(task.task_id, downstream_task_id) for task in dag.tasks for downstream_task_id in task.downstream_task_ids}
+
+
+def _descendants(dag):
+    return {task.task_id: task.get_flat_relative_ids(upstream=False) for task in dag.tasks}
+
+
+def test_reduce_transitive_edges():
+    with DAG('reduction', start_date=pendulum.datetime(2024, 1, 1), schedule=None) as dag:
+        a, b, c, d, e = (EmptyOperator(task_id=task_id) for task_id in 'abcde')
+        branch = BranchPythonOperator(task_id='branch', python_callable=lambda: 'b')
+        after_all = EmptyOperator(task_id='after_all', trigger_rule=TriggerRule.ALL_DONE)
+
+        a >> b >> c >> d
+        a >> c
+        a >> d
+        # branch decides only on its direct downstreams
+        branch >> b
+        branch >> c
+        # `after_all` runs even if `a` fails, so it doesn't imply `a >> e`
+        a >> after_all >> e
+        a >> e
+        b >> after_all
+
+    assert reduce_transitive_edges(dag) == (11, 9)
+    assert _edges(dag) == {
+        ('a', 'b'),
+        ('b', 'c'),
+        ('c', 'd'),
+        ('branch', 'b'),
+        ('branch', 'c'),
+        ('a', 'after_all'),
+        ('b', 'after_all'),
+        ('after_all', 'e'),
+        ('a', 'e'),
+    }
+    assert c.upstream_task_ids == {'b', 'branch'}
+    assert d.upstream_task_ids == {'c'}
+
+
+@pytest.mark.parametrize(
+    'fixture_name, wait_policy',
+    [
+        ('domain_w_redundant_dependencies', DependencyWaitPolicy()),
+        ('two_tasks_depend_on_two', DependencyWaitPolicy()),
+        ('task_depends_on_two_within_same_domain', DependencyWaitPolicy()),
+        ('hourly_task_with_tests', DependencyWaitPolicy()),
+        ('domain_depends_on_another_with_test', DependencyWaitPolicy(per_domain=False, per_task=True)),
+        ('domain_w_enable_disable_models', DependencyWaitPolicy()),
+        ('domain_model_w_maintenance', DependencyWaitPolicy()),
+    ],
+)
+def test_reduced_dags_keep_dependencies(
+    dbt_manifest,
+    dbt_profiles,
+    get_config,
+    fixture_name,
+    wait_policy,
+    mock_node_is_etl_service,
+    mock_init_airflow_environment,
+):
+    with dbt_manifest(fixture_name) as target_path, dbt_profiles() as (profiles, profile_name):
+        config = attrs.evolve(
+            get_config(target_path), model_dependencies=ModelDependenciesSection(wait_policy=wait_policy)
+        )
+        manifest = load_manifest(target_path / 'manifest.json')
+
+    graph = DbtAfGraph.from_manifest(manifest, profiles, profile_name, config=config)
+    plans = plan_dags(graph)
+    dags = DagMaterializer(config, dag_callbacks={}, task_callbacks={}).materialize
+    reduced_dags = DagMaterializer(
+        attrs.evolve(
+            config,
+            model_dependencies=ModelDependenciesSection(wait_policy=wait_policy, reduce_transitive_edges=True),
+        ),
+        dag_callbacks={},
+        task_callbacks={},
+    ).materialize
+
+    for plan in plans.values():
+        dag, reduced_dag = dags(plan), reduced_dags(plan)
+        assert _edges(reduced_dag) <= _edges(dag)
+        assert _descendants(reduced_dag) == _descendants(dag)
+        assert reduce_transitive_edges(reduced_dag) == (count_edges(reduced_dag), count_edges(reduced_dag))
+
+
+def test_reduced_dag_of_domain_w_redundant_dependencies(
+    dbt_manifest,
+    dbt_profiles,
+    get_config,
+    mock_node_is_etl_service,
+    mock_init_airflow_environment,
+):
+    with dbt_manifest('domain_w_redundant_dependencies') as target_path, dbt_profiles() as (profiles, profile_name):
+        config = attrs.evolve(
+            get_config(target_path), model_dependencies=ModelDependenciesSection(reduce_transitive_edges=True)
+        )
+        manifest = load_manifest(target_path / 'manifest.json')
+
+    graph = DbtAfGraph.from_manifest(manifest, profiles, profile_name, config=config)
+    dag = DagMaterializer(config, dag_callbacks={}, task_callbacks={}).materialize(plan_dags(graph)['a__daily'])
+
+    assert _edges(dag) == {
+        ('a1', 'a2__group.a2'),
+        ('a2__group.a2', 'a2__group.not_null_a2_id'),
+        ('a2__group.not_null_a2_id', 'a2__group.a2__end'),
+        ('a2__group.a2__end', 'a3'),
+        ('a3', 'a4'),
+    }
+    # group dependencies are kept for the graph view
+    assert dag.task_group_dict['a2__group'].upstream_task_ids == {'a1'}
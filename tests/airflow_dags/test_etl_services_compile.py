@@ -0,0 +1,53 @@
+import json
+from unittest.mock import patch
+
+from dbt_af.parser.dbt_node_model import DbtNode
+
+
+def _dags_structure(dags):
+    return {
+        dag_id: sorted((task.task_id, sorted(task.downstream_task_ids)) for task in dag.tasks)
+        for dag_id, dag in dags.items()
+    }
+
+
+def test_compile_dbt_af_dags_for_etl_services(
+    dbt_manifest,
+    get_config,
+    mock_init_airflow_environment,
+    mock_mcd_callbacks,
+):
+    from dbt_af.dags import compile_dbt_af_dags, compile_dbt_af_dags_for_etl_services
+
+    with dbt_manifest('independent_domains') as target_path:
+        config = get_config(target_path)
+        manifest_path = target_path / 'manifest.json'
+
+        # move models of domain `b` to another etl service
+        with open(manifest_path) as fin:
+            manifest = json.load(fin)
+        for node_info in manifest['nodes'].values():
+            if node_info['resource_type'] == 'model' and node_info['fqn'][1] == 'b':
+                node_info['original_file_path'] = node_info['original_file_path'].replace('etl_service/', 'b_service/')
+        with open(manifest_path, 'w') as fout:
+            json.dump(manifest, fout)
+
+        etl_service_names = ['etl_service', 'b_service', 'unknown_service']
+        with patch('dbt_af.parser.dbt_nodes_parser.DbtNode', wraps=DbtNode) as dbt_node_mock:
+            etl_services_dags = compile_dbt_af_dags_for_etl_services(
+                str(manifest_path), config=config, etl_service_names=etl_service_names
+            )
+        separate_dags = {
+            etl_service_name: compile_dbt_af_dags(str(manifest_path), config=config, etl_service_name=etl_service_name)
+            for etl_service_name in etl_service_names
+        }
+
+    # each node is validated only once and only if it belongs to one of the services
+    assert dbt_node_mock.call_count == len(
+        [node_info for node_info in manifest['nodes'].values() if node_info['resource_type'] == 'model']
+    )
+    assert {name: _dags_structure(dags) for name, dags in etl_services_dags.items()} == {
+        name: _dags_structure(dags) for name, dags in separate_dags.items()
+    }
+    assert 'b__daily' in etl_services_dags['b_service']
+    assert 'b__daily' not in etl_services_dags['etl_service']
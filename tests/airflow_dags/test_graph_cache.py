@@ -0,0 +1,123 @@
+import os
+from unittest.mock import patch
+
+import attrs
+import pytest
+
+from dbt_af.builder.dbt_af_builder import DbtAfGraph
+from dbt_af.builder.graph_cache import DbtAfGraphCache, graph_cache_key
+from dbt_af.conf import CustomAfCallbacksConfig, GraphCacheConfig
+
+
+@pytest.fixture
+def cached_config(get_config, tmp_path):
+    def _cached_config(target_path, **kwargs):
+        return attrs.evolve(
+            get_config(target_path),
+            graph_cache=GraphCacheConfig(cache_dir=tmp_path / 'graph_cache', **kwargs),
+        )
+
+    return _cached_config
+
+
+def _dags_structure(dags):
+    return {
+        dag_id: sorted((task.task_id, sorted(task.downstream_task_ids)) for task in dag.tasks)
+        for dag_id, dag in dags.items()
+    }
+
+
+def test_compile_dbt_af_dags_uses_graph_cache(
+    dbt_manifest,
+    cached_config,
+    mock_init_airflow_environment,
+    mock_mcd_callbacks,
+):
+    from dbt_af.dags import compile_dbt_af_dags
+
+    with dbt_manifest('domain_depends_on_another_with_test') as target_path:
+        config = cached_config(target_path)
+        manifest_path = target_path / 'manifest.json'
+
+        dags = compile_dbt_af_dags(str(manifest_path), config=config)
+        assert len(list(config.graph_cache.cache_dir.glob('*.graph'))) == 1
+
+        with patch.object(DbtAfGraph, 'from_manifest', side_effect=AssertionError('graph must be loaded from cache')):
+            cached_dags = compile_dbt_af_dags(str(manifest_path), config=config)
+
+    assert _dags_structure(cached_dags) == _dags_structure(dags)
+
+
+def test_graph_cache_key(dbt_manifest, get_config):
+    with dbt_manifest('sequential_domains') as target_path:
+        config = get_config(target_path)
+        paths = (
+            target_path / 'manifest.json',
+            target_path.parent / 'profiles.yml',
+            target_path.parent / 'dbt_project.yml',
+        )
+
+        key = graph_cache_key(*paths, config=config)
+        assert key == graph_cache_key(*paths, config=get_config(target_path))
+        assert key != graph_cache_key(*paths, config=config, etl_service_name='other')
+        assert key != graph_cache_key(*paths, config=attrs.evolve(config, max_active_dag_runs=1))
+        assert key == graph_cache_key(
+            *paths, config=attrs.evolve(config, graph_cache=GraphCacheConfig(cache_dir=target_path))
+        )
+
+        with open(paths[0], 'a') as fout:
+            fout.write(' ')
+        assert key != graph_cache_key(*paths, config=config)
+
+
+def test_graph_cache_substitutes_config(get_config, tmp_path):
+    config = get_config(tmp_path / 'target')
+    graph_cache = DbtAfGraphCache(GraphCacheConfig(cache_dir=tmp_path / 'cache'))
+
+    # lambdas could not be pickled, so config must be stored out of band
+    config = attrs.evolve(config, af_callbacks=CustomAfCallbacksConfig(task_on_failure_callback=(lambda ctx: None,)))
+    graph_cache.save('key', DbtAfGraph([], [], config))
+
+    graph = graph_cache.load('key', config)
+    assert graph.config is config
+    assert graph._domain_dags_registry.config is config
+
+
+def test_graph_cache_broken_entry_is_miss(get_config, tmp_path):
+    config = get_config(tmp_path / 'target')
+    graph_cache = DbtAfGraphCache(GraphCacheConfig(cache_dir=tmp_path / 'cache'))
+
+    assert graph_cache.load('key', config) is None
+
+    graph_cache.save('key', DbtAfGraph([], [], config))
+    with open(graph_cache.entry_path('key'), 'r+b') as fout:
+        fout.truncate(10)
+    assert graph_cache.load('key', config) is None
+
+
+def test_graph_cache_eviction(get_config, tmp_path):
+    config = get_config(tmp_path / 'target')
+    graph_cache = DbtAfGraphCache(GraphCacheConfig(cache_dir=tmp_path / 'cache', max_entries=2))
+
+    for n_key, key in enumerate(('first', 'second', 'third')):
+        graph_cache.save(key, DbtAfGraph([], [], config))
+        os.utime(graph_cache.entry_path(key), (n_key, n_key))
+
+    # the least recently used entry goes first
+    assert graph_cache.load('first', config) is None
+    assert graph_cache.load('second', config) is not None
+    graph_cache.save('fourth', DbtAfGraph([], [], config))
+
+    assert sorted(path.name for path in graph_cache.cache_dir.iterdir()) == ['fourth.graph', 'second.graph']
+
+
+def test_graph_cache_size_eviction(get_config, tmp_path):
+    config = get_config(tmp_path / 'target')
+    graph_cache = DbtAfGraphCache(GraphCacheConfig(cache_dir=tmp_path / 'cache', max_size_mb=0))
+
+    graph_cache.save('first', DbtAfGraph([], [], config))
+    os.utime(graph_cache.entry_path('first'), (0, 0))
+    graph_cache.save('second', DbtAfGraph([], [], config))
+
+    # the most recent entry is always kept
+    assert [path.name for path in graph_cache.cache_dir.iterdir()] == ['second.graph']
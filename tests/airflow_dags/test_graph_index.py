@@ -0,0 +1,23 @@
+from dbt_af.builder.dbt_af_builder import DbtAfGraph, get_domain_dags_start_dates
+from dbt_af.parser.dbt_manifest_loader import load_manifest
+
+
+def test_dbt_nodes_index(dbt_manifest, dbt_profiles, get_config, mock_node_is_etl_service):
+    with dbt_manifest('hourly_task_with_tests') as target_path, dbt_profiles() as (profiles, profile_name):
+        config = get_config(target_path)
+        graph = DbtAfGraph.from_manifest(load_manifest(target_path / 'manifest.json'), profiles, profile_name, config)
+
+    index = graph.nodes_index
+    assert [node.resource_name for node in index.models] == ['a1']
+    assert [node.test_type for node in index.small_tests] == ['@small']
+    assert [node.test_type for node in index.medium_tests] == ['@medium']
+    assert [node.test_type for node in index.large_tests] == ['@large']
+    assert sorted(node.unique_id for node in index.dependents['model.dwh.a1']) == sorted(
+        node.unique_id for node in index.small_tests + index.medium_tests + index.large_tests
+    )
+    assert index.find_parent_model_id(index.medium_tests[0]) == 'model.dwh.a1'
+
+    start_dates = get_domain_dags_start_dates(graph)
+    assert len(start_dates) == len({node.domain_dag.dag_name for node in graph.nodes})
+    # domain start dates aren't set in the project, so the default one is used
+    assert set(start_dates.values()) == {config.dag_start_date}
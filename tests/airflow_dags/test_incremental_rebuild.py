@@ -0,0 +1,146 @@
+import copy
+import json
+from unittest.mock import patch
+
+import attrs
+import pytest
+
+from dbt_af.builder.dbt_af_builder import DbtAfGraph
+from dbt_af.builder.incremental import ManifestFingerprints, rebuild_graph
+from dbt_af.conf import GraphCacheConfig
+from dbt_af.parser.dbt_manifest_loader import load_manifest
+
+
+def _dags_structure(dags):
+    return {
+        dag_id: sorted(
+            (
+                task.task_id,
+                sorted(task.downstream_task_ids),
+                getattr(task, 'external_dag_id', None),
+                getattr(task, 'external_task_id', None),
+            )
+            for task in dag.tasks
+        )
+        for dag_id, dag in dags.items()
+    }
+
+
+def _set_schedule(manifest, model_name, schedule):
+    manifest['nodes'][f'model.dwh.{model_name}']['config']['schedule'] = schedule
+
+
+def _change_code(manifest, model_name):
+    manifest['nodes'][f'model.dwh.{model_name}']['checksum']['checksum'] = 'changed'
+
+
+def _remove_model(manifest, model_name):
+    del manifest['nodes'][f'model.dwh.{model_name}']
+
+
+def _add_model(manifest, model_name, like_model_name):
+    node_info = copy.deepcopy(manifest['nodes'][f'model.dwh.{like_model_name}'])
+    for field in ('path', 'original_file_path'):
+        node_info[field] = node_info[field].replace(f'{like_model_name}.sql', f'{model_name}.sql')
+    node_info['name'] = model_name
+    node_info['unique_id'] = f'model.dwh.{model_name}'
+    node_info['fqn'] = node_info['fqn'][:-1] + [model_name]
+    manifest['nodes'][node_info['unique_id']] = node_info
+
+
+@pytest.fixture
+def build_graphs(dbt_manifest, dbt_profiles, get_config, mock_node_is_etl_service):
+    def _build_graphs(fixture_name, change_manifest):
+        with dbt_manifest(fixture_name) as target_path, dbt_profiles() as (profiles, profile_name):
+            config = get_config(target_path)
+            previous_manifest = load_manifest(target_path / 'manifest.json')
+
+        manifest = copy.deepcopy(previous_manifest)
+        change_manifest(manifest)
+
+        previous_graph = DbtAfGraph.from_manifest(previous_manifest, profiles, profile_name, config=config)
+        previous_components = list(previous_graph.nodes)
+        graph = rebuild_graph(
+            previous_graph,
+            ManifestFingerprints.from_manifest(previous_manifest),
+            ManifestFingerprints.from_manifest(manifest),
+            manifest,
+            profiles,
+            profile_name,
+            config=config,
+        )
+        full_graph = DbtAfGraph.from_manifest(manifest, profiles, profile_name, config=config)
+
+        return previous_components, graph, full_graph
+
+    return _build_graphs
+
+
+@pytest.mark.parametrize(
+    'change_manifest, affected_domains',
+    [
+        (lambda manifest: _set_schedule(manifest, 'c1', '@hourly'), {'c'}),
+        (lambda manifest: _set_schedule(manifest, 'b2', '@hourly'), {'b', 'c'}),
+        (lambda manifest: _change_code(manifest, 'a1'), {'a'}),
+        (lambda manifest: _remove_model(manifest, 'c1'), {'c'}),
+        (lambda manifest: _add_model(manifest, 'c2', 'c1'), {'c'}),
+    ],
+)
+def test_incremental_rebuild_equals_full_build(
+    build_graphs,
+    change_manifest,
+    affected_domains,
+    mock_init_airflow_environment,
+    mock_mcd_callbacks,
+):
+    from dbt_af.dags import dbt_main_dags
+
+    previous_components, graph, full_graph = build_graphs('sequential_domains', change_manifest)
+
+    reused_components = [component for component in graph.nodes if any(component is c for c in previous_components)]
+    assert {component.domain_dag.domain_name for component in reused_components}.isdisjoint(affected_domains)
+    assert {component.domain_dag.domain_name for component in graph.nodes} - affected_domains == {
+        component.domain_dag.domain_name for component in reused_components
+    }
+
+    assert _dags_structure(dbt_main_dags(graph)) == _dags_structure(dbt_main_dags(full_graph))
+
+
+def test_incremental_rebuild_with_tests(build_graphs, mock_init_airflow_environment, mock_mcd_callbacks):
+    from dbt_af.dags import dbt_main_dags
+
+    _, graph, full_graph = build_graphs(
+        'domain_depends_on_another_with_test',
+        lambda manifest: _set_schedule(manifest, 'a1', '@hourly'),
+    )
+
+    assert _dags_structure(dbt_main_dags(graph)) == _dags_structure(dbt_main_dags(full_graph))
+
+
+def test_compile_dbt_af_dags_rebuilds_graph_incrementally(
+    dbt_manifest,
+    get_config,
+    tmp_path,
+    mock_init_airflow_environment,
+    mock_mcd_callbacks,
+):
+    from dbt_af.dags import compile_dbt_af_dags
+
+    with dbt_manifest('sequential_domains') as target_path:
+        config = attrs.evolve(get_config(target_path), graph_cache=GraphCacheConfig(cache_dir=tmp_path / 'cache'))
+        manifest_path = target_path / 'manifest.json'
+        compile_dbt_af_dags(str(manifest_path), config=config)
+
+        with open(manifest_path) as fin:
+            manifest = json.load(fin)
+        _set_schedule(manifest, 'c1', '@hourly')
+        with open(manifest_path, 'w') as fout:
+            json.dump(manifest, fout)
+
+        with patch.object(DbtAfGraph, 'from_manifest', side_effect=AssertionError('graph must be rebuilt')):
+            dags = compile_dbt_af_dags(str(manifest_path), config=config)
+        full_dags = compile_dbt_af_dags(str(manifest_path), config=attrs.evolve(config, graph_cache=None))
+
+    assert 'c__hourly' in dags
+    assert len(list(config.graph_cache.cache_dir.glob('*.graph'))) == 2
+    assert _dags_structure(dags) == _dags_structure(full_dags)
@@ -0,0 +1,107 @@
+import types
+
+import pendulum
+import pytest
+from airflow.models.dag import DAG
+from airflow.serialization.serialized_objects import SerializedDAG
+from airflow.utils.task_group import TaskGroup
+
+from dbt_af.builder.dag_materializer import DagMaterializer
+from dbt_af.builder.dbt_af_builder import DbtAfGraph, plan_dags
+from dbt_af.common.scheduling import EScheduleTag
+from dbt_af.operators.run import DbtRun, DbtSnapshot, DbtTest
+from dbt_af.parser.dbt_manifest_loader import load_manifest
+
+
+def _operator_state(operator):
+    """
+    Attributes of the operator in a comparable form: airflow objects are replaced with their ids and functions (that
+    are created for every DAG) with their names.
+    """
+
+    def _comparable(value):
+        if isinstance(value, (DAG, TaskGroup)) or type(value).__name__ == 'weakproxy':
+            return value.dag_id if isinstance(value, DAG) else value.group_id
+        if isinstance(value, dict):
+            return {key: _comparable(item) for key, item in value.items()}
+        if isinstance(value, types.FunctionType):
+            return value.__qualname__
+        if type(value).__module__.startswith('airflow.task.priority_strategy'):
+            return type(value)
+        return value
+
+    return {name: _comparable(value) for name, value in operator.__dict__.items() if name != '_log'}
+
+
+def _create_in_dag(operator, kwargs, stamp: bool, in_group: bool):
+    with DAG('prototypes', start_date=pendulum.datetime(2024, 1, 1), schedule=None) as dag:
+        group = TaskGroup('group') if in_group else None
+        prototype = operator(task_id='a', model_name='a', task_group=group, **kwargs)
+        if stamp:
+            return dag, prototype, prototype.stamp('b', 'b', group)
+        return dag, prototype, operator(task_id='b', model_name='b', task_group=group, **kwargs)
+
+
+@pytest.mark.parametrize(
+    'operator, kwargs',
+    [
+        (DbtRun, {'is_dataset_enable': True, 'model_type': 'sql', 'env': {'A': 'a'}, 'target_environment': 'dev'}),
+        (
+            DbtRun,
+            {
+                'schedule_tag': EScheduleTag.hourly(),
+                'overlap': True,
+                'max_active_tis_per_dag': 4,
+                'target_environment': 'dev',
+            },
+        ),
+        (DbtSnapshot, {'target_environment': 'dev'}),
+        (DbtTest, {'schedule_tag': EScheduleTag.daily()}),
+    ],
+)
+@pytest.mark.parametrize('in_group', [False, True])
+def test_stamped_operator_is_the_same_as_created(get_config, tmp_path, operator, kwargs, in_group):
+    kwargs = {'dbt_af_config': get_config(tmp_path), **kwargs}
+    dag, prototype, stamped = _create_in_dag(operator, kwargs, stamp=True, in_group=in_group)
+    _, _, created = _create_in_dag(operator, kwargs, stamp=False, in_group=in_group)
+
+    assert _operator_state(stamped) == _operator_state(created)
+    assert dag.get_task('group.b' if in_group else 'b') is stamped
+    assert stamped.bash_options is not prototype.bash_options
+    assert prototype.bash_options['--select'] == 'a.sql' if kwargs.get('model_type') else 'a'
+
+
+@pytest.mark.parametrize(
+    'fixture_name',
+    [
+        'two_tasks_depend_on_two_w_snapshot',
+        'hourly_task_with_tests',
+        'domain_w_redundant_dependencies',
+        'domain_w_enable_disable_models',
+        'two_domains_with_diff_scheduling_and_shifts',
+        'domain_model_w_maintenance',
+    ],
+)
+def test_dags_w_stamped_operators_are_the_same(
+    dbt_manifest,
+    dbt_profiles,
+    get_config,
+    fixture_name,
+    mock_node_is_etl_service,
+    mock_init_airflow_environment,
+):
+    with dbt_manifest(fixture_name) as target_path, dbt_profiles() as (profiles, profile_name):
+        config = get_config(target_path)
+        manifest = load_manifest(target_path / 'manifest.json')
+
+    graph = DbtAfGraph.from_manifest(manifest, profiles, profile_name, config=config)
+    for plan in plan_dags(graph).values():
+        dag = DagMaterializer(config, dag_callbacks={}, task_callbacks={}).materialize(plan)
+        expected_dag = DagMaterializer(config, dag_callbacks={}, task_callbacks={}, use_prototypes=False).materialize(
+            plan
+        )
+
+        assert SerializedDAG.to_dict(dag) == SerializedDAG.to_dict(expected_dag)
+        assert list(dag.task_dict) == list(expected_dag.task_dict)
+        for task_id, task in dag.task_dict.items():
+            assert _operator_state(task) == _operator_state(expected_dag.task_dict[task_id])
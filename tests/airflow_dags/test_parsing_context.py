@@ -0,0 +1,41 @@
+import attrs
+import pytest
+from airflow.serialization.serialized_objects import SerializedBaseOperator
+from airflow.utils.dag_parsing_context import _airflow_parsing_context_manager
+
+from dbt_af.conf import GraphCacheConfig
+
+
+def _serialized_task(task):
+    serialized = SerializedBaseOperator.serialize_operator(task)
+    return serialized, sorted(task.upstream_task_ids), sorted(task.downstream_task_ids)
+
+
+@pytest.mark.parametrize('with_graph_cache', [False, True])
+def test_compile_dbt_af_dags_in_parsing_context(
+    dbt_manifest,
+    get_config,
+    tmp_path,
+    with_graph_cache,
+    mock_init_airflow_environment,
+    mock_mcd_callbacks,
+):
+    from dbt_af.dags import compile_dbt_af_dags
+
+    with dbt_manifest('domain_depends_on_another_with_test') as target_path:
+        config = get_config(target_path)
+        if with_graph_cache:
+            config = attrs.evolve(config, graph_cache=GraphCacheConfig(cache_dir=tmp_path / 'cache'))
+        manifest_path = str(target_path / 'manifest.json')
+
+        full_dags = compile_dbt_af_dags(manifest_path, config=config)
+        for dag_id, full_dag in full_dags.items():
+            for task_id in full_dag.task_ids:
+                with _airflow_parsing_context_manager(dag_id=dag_id, task_id=task_id):
+                    dags = compile_dbt_af_dags(manifest_path, config=config)
+
+                assert list(dags) == [dag_id]
+                assert _serialized_task(dags[dag_id].get_task(task_id)) == _serialized_task(full_dag.get_task(task_id))
+
+        with _airflow_parsing_context_manager(dag_id='unknown__daily', task_id='unknown'):
+            assert compile_dbt_af_dags(manifest_path, config=config) == {}
@@ -0,0 +1,125 @@
+import importlib.util
+import json
+import sys
+import types
+from unittest.mock import patch
+
+import attrs
+import pytest
+from airflow.serialization.serialized_objects import SerializedDAG
+
+from dbt_af.builder.dag_codegen import GENERATED_MODULE_HEADER, DagModuleGenerator, write_dag_modules
+from dbt_af.builder.dbt_af_builder import DbtAfGraph, plan_dags
+from dbt_af.common import cron
+from dbt_af.common.scheduling import BaseScheduleTag
+from dbt_af.conf import BackfillConfig
+from dbt_af.conf.config import ModelDependenciesSection
+from dbt_af.parser.dbt_manifest_loader import load_manifest
+
+CONFIG_MODULE = 'dbt_af_static_dags_test_config'
+
+
+def _normalize(value):
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items() if key != 'fileloc'}
+    if isinstance(value, list):
+        return sorted((_normalize(item) for item in value), key=lambda item: json.dumps(item, sort_keys=True))
+    return value
+
+
+def _serialized(dag):
+    return _normalize(SerializedDAG.to_dict(dag))
+
+
+def _load_module(path):
+    spec = importlib.util.spec_from_file_location(f'dbt_af_static_dag_{path.stem}', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize(
+    'fixture_name, config_options',
+    [
+        ('sequential_domains', {}),
+        ('domain_depends_on_another_with_multischeduling', {}),
+        ('two_domains_with_diff_scheduling_and_shifts', {}),
+        ('domain_w_enable_disable_models', {}),
+        ('domain_w_source_freshness', {}),
+        ('domain_model_w_maintenance', {}),
+        ('domain_w_task_in_kubernetes', {'with_k8s': True}),
+        ('domain_w_task_in_venv', {}),
+        ('task_with_tableau_integration', {'with_tableau': True}),
+        ('domain_w_redundant_dependencies', {'reduce_transitive_edges': True}),
+        ('sequential_domains', {'backfill_mode': 'on_demand'}),
+    ],
+)
+def test_static_dags_equal_compiled_dags(
+    dbt_manifest,
+    dbt_profiles,
+    get_config,
+    fixture_name,
+    config_options,
+    tmp_path,
+    monkeypatch,
+    mock_node_is_etl_service,
+    mock_init_airflow_environment,
+    mock_mcd_callbacks,
+):
+    from dbt_af.dags import dbt_main_dags
+
+    with dbt_manifest(fixture_name) as target_path, dbt_profiles() as (profiles, profile_name):
+        config_options = dict(config_options)
+        model_dependencies = ModelDependenciesSection(
+            reduce_transitive_edges=config_options.pop('reduce_transitive_edges', False)
+        )
+        backfill = BackfillConfig(mode=config_options.pop('backfill_mode', 'scheduled'))
+        config = attrs.evolve(
+            get_config(target_path, **config_options), model_dependencies=model_dependencies, backfill=backfill
+        )
+        manifest = load_manifest(target_path / 'manifest.json')
+
+    config_module = types.ModuleType(CONFIG_MODULE)
+    config_module.config = config
+    monkeypatch.setitem(sys.modules, CONFIG_MODULE, config_module)
+
+    graph = DbtAfGraph.from_manifest(manifest, profiles, profile_name, config=config)
+    generator = DagModuleGenerator(config, f'{CONFIG_MODULE}:config')
+    modules = {dag_id: generator.generate(plan) for dag_id, plan in plan_dags(graph).items()}
+    write_dag_modules(modules, tmp_path)
+
+    compiled_dags = dbt_main_dags(graph)
+    assert sorted(path.stem for path in tmp_path.glob('*.py')) == sorted(compiled_dags)
+    # schedule tags are interned, so modules must create them from scratch to check that croniter isn't called
+    monkeypatch.setattr(BaseScheduleTag, '_registry', {})
+    for dag_id, dag in compiled_dags.items():
+        with (
+            patch.object(cron, 'croniter', wraps=cron.croniter) as croniter,
+            patch.object(cron, 'croniter_range', wraps=cron.croniter_range) as croniter_range,
+        ):
+            static_dag = _load_module(tmp_path / f'{dag_id}.py').dag
+        assert croniter.mock_calls == []
+        assert croniter_range.mock_calls == []
+        assert _serialized(static_dag) == _serialized(dag)
+
+    # the same graph built again generates the same modules
+    graph = DbtAfGraph.from_manifest(manifest, profiles, profile_name, config=config)
+    assert {dag_id: generator.generate(plan) for dag_id, plan in plan_dags(graph).items()} == modules
+
+
+def test_write_dag_modules_rewrites_only_changed_modules(tmp_path):
+    (tmp_path / 'user_dags.py').write_text('dags = {}\n')
+    write_dag_modules(
+        {'a__daily': f'{GENERATED_MODULE_HEADER}\na = 1\n', 'b__daily': f'{GENERATED_MODULE_HEADER}\n'}, tmp_path
+    )
+
+    changed = write_dag_modules({'a__daily': f'{GENERATED_MODULE_HEADER}\na = 2\n'}, tmp_path)
+
+    assert changed == [tmp_path / 'a__daily.py', tmp_path / 'b__daily.py']
+    assert sorted(path.name for path in tmp_path.glob('*.py')) == ['a__daily.py', 'user_dags.py']
+    assert write_dag_modules({'a__daily': f'{GENERATED_MODULE_HEADER}\na = 2\n'}, tmp_path) == []
+
+
+def test_config_ref_must_contain_attribute(get_config, tmp_path):
+    with pytest.raises(ValueError, match='module:attribute'):
+        DagModuleGenerator(get_config(tmp_path / 'target'), 'dags_config')
@@ -0,0 +1,100 @@
+import random
+from datetime import datetime, timedelta
+
+import pendulum
+import pytest
+from croniter import croniter, croniter_range
+
+from dbt_af.common.cron import CronExpression
+from dbt_af.common.scheduling import (
+    _DailyScheduleTag,
+    _Every15MinutesScheduleTag,
+    _HourlyScheduleTag,
+    _MonthlyScheduleTag,
+    _WeeklyScheduleTag,
+)
+
+SCHEDULE_TAGS = [
+    _Every15MinutesScheduleTag(),
+    _Every15MinutesScheduleTag(timedelta(minutes=7)),
+    _HourlyScheduleTag(),
+    _HourlyScheduleTag(timedelta(minutes=45)),
+    _DailyScheduleTag(),
+    _DailyScheduleTag(timedelta(hours=23, minutes=59)),
+    _WeeklyScheduleTag(),
+    _WeeklyScheduleTag(timedelta(days=3, hours=4, minutes=5)),
+    _WeeklyScheduleTag(timedelta(days=6, hours=23)),
+    _MonthlyScheduleTag(),
+    _MonthlyScheduleTag(timedelta(days=14, hours=7, minutes=30)),
+    _MonthlyScheduleTag(timedelta(days=27, hours=23)),
+]
+
+
+def _random_datetimes(n: int, seed: int) -> list[datetime]:
+    rnd = random.Random(seed)
+    dttms = []
+    for i in range(n):
+        dttm = datetime(1999, 1, 1) + timedelta(minutes=rnd.randrange(40 * 366 * 24 * 60))
+        if i % 3 == 1:
+            # ticks themselves and the moments right after them are the edge cases
+            dttm = croniter('*/15 * * * *', dttm).get_next(datetime)
+        if i % 5 == 2:
+            dttm += timedelta(seconds=rnd.randrange(60), microseconds=rnd.randrange(10**6))
+        if i % 4 == 3:
+            dttm = pendulum.instance(dttm, tz='UTC')
+        dttms.append(dttm)
+    return dttms
+
+
+@pytest.mark.parametrize('schedule_tag', SCHEDULE_TAGS, ids=lambda tag: tag.af_repr())
+def test_ticks_are_the_same_as_of_croniter(schedule_tag):
+    cron = schedule_tag.cron_expression()
+    assert cron._calendar is not None
+
+    for dttm in _random_datetimes(200, seed=len(cron.raw_cron_expression)):
+        expected_next = croniter(cron.raw_cron_expression, dttm).get_next(datetime)
+        expected_prev = croniter(cron.raw_cron_expression, dttm).get_prev(datetime)
+        assert cron.next_run(dttm) == expected_next
+        assert cron.prev_run(dttm) == expected_prev
+        assert cron.next_run(dttm).tzinfo == expected_next.tzinfo
+        assert type(cron.next_run(dttm)) is type(expected_next)
+
+        for stop in (dttm + timedelta(hours=5), dttm + (expected_next - expected_prev) * 3, expected_next):
+            assert cron.runs_between(dttm, stop) == list(
+                croniter_range(dttm, stop, cron.raw_cron_expression, ret_type=datetime)
+            )
+
+
+def test_other_cron_expressions_go_through_croniter():
+    cron = CronExpression('0 0 1,15 * *')
+    assert cron._calendar is None
+
+    dttm = datetime(2024, 2, 10, 12)
+    assert cron.next_run(dttm) == datetime(2024, 2, 15)
+    assert cron.prev_run(dttm) == datetime(2024, 2, 1)
+    assert cron.runs_between(dttm, datetime(2024, 3, 15)) == [
+        datetime(2024, 2, 15),
+        datetime(2024, 3, 1),
+        datetime(2024, 3, 15),
+    ]
+
+
+def test_non_utc_datetimes_go_through_croniter():
+    cron = _DailyScheduleTag(timedelta(hours=2, minutes=30)).cron_expression()
+    # 2:30 doesn't exist in Europe/Amsterdam on 2024-03-31
+    dttm = pendulum.datetime(2024, 3, 30, 12, tz='Europe/Amsterdam')
+
+    assert cron.next_run(dttm) == croniter(cron.raw_cron_expression, dttm).get_next(datetime)
+    assert cron.prev_run(dttm) == croniter(cron.raw_cron_expression, dttm).get_prev(datetime)
+
+
+def test_monthly_ticks_skip_short_months():
+    cron = CronExpression('0 0 31 * *')
+
+    assert cron.next_run(datetime(2024, 1, 31)) == datetime(2024, 3, 31)
+    assert cron.prev_run(datetime(2024, 3, 31)) == datetime(2024, 1, 31)
+    assert cron.runs_between(datetime(2024, 1, 1), datetime(2024, 6, 1)) == [
+        datetime(2024, 1, 31),
+        datetime(2024, 3, 31),
+        datetime(2024, 5, 31),
+    ]
@@ -0,0 +1,148 @@
+import pickle
+
+import attrs
+import pytest
+
+from dbt_af.common.scheduling import EScheduleTag
+from dbt_af.conf import DbtDefaultTargetsConfig
+from dbt_af.parser.dbt_compact_node import CompactDbtNode, NodeDependenciesConfig
+from dbt_af.parser.dbt_node_model import DbtModelMaintenanceType, DbtNode, WaitPolicy
+
+
+@pytest.fixture
+def default_dbt_targets():
+    return DbtDefaultTargetsConfig(default_target='default', default_for_tests_target='tests_target')
+
+
+@pytest.fixture
+def dbt_node_data():
+    return {
+        'database': 'analytics',
+        'schema': 'marts',
+        'name': 'fact_orders',
+        'resource_type': 'model',
+        'package_name': 'my_project',
+        'path': 'domain/marts/fact_orders.sql',
+        'original_file_path': 'models/domain/marts/fact_orders.sql',
+        'unique_id': 'model.my_project.fact_orders',
+        'fqn': ['my_project', 'domain', 'marts', 'fact_orders'],
+        'alias': 'fact_orders',
+        'checksum': {'name': 'sha256', 'checksum': 'abc123'},
+        'config': {
+            'enabled': True,
+            'schema': 'marts',
+            'tags': [],
+            'meta': {},
+            'materialized': 'incremental',
+            'partition_by': 'event_dt',
+            'airflow_parallelism': 4,
+            'schedule': '@hourly',
+            'dependencies': {'stg_orders': {'wait_policy': 'all'}},
+            'env': {'KEY': 'value'},
+            'enable_from_dttm': '2024-01-01T00:00:00',
+            'maintenance': {'persist_docs': True, 'vacuum_table': True},
+            'tableau_refresh_tasks': [
+                {'resource_name': 'dashboard', 'project_name': 'main', 'resource_type': 'workbook'},
+            ],
+            'py_cluster': 'py_cluster',
+            'sql_cluster': 'sql_cluster',
+            'daily_sql_cluster': 'daily_sql_cluster',
+            'bf_cluster': 'bf_cluster',
+        },
+        'tags': [],
+        'raw_code': 'SELECT * FROM staging.orders',
+        'language': 'sql',
+        'depends_on': {
+            'nodes': ['model.my_project.stg_orders', 'source.my_project.raw.orders'],
+            'macros': ['macro.my_project.some_macro'],
+        },
+    }
+
+
+@pytest.fixture
+def dbt_test_node_data(dbt_node_data):
+    return dbt_node_data | {
+        'resource_type': 'test',
+        'unique_id': 'test.my_project.not_null_fact_orders_id.5f4a3a',
+        'fqn': ['my_project', 'dbt', 'models', 'domain', 'marts', 'not_null_fact_orders_id'],
+        'tags': ['@medium'],
+        'config': dbt_node_data['config'] | {'materialized': 'test'},
+        'depends_on': {'nodes': ['model.my_project.fact_orders'], 'macros': []},
+    }
+
+
+def test_compact_node_keeps_dbt_node_properties(dbt_node_data, default_dbt_targets):
+    dbt_node = DbtNode(**dbt_node_data)
+    node = CompactDbtNode.from_dbt_node(dbt_node)
+
+    assert node == dbt_node
+    assert node == dbt_node.unique_id
+    assert hash(node) == hash(dbt_node)
+    assert node.resource_name == dbt_node.resource_name == 'fact_orders'
+    assert node.domain == dbt_node.domain == 'domain'
+    assert node.depends_on == ('model.my_project.stg_orders',)
+    assert node.depends_on_sources == ('source.my_project.raw.orders',)
+    assert node.materialized == 'incremental'
+    assert node.model_type == 'sql'
+    assert node.test_type is None
+    assert node.is_model() and not node.is_test() and not node.is_large_test()
+    assert node.original_file_path_without_extension == dbt_node.original_file_path_without_extension
+    assert node.get_airflow_parallelism() == dbt_node.get_airflow_parallelism() == 4
+    assert node.get_required_maintenance_types() == [
+        DbtModelMaintenanceType.PERSIST_DOCS,
+        DbtModelMaintenanceType.VACUUM_TABLE,
+    ]
+    assert node.target_environment(default_dbt_targets) == dbt_node.target_environment(default_dbt_targets)
+
+    assert node.config.schedule == EScheduleTag.hourly()
+    assert node.config.env == {'KEY': 'value'}
+    assert node.config.bf_cluster == 'bf_cluster'
+    assert node.config.enable_from_dttm == '2024-01-01T00:00:00'
+    assert node.config.disable_from_dttm == ''
+    assert node.config.tableau_refresh_tasks == tuple(dbt_node.config.tableau_refresh_tasks)
+
+
+def test_compact_node_target_environment(dbt_node_data, default_dbt_targets):
+    daily_node_data = dbt_node_data | {'config': dbt_node_data['config'] | {'schedule': '@daily'}}
+    dbt_target_node_data = dbt_node_data | {'config': dbt_node_data['config'] | {'dbt_target': 'custom'}}
+    py_node_data = dbt_node_data | {'path': 'domain/marts/fact_orders.py'}
+
+    for node_data in (dbt_node_data, daily_node_data, dbt_target_node_data, py_node_data):
+        dbt_node = DbtNode(**node_data)
+        node = CompactDbtNode.from_dbt_node(dbt_node)
+        assert node.target_environment(default_dbt_targets) == dbt_node.target_environment(default_dbt_targets)
+
+
+def test_compact_test_node(dbt_test_node_data, default_dbt_targets):
+    node = CompactDbtNode.from_dbt_node(DbtNode(**dbt_test_node_data))
+
+    assert node.is_test()
+    assert node.is_medium_test()
+    assert not node.is_small_test() and not node.is_large_test()
+    assert node.resource_name == 'not_null_fact_orders_id'
+    assert node.domain == 'domain'
+    assert node.materialized == ''
+    assert node.target_environment(default_dbt_targets) == 'tests_target'
+
+
+def test_compact_node_dependencies_config(dbt_node_data):
+    node = CompactDbtNode.from_dbt_node(DbtNode(**dbt_node_data))
+
+    assert isinstance(node.config.dependencies, NodeDependenciesConfig)
+    assert node.config.dependencies['stg_orders'].wait_policy == WaitPolicy.all
+    assert not node.config.dependencies['unknown'].skip
+    assert node.config.dependencies['unknown'].wait_policy == WaitPolicy.last
+    # lookups of missing dependencies must not grow the mapping
+    assert set(node.config.dependencies) == {'stg_orders'}
+
+
+def test_compact_node_is_frozen_and_picklable(dbt_node_data):
+    node = CompactDbtNode.from_dbt_node(DbtNode(**dbt_node_data))
+
+    assert not hasattr(node, '__dict__')
+    with pytest.raises(attrs.exceptions.FrozenInstanceError):
+        node.path = 'other'
+
+    restored = pickle.loads(pickle.dumps(node))
+    assert restored == node
+    assert restored.config == node.config
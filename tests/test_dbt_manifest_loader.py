@@ -0,0 +1,161 @@
+import json
+
+import pytest
+
+from dbt_af.parser.dbt_manifest_loader import (
+    DBT_NODE_FIELDS,
+    DBT_SOURCE_FIELDS,
+    is_ijson_installed,
+    load_manifest,
+    slim_manifest,
+)
+from dbt_af.parser.dbt_node_model import DbtNode
+from dbt_af.parser.dbt_source_model import DbtSource
+
+
+@pytest.fixture
+def node_data():
+    return {
+        'database': 'analytics',
+        'schema': 'marts',
+        'name': 'fact_orders',
+        'resource_type': 'model',
+        'package_name': 'my_project',
+        'path': 'domain/marts/fact_orders.sql',
+        'original_file_path': 'models/domain/marts/fact_orders.sql',
+        'unique_id': 'model.my_project.fact_orders',
+        'fqn': ['my_project', 'domain', 'marts', 'fact_orders'],
+        'alias': 'fact_orders',
+        'checksum': {'name': 'sha256', 'checksum': 'abc123'},
+        'config': {
+            'enabled': True,
+            'schema': 'marts',
+            'tags': [],
+            'meta': {},
+            'materialized': 'incremental',
+            'schedule': '@hourly',
+            'airflow_parallelism': 2,
+            'dependencies': {'stg_orders': {'skip': True}},
+            'py_cluster': 'cluster1',
+            'sql_cluster': 'cluster2',
+            'daily_sql_cluster': 'cluster3',
+            'bf_cluster': 'cluster4',
+        },
+        'tags': ['critical'],
+        'description': 'Orders fact table',
+        'columns': {'order_id': {'name': 'order_id', 'description': 'Order ID', 'data_type': 'bigint'}},
+        'meta': {'refresh_frequency': 'daily'},
+        'docs': {'show': True},
+        'unrendered_config': {'materialized': 'incremental'},
+        'created_at': 1234567890.5,
+        'relation_name': 'analytics.marts.fact_orders',
+        'raw_code': 'SELECT * FROM staging.orders',
+        'language': 'sql',
+        'refs': [{'name': 'stg_orders', 'package': None, 'version': None}],
+        'depends_on': {'nodes': ['model.my_project.stg_orders'], 'macros': []},
+        'access': 'protected',
+        'version': None,
+        'latest_version': None,
+    }
+
+
+@pytest.fixture
+def source_data():
+    return {
+        'database': 'analytics_db',
+        'schema': 'raw_data',
+        'name': 'users_table',
+        'resource_type': 'source',
+        'package_name': 'my_project',
+        'path': 'models/staging/sources.yml',
+        'original_file_path': 'models/domain/staging/sources.yml',
+        'unique_id': 'source.my_project.raw_data.users_table',
+        'fqn': ['my_project', 'domain', 'staging', 'raw_data', 'users_table'],
+        'source_name': 'raw_data',
+        'source_description': 'Raw data from upstream systems',
+        'loader': 'airflow',
+        'identifier': 'users',
+        'quoting': {'database': False, 'schema': False, 'identifier': False},
+        'loaded_at_field': 'loaded_timestamp',
+        'freshness': {'warn_after': {'count': 5, 'period': 'hour'}, 'error_after': {'count': 10, 'period': 'hour'}},
+        'description': 'Users table from production database',
+        'columns': {'id': {'name': 'id', 'description': 'User ID'}},
+        'meta': {'owner': 'data_team'},
+        'source_meta': {},
+        'tags': ['pii'],
+        'config': {'enabled': True},
+        'unrendered_config': {},
+        'relation_name': 'analytics_db.raw_data.users',
+        'created_at': 1234567890.0,
+    }
+
+
+@pytest.fixture
+def raw_manifest(node_data, source_data):
+    return {
+        'metadata': {'dbt_version': '1.10.0'},
+        'nodes': {node_data['unique_id']: node_data},
+        'sources': {source_data['unique_id']: source_data},
+        'macros': {'macro.my_project.some_macro': {'macro_sql': '{% macro some_macro() %}{% endmacro %}'}},
+        'docs': {},
+        'exposures': {},
+        'parent_map': {},
+        'child_map': {},
+    }
+
+
+@pytest.fixture
+def manifest_path(tmp_path, raw_manifest):
+    path = tmp_path / 'manifest.json'
+    path.write_text(json.dumps(raw_manifest))
+    return path
+
+
+def test_slim_manifest_drops_unused_sections_and_fields(raw_manifest, node_data, source_data):
+    manifest = slim_manifest(raw_manifest)
+
+    assert set(manifest) == {'nodes', 'sources'}
+    slim_node = manifest['nodes'][node_data['unique_id']]
+    assert set(slim_node) <= DBT_NODE_FIELDS
+    assert 'raw_code' not in slim_node
+    assert 'columns' not in slim_node
+    assert slim_node['config'] == node_data['config']
+
+    slim_source = manifest['sources'][source_data['unique_id']]
+    assert set(slim_source) <= DBT_SOURCE_FIELDS
+    assert slim_source['freshness'] == source_data['freshness']
+
+
+def test_load_manifest_in_memory(manifest_path, raw_manifest):
+    assert load_manifest(manifest_path, streaming=False) == slim_manifest(raw_manifest)
+
+
+@pytest.mark.skipif(not is_ijson_installed(), reason='ijson is not installed')
+def test_load_manifest_streaming_equals_in_memory(manifest_path):
+    streamed = load_manifest(manifest_path, streaming=True)
+
+    assert streamed == load_manifest(manifest_path, streaming=False)
+    assert isinstance(streamed['nodes']['model.my_project.fact_orders']['config']['airflow_parallelism'], int)
+
+
+def test_load_manifest_streaming_without_ijson(manifest_path, monkeypatch):
+    monkeypatch.setattr('dbt_af.parser.dbt_manifest_loader.is_ijson_installed', lambda: False)
+
+    with pytest.raises(ImportError):
+        load_manifest(manifest_path, streaming=True)
+    assert load_manifest(manifest_path) == load_manifest(manifest_path, streaming=False)
+
+
+def test_models_from_slim_manifest(manifest_path, node_data, source_data):
+    manifest = load_manifest(manifest_path)
+
+    node = DbtNode(**manifest['nodes'][node_data['unique_id']])
+    full_node = DbtNode(**node_data)
+    assert node == full_node
+    assert node.config == full_node.config
+    assert node.depends_on == full_node.depends_on
+    assert node.raw_code == ''
+
+    source = DbtSource(**manifest['sources'][source_data['unique_id']])
+    assert source.unique_id == source_data['unique_id']
+    assert source.freshness == DbtSource(**source_data).freshness
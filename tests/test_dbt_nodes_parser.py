@@ -0,0 +1,157 @@
+from unittest.mock import patch
+
+import attrs
+import pytest
+
+from dbt_af.conf import DbtDefaultTargetsConfig, ParallelParsingConfig
+from dbt_af.parser.dbt_nodes_parser import DbtNodeConfigsCache, parse_dbt_nodes, parse_dbt_nodes_chunk
+from dbt_af.parser.dbt_profiles import Profile
+
+
+@pytest.fixture
+def project_profile():
+    target = {'type': 'postgres', 'schema': 'dwh'}
+    return Profile(target='dev', outputs={name: target for name in ('dev', 'sql', 'daily_sql', 'py', 'tests')})
+
+
+@pytest.fixture
+def default_dbt_targets():
+    return DbtDefaultTargetsConfig(default_target='dev', default_for_tests_target='tests')
+
+
+def _node_info(n_node: int, etl_service: str) -> dict:
+    is_test = n_node % 3 == 0
+    resource_type = 'test' if is_test else 'model'
+    name = f'model_{n_node}'
+    domain = f'domain_{n_node % 4}'
+    return {
+        'schema': 'dwh',
+        'name': name,
+        'resource_type': resource_type,
+        'package_name': 'dwh',
+        'path': f'{domain}/ods/{name}.sql',
+        'original_file_path': f'{etl_service}/dbt/models/{domain}/ods/{name}.sql',
+        'unique_id': f'{resource_type}.dwh.{name}' + ('.0a1b2c' if is_test else ''),
+        'fqn': ['dwh', 'dbt', 'models', domain, 'ods', name] if is_test else ['dwh', domain, 'ods', name],
+        'checksum': {'name': 'sha256', 'checksum': str(n_node)},
+        'config': {
+            'enabled': True,
+            'schema': 'dwh',
+            'tags': [],
+            'meta': {},
+            'materialized': 'test' if is_test else 'table',
+            'schedule': '@hourly' if n_node % 2 else '@daily',
+            'py_cluster': 'py',
+            'sql_cluster': 'sql',
+            'daily_sql_cluster': 'daily_sql',
+            'bf_cluster': 'py',
+        },
+        'tags': [],
+        'depends_on': {'nodes': [f'model.dwh.model_{n_node - 1}'] if n_node else [], 'macros': []},
+    }
+
+
+@pytest.fixture
+def manifest_nodes():
+    nodes_info = [_node_info(n_node, 'etl_service' if n_node % 5 else 'other_service') for n_node in range(50)]
+    return {node_info['unique_id']: node_info for node_info in nodes_info}
+
+
+def _as_dicts(nodes):
+    return [attrs.asdict(node, recurse=False) for node in nodes]
+
+
+@pytest.mark.parametrize('etl_service_name', [None, 'etl_service'])
+def test_parallel_parsing_equals_serial(manifest_nodes, project_profile, default_dbt_targets, etl_service_name):
+    serial_nodes = parse_dbt_nodes(manifest_nodes, project_profile, default_dbt_targets, etl_service_name)
+    parallel_nodes = parse_dbt_nodes(
+        manifest_nodes,
+        project_profile,
+        default_dbt_targets,
+        etl_service_name,
+        parallel_parsing=ParallelParsingConfig(min_nodes=0, chunk_size=7, max_workers=2),
+    )
+
+    assert [node.unique_id for node in parallel_nodes] == [
+        unique_id
+        for unique_id, node_info in manifest_nodes.items()
+        if etl_service_name is None or node_info['original_file_path'].startswith(etl_service_name)
+    ]
+    assert _as_dicts(parallel_nodes) == _as_dicts(serial_nodes)
+
+
+def test_small_manifest_is_parsed_serially(manifest_nodes, project_profile, default_dbt_targets):
+    with patch(
+        'dbt_af.parser.dbt_nodes_parser.ProcessPoolExecutor',
+        side_effect=AssertionError('process pool must not be used'),
+    ):
+        nodes = parse_dbt_nodes(
+            manifest_nodes,
+            project_profile,
+            default_dbt_targets,
+            parallel_parsing=ParallelParsingConfig(min_nodes=len(manifest_nodes) + 1),
+        )
+
+    assert len(nodes) == len(manifest_nodes)
+
+
+def test_parallel_parsing_propagates_validation_errors(manifest_nodes, project_profile, default_dbt_targets):
+    broken_node = next(iter(manifest_nodes.values()))
+    del broken_node['config']
+
+    with pytest.raises(Exception, match='config'):
+        parse_dbt_nodes(
+            manifest_nodes,
+            project_profile,
+            default_dbt_targets,
+            parallel_parsing=ParallelParsingConfig(min_nodes=0, chunk_size=10, max_workers=2),
+        )
+
+
+def test_nodes_out_of_etl_service_are_not_validated(manifest_nodes, project_profile, default_dbt_targets):
+    for node_info in manifest_nodes.values():
+        if node_info['original_file_path'].startswith('other_service'):
+            del node_info['config']
+    analysis_info = {'unique_id': 'analysis.dwh.some_analysis', 'resource_type': 'analysis'}
+    manifest_nodes[analysis_info['unique_id']] = analysis_info
+
+    nodes = parse_dbt_nodes(manifest_nodes, project_profile, default_dbt_targets, etl_service_name='etl_service')
+
+    assert len(nodes) == len(
+        [
+            node_info
+            for node_info in manifest_nodes.values()
+            if node_info.get('original_file_path', '').startswith('etl_')
+        ]
+    )
+
+
+def test_identical_configs_are_validated_once(manifest_nodes, project_profile, default_dbt_targets):
+    configs_cache = DbtNodeConfigsCache()
+    nodes = parse_dbt_nodes(manifest_nodes, project_profile, default_dbt_targets, configs_cache=configs_cache)
+    nodes_parsed_separately = [
+        node
+        for node_info in manifest_nodes.values()
+        for node in parse_dbt_nodes_chunk([node_info], project_profile, default_dbt_targets)
+    ]
+
+    # configs differ only by materialization and schedule
+    assert len(configs_cache) == 4
+    assert (configs_cache.hits, configs_cache.misses) == (len(manifest_nodes) - 4, 4)
+    assert configs_cache.hit_rate == (len(manifest_nodes) - 4) / len(manifest_nodes)
+    assert len({id(node.config) for node in nodes}) == 4
+    assert _as_dicts(nodes) == _as_dicts(nodes_parsed_separately)
+
+
+def test_parallel_parsing_collects_configs_cache_stats(manifest_nodes, project_profile, default_dbt_targets):
+    configs_cache = DbtNodeConfigsCache()
+    parse_dbt_nodes(
+        manifest_nodes,
+        project_profile,
+        default_dbt_targets,
+        parallel_parsing=ParallelParsingConfig(min_nodes=0, chunk_size=10, max_workers=2),
+        configs_cache=configs_cache,
+    )
+
+    assert configs_cache.hits + configs_cache.misses == len(manifest_nodes)
+    assert configs_cache.misses == 4 * 5
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+
+import pytest
+from airflow.models.baseoperator import BaseOperator
+
+from dbt_af.builder.dag_materializer import DBT_AF_OPERATORS, load_operator
+
+_DEFERRED_MODULES = ('dbt_af.operators.kubernetes_pod', 'dbt_af.operators.venv', 'dbt_af.operators.supplemental')
+
+
+def test_dags_module_does_not_import_operators_of_optional_targets():
+    result = subprocess.run(
+        [sys.executable, '-c', 'import sys, dbt_af.dags; print(*sys.modules)'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert set(result.stdout.split()).isdisjoint(_DEFERRED_MODULES)
+
+
+@pytest.mark.parametrize('kind', list(DBT_AF_OPERATORS))
+def test_load_operator(kind):
+    operator = load_operator(kind)
+
+    assert issubclass(operator, BaseOperator)
+    assert operator.__name__ == DBT_AF_OPERATORS[kind][1]
@@ -1,8 +1,12 @@
+import copy
 import datetime
+import pickle
+from unittest.mock import patch
 
 import pytest
 from freezegun import freeze_time
 
+from dbt_af.common.cron import CronExpression
 from dbt_af.common.scheduling import (
     BaseScheduleTag,
     EScheduleTag,
@@ -189,3 +193,49 @@ def test_base_schedule_name(schedule_tag, shift, base_name, full_name):
     schedule: BaseScheduleTag = EScheduleTag[schedule_tag](shift)  # noqa
     assert schedule.base_name == base_name
     assert schedule.name == full_name
+
+
+@pytest.mark.parametrize(
+    'schedule_tag, shift',
+    [
+        ('manual', None),
+        ('hourly', datetime.timedelta(minutes=22)),
+        ('daily', None),
+        ('daily', datetime.timedelta(hours=5)),
+        ('weekly', datetime.timedelta(days=2)),
+        ('monthly', datetime.timedelta(days=3)),
+    ],
+)
+def test_schedule_tags_are_interned(schedule_tag, shift):
+    schedule = EScheduleTag[schedule_tag](shift)
+
+    assert EScheduleTag[schedule_tag](shift) is schedule
+    assert EScheduleTag[schedule_tag](schedule.timeshift) is schedule
+    assert pickle.loads(pickle.dumps(schedule)) is schedule
+    assert copy.deepcopy(schedule) is schedule
+    with patch.object(CronExpression, 'distance_between_two_runs', side_effect=AssertionError('must be interned')):
+        assert EScheduleTag[schedule_tag](shift) is schedule
+
+
+def test_interned_schedule_tags_keep_comparison():
+    daily = EScheduleTag.daily()
+    shifted_daily = EScheduleTag.daily(datetime.timedelta(hours=5))
+
+    assert daily == shifted_daily
+    assert hash(daily) != hash(shifted_daily)
+    assert daily.af_repr() == '0 0 * * *'
+    assert shifted_daily.af_repr() == '0 5 * * *'
+    assert shifted_daily.cron_expression() == CronExpression('0 5 * * *')
+    assert EScheduleTag.daily(datetime.timedelta()) is daily
+    assert EScheduleTag.daily(datetime.timedelta(days=2)) is EScheduleTag.daily(
+        datetime.timedelta(hours=23, minutes=59)
+    )
+
+
+def test_schedule_tag_enum_members_are_hashable():
+    # interning applies only to schedule tags themselves, enum members are hashed by name as before
+    tags = {EScheduleTag.daily: 1}
+
+    assert tags[EScheduleTag.daily] == 1
+    assert EScheduleTag.daily in set(EScheduleTag)
+    assert hash(EScheduleTag.daily) == hash(EScheduleTag.daily.name)
@@ -1,9 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import pytest
 from dateutil.relativedelta import relativedelta
 from freezegun import freeze_time
 
+from dbt_af.common.af_scheduling_utils import ExecutionDateFnTable
 from dbt_af.common.scheduling import (
     _DailyScheduleTag,
     _HourlyScheduleTag,
@@ -486,3 +488,44 @@ def test_schedule_on_same_schedule(
         )
         == expected_wait_execution_date
     )
+
+
+def test_execution_date_fns_are_built_once():
+    table = ExecutionDateFnTable([_DailyScheduleTag(), _HourlyScheduleTag()])
+    fns = table.get(WaitPolicy.all, _HourlyScheduleTag(), _DailyScheduleTag())
+    assert len(fns) == 24
+    assert fns[5].keywords == {
+        'num_iter': 5,
+        'self_schedule': _DailyScheduleTag(),
+        'upstream_schedule': _HourlyScheduleTag(),
+    }
+    assert table.get(WaitPolicy.all, _HourlyScheduleTag(), _DailyScheduleTag()) is fns
+
+    # lookups of other schedule tags don't change functions that are already built
+    shifted_fns = table.get(WaitPolicy.all, _HourlyScheduleTag(timedelta(minutes=30)), _DailyScheduleTag())
+    assert shifted_fns[5].keywords['upstream_schedule'].timeshift == timedelta(minutes=30)
+    assert fns[5].keywords['upstream_schedule'].timeshift == timedelta(0)
+
+    with pytest.raises(TypeError):
+        table.get('unknown', _HourlyScheduleTag(), _DailyScheduleTag(timedelta(hours=1)))
+
+
+def test_execution_date_fns_lookups_from_threads():
+    table = ExecutionDateFnTable([])
+    schedule_tags = [_HourlyScheduleTag(timedelta(minutes=minutes)) for minutes in range(0, 60, 5)] + [
+        _DailyScheduleTag(timedelta(hours=hours)) for hours in range(0, 24, 4)
+    ]
+    keys = [
+        (wait_policy, upstream, downstream)
+        for wait_policy in WaitPolicy
+        for upstream in schedule_tags
+        for downstream in schedule_tags
+    ]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda key: table.get(*key), keys * 4))
+
+    for (wait_policy, upstream, downstream), fns in zip(keys * 4, results):
+        assert fns is table.get(wait_policy, upstream, downstream)
+        assert all(fn.keywords['upstream_schedule'] is upstream for fn in fns)
+        assert all(fn.keywords['self_schedule'] is downstream for fn in fns)